@@ -0,0 +1,134 @@
+# Japanese text corpora used by the benchmarks, both synthetic and based on the test data
+
+from random import Random
+from typing import Dict, List
+
+from definitions import TEST_DATA_PATH
+from src.downloader.models.DownloadedData import DownloadedData
+from src.utils.io_utils import load_serializable_object
+
+FILLER_SENTENCES = [
+    "日本の経済は長い間低迷していたが、近年は回復の兆しを見せている。",
+    "この地域では古くから農業が盛んで、特に米作りが有名である。",
+    "彼はその提案について慎重に検討したうえで、賛成の意を示した。",
+    "図書館には多くの利用者が訪れ、静かに本を読んでいた。",
+    "新しい技術の導入によって、作業の効率が大きく向上した。",
+    "祭りの当日は天気にも恵まれ、多くの観光客でにぎわった。"
+]
+
+ENTITY_SENTENCES = [
+    "会議は平成三一年四月三日の午後3時15分から始まる。",
+    "締め切りは2019-04-03の10:30です。",
+    "本社の住所は〒012‐2321、電話番号は03-1234-5678です。",
+    "来月1日に二二二の一二一二へ引っ越す予定だ。",
+    "昭和六十三年十二月三十一日、午前九時半に到着した。",
+    "お問い合わせは０１２０-１２３-４５６まで。",
+    "代金は２,000億５万円で、JPY47,176百万とも書かれた。",
+    "長男は十二歳、次男は５歳です。"
+]
+
+# Area codes of the phone numbers in the directory, with the number of digits of the exchange and the subscriber,
+# so that all numbers have the ten digits (eleven for mobile phones) of a valid Japanese phone number
+PHONE_NUMBER_FORMATS = [("03", 4, 4), ("06", 4, 4), ("045", 3, 4), ("0120", 3, 3), ("090", 4, 4)]
+
+
+def synthetic_corpus(number_of_characters: int, entity_density: float, seed: int = 0) -> str:
+    """
+    Creates a reproducible text of Japanese sentences where a share of the sentences contain entities
+    :param number_of_characters: Approximate length of the text
+    :param entity_density: Share of the sentences containing entities (dates, postal codes etc.), between 0 and 1
+    :param seed: Seed of the random generator
+    :return: The generated text
+    """
+    random = Random(seed)
+    sentences = []
+    length = 0
+    while length < number_of_characters:
+        if random.random() < entity_density:
+            sentence = random.choice(ENTITY_SENTENCES)
+        else:
+            sentence = random.choice(FILLER_SENTENCES)
+        sentences.append(sentence)
+        length = length + len(sentence)
+        if random.random() < 0.2:
+            sentences.append("\n")
+    return "".join(sentences)
+
+
+def directory_corpus(number_of_entries: int, seed: int = 0) -> str:
+    """
+    Creates a reproducible company directory, a text dense with addresses and phone numbers
+    :param number_of_entries: Number of companies in the directory
+    :param seed: Seed of the random generator
+    :return: The directory with one company per line
+    """
+    random = Random(seed)
+    lines = []
+    for index in range(number_of_entries):
+        area_code, exchange_digits, subscriber_digits = random.choice(PHONE_NUMBER_FORMATS)
+        number = f"{random.randint(2 * 10 ** (exchange_digits - 1), 10 ** exchange_digits - 1)}-" \
+                 f"{random.randint(0, 10 ** subscriber_digits - 1):0{subscriber_digits}d}"
+        lines.append(f"株式会社{index}　〒{random.randint(100, 999)}-{random.randint(1000, 9999)}　"
+                     f"東京都千代田区{random.randint(1, 9)}-{random.randint(1, 50)}　"
+                     f"電話 {area_code}-{number}　FAX ({area_code}){number}")
+    return "\n".join(lines)
+
+
+def fixture_corpus(number_of_repeats: int = 1) -> str:
+    """
+    Creates a text from the Wikipedia pages in the test data
+    :param number_of_repeats: Number of times the pages are repeated
+    :return: The pages separated by newlines
+    """
+    pages = load_serializable_object(TEST_DATA_PATH, "test_pages.json")
+    return "\n".join(page.data for page in pages) * number_of_repeats
+
+
+def fixture_documents(number_of_documents: int) -> List[DownloadedData]:
+    """
+    Repeats the Wikipedia pages in the test data
+    :param number_of_documents: Number of documents
+    :return: The documents
+    """
+    pages = load_serializable_object(TEST_DATA_PATH, "test_pages.json")
+    return [pages[index % len(pages)] for index in range(number_of_documents)]
+
+
+def all_corpora(scale: int = 1) -> Dict[str, str]:
+    """
+    All corpora used by the benchmarks
+    :param scale: Multiplies the size of all corpora
+    :return: The corpora by name
+    """
+    return {
+        "synthetic_small_low_density": synthetic_corpus(2000 * scale, 0.02),
+        "synthetic_small_high_density": synthetic_corpus(2000 * scale, 0.5),
+        "synthetic_large_low_density": synthetic_corpus(200000 * scale, 0.02),
+        "synthetic_large_high_density": synthetic_corpus(200000 * scale, 0.5),
+        "fixture_wikipedia_pages": fixture_corpus(number_of_repeats=10 * scale),
+        "directory": directory_corpus(2000 * scale)
+    }
+
+
+def number_strings(number_of_strings: int, seed: int = 0) -> Dict[str, List[str]]:
+    """
+    Creates lists of number strings used by the number conversion benchmarks
+    :param number_of_strings: Length of each list
+    :param seed: Seed of the random generator
+    :return: Lists of number strings by name
+    """
+    random = Random(seed)
+    kanji_digits = "〇一二三四五六七八九"
+    return {
+        "recurring": [random.choice(["二〇一九", "十二", "三十一", "2019", "４", "三十"])
+                      for _ in range(number_of_strings)],
+        "western_kanji": ["".join(random.choice(kanji_digits) for _ in range(random.randint(1, 6)))
+                          for _ in range(number_of_strings)],
+        "traditional_kanji": [random.choice(["二千十九", "五百二十七", "三百五十万二百", "２億５万五百二十七", "47176百",
+                                             "九千九百九十九", "千二百三十四万五千六百七十八"])
+                              for _ in range(number_of_strings)],
+        "digits": [str(random.randint(0, 10 ** random.randint(1, 9))) for _ in range(number_of_strings)],
+        "dirty": [f"{random.randint(1, 999)},{random.randint(100, 999)}円" for _ in range(number_of_strings)],
+        "ages": [random.choice(["5", "２０", "二十", "百二十", "一〇五", "四十二", "ゼロ", "弐拾"])
+                 for _ in range(number_of_strings)]
+    }
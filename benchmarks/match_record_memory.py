@@ -0,0 +1,39 @@
+#!/usr/bin/python
+
+# Measures the memory used per extracted match, for the dictionary based results and the compact match records.
+# Run from the project root (with the project root in PYTHONPATH): python benchmarks/match_record_memory.py
+
+import sys
+import tracemalloc
+from typing import Callable, Any
+
+from src.extractor.date_extractor import extract_all_dates, extract_all_date_matches
+from src.extractor.postal_code_extractor import extract_all_postal_codes, extract_all_postal_code_matches
+
+DATE_DOCUMENT_PART = "平成三一年四月三日と2019-04-03、"
+POSTAL_CODE_DOCUMENT_PART = "〒012‐2321、"
+
+
+def _measure_bytes_per_match(extract_function: Callable[[str], Any], document: str) -> float:
+    extract_function(document[:100])  # Compile the regex and fill the number conversion caches first
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    extracted_data = extract_function(document)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / len(extracted_data)
+
+
+def _run_benchmark(number_of_repeats: int) -> None:
+    for name, document_part, extract_dictionaries, extract_records in [
+            ("date", DATE_DOCUMENT_PART, extract_all_dates, extract_all_date_matches),
+            ("postal_code", POSTAL_CODE_DOCUMENT_PART, extract_all_postal_codes, extract_all_postal_code_matches)]:
+        document = document_part * number_of_repeats
+        dictionary_bytes = _measure_bytes_per_match(extract_dictionaries, document)
+        record_bytes = _measure_bytes_per_match(extract_records, document)
+        print(f"{name:<12} dictionaries {dictionary_bytes:7.0f} bytes per match, "
+              f"records {record_bytes:7.0f} bytes per match")
+
+
+if __name__ == "__main__":
+    _run_benchmark(number_of_repeats=int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,42 @@
+#!/usr/bin/python
+
+# Measures the per-call overhead of the extract_all_* functions on many short strings, such as chat messages.
+# Run from the project root (with the project root in PYTHONPATH): python benchmarks/regex_handler_overhead.py
+
+import sys
+from timeit import timeit
+
+from src.extractor.models.RegexHandler import RegexHandler
+from src.extractor.postal_code_extractor import POSTAL_CODE_REGEX, POSTAL_CODE_REGEX_IDENTIFIERS, \
+    POSTAL_CODE_REGEX_HANDLER
+
+SHORT_STRINGS = ["了解です！", "明日の件、よろしく", "いま向かってます", "ありがとう"]
+
+
+def _search_with_new_handler(target_string: str):
+    # The way the extract_all_* functions worked before: a new handler for every call
+    extractor = RegexHandler(compiled_regex=POSTAL_CODE_REGEX,
+                             regex_identifiers=POSTAL_CODE_REGEX_IDENTIFIERS)
+    return extractor.search_string(target_string=target_string)
+
+
+def _search_with_shared_handler(target_string: str):
+    return POSTAL_CODE_REGEX_HANDLER.search_string(target_string=target_string)
+
+
+def _search_with_regex_only(target_string: str):
+    return list(POSTAL_CODE_REGEX.finditer(target_string))
+
+
+def _run_benchmark(number_of_strings: int) -> None:
+    strings = [SHORT_STRINGS[index % len(SHORT_STRINGS)] for index in range(number_of_strings)]
+
+    for name, search_function in [("regex scan only", _search_with_regex_only),
+                                  ("new handler per call", _search_with_new_handler),
+                                  ("shared handler", _search_with_shared_handler)]:
+        elapsed = timeit(lambda: [search_function(string) for string in strings], number=1)
+        print(f"{name:<22}{elapsed:8.3f} s total {elapsed / number_of_strings * 1e9:8.0f} ns per call")
+
+
+if __name__ == "__main__":
+    _run_benchmark(number_of_strings=int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,227 @@
+#!/usr/bin/python
+
+# Benchmarks all extractors, the number conversion utilities and the storage of results, writing the results as JSON so runs can be compared.
+# Run from the project root (with the project root in PYTHONPATH):
+#   python benchmarks/run_benchmarks.py --output before.json
+#   python benchmarks/run_benchmarks.py --output after.json --compare before.json
+
+import argparse
+import json
+import platform
+import sys
+from io import StringIO
+from datetime import datetime
+from time import perf_counter
+from typing import Callable, Any, Dict, List, Optional, Sized
+
+import regex
+
+from benchmarks.corpora import all_corpora, number_strings, fixture_documents
+from src.downloader.models.DownloadedData import DownloadedData
+from src.extractor.age_extractor import extract_all_ages, extract_all_age_matches
+from src.extractor.combined_extractor import extract_all, extract_all_by_paragraph
+from src.extractor.currency_amount_extractor import extract_all_currency_amounts, extract_all_currency_amount_matches
+from src.extractor.date_extractor import extract_all_dates, extract_all_date_matches
+from src.extractor.phone_number_extractor import extract_all_phone_numbers
+from src.extractor.postal_code_extractor import extract_all_postal_codes, extract_all_postal_code_matches
+from src.extractor.time_extractor import extract_all_times
+from src.utils.conversion_utils import parse_postal_code, parse_age
+from src.utils.number_conversion_utils import dirty_mixed_number_to_value, traditional_style_kanji_to_value, \
+    clear_number_conversion_cache, batch_mixed_numbers_to_values
+from src.utils.json_lines_utils import write_documents, read_documents, write_extracted_documents, \
+    read_extracted_documents
+
+# Functions extracting from a whole text, their result is the list (or dictionary of lists) of matches
+EXTRACTOR_BENCHMARKS: Dict[str, Callable[[str], Sized]] = {
+    "extract_all_dates": extract_all_dates,
+    "extract_all_date_matches": extract_all_date_matches,
+    "extract_all_times": extract_all_times,
+    "extract_all_postal_codes": extract_all_postal_codes,
+    "extract_all_postal_code_matches": extract_all_postal_code_matches,
+    "extract_all_phone_numbers": extract_all_phone_numbers,
+    "extract_all_currency_amounts": extract_all_currency_amounts,
+    "extract_all_currency_amount_matches": extract_all_currency_amount_matches,
+    "extract_all_ages": extract_all_ages,
+    "extract_all_age_matches": extract_all_age_matches,
+    "extract_all": extract_all,
+    "extract_all_by_paragraph": extract_all_by_paragraph
+}
+
+POSTAL_CODE_STRINGS = ["〒012‐2321", "012-2321", "０１２－２３２１", "〒一二三-四五六七", "郵便番号0122321"]
+
+
+def _best_time(function: Callable[[], Any], repeats: int, setup: Optional[Callable[[], Any]] = None) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        if setup:
+            setup()
+        start = perf_counter()
+        function()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def _count_matches(result: Sized) -> int:
+    if isinstance(result, dict):
+        return sum(len(extracted_list) for extracted_list in result.values())
+    return len(result)
+
+
+def benchmark_extractors(corpora: Dict[str, str], repeats: int) -> List[Dict[str, Any]]:
+    results = []
+    for benchmark_name, extract_function in EXTRACTOR_BENCHMARKS.items():
+        for corpus_name, corpus in corpora.items():
+            result = {"benchmark": benchmark_name, "corpus": corpus_name, "characters": len(corpus)}
+            try:
+                extract_function(corpus[:100])  # Compile the regex before timing
+                matches = _count_matches(extract_function(corpus))
+                seconds = _best_time(lambda: extract_function(corpus), repeats=repeats)
+            except Exception as error:
+                result["error"] = repr(error)
+            else:
+                result.update({"matches": matches,
+                               "seconds": seconds,
+                               "characters_per_second": len(corpus) / seconds,
+                               "matches_per_second": matches / seconds})
+            results.append(result)
+    return results
+
+
+def benchmark_conversions(number_of_strings: int, repeats: int) -> List[Dict[str, Any]]:
+    inputs = number_strings(number_of_strings)
+    age_inputs = {"ages": inputs.pop("ages")}
+    conversions = [
+        # The cache is cleared before each repeat, so only recurring strings are served from the cache
+        ("dirty_mixed_number_to_value", dirty_mixed_number_to_value, inputs, clear_number_conversion_cache),
+        ("traditional_style_kanji_to_value", traditional_style_kanji_to_value,
+         {"traditional_kanji": inputs["traditional_kanji"]}, None),
+        ("parse_age", parse_age, age_inputs, None),
+        ("parse_postal_code", parse_postal_code,
+         {"postal_codes": [POSTAL_CODE_STRINGS[index % len(POSTAL_CODE_STRINGS)]
+                           for index in range(number_of_strings)]}, None)
+    ]
+
+    # Functions converting a whole list of strings at once, to compare against converting one string at a time
+    batch_conversions = [
+        ("batch_mixed_numbers_to_values", batch_mixed_numbers_to_values, inputs, clear_number_conversion_cache)
+    ]
+
+    results = []
+    for benchmark_name, convert_function, input_lists, setup in conversions:
+        for input_name, strings in input_lists.items():
+            result = {"benchmark": benchmark_name, "corpus": input_name, "operations": len(strings)}
+            try:
+                seconds = _best_time(lambda: [convert_function(string) for string in strings],
+                                     repeats=repeats, setup=setup)
+            except Exception as error:
+                result["error"] = repr(error)
+            else:
+                result.update({"seconds": seconds, "operations_per_second": len(strings) / seconds})
+            results.append(result)
+    for benchmark_name, batch_function, input_lists, setup in batch_conversions:
+        for input_name, strings in input_lists.items():
+            result = {"benchmark": benchmark_name, "corpus": input_name, "operations": len(strings)}
+            seconds = _best_time(lambda: batch_function(strings), repeats=repeats, setup=setup)
+            result.update({"seconds": seconds, "operations_per_second": len(strings) / seconds})
+            results.append(result)
+    return results
+
+
+def _jsonpickle_store(objects: List[Any], output: StringIO) -> None:
+    import jsonpickle
+
+    output.write(jsonpickle.encode(objects))
+
+
+def _jsonpickle_load(text_file: StringIO) -> List[Any]:
+    import jsonpickle
+
+    return jsonpickle.decode(text_file.read())
+
+
+def benchmark_storage(number_of_documents: int, repeats: int) -> List[Dict[str, Any]]:
+    documents = fixture_documents(number_of_documents)
+    # Titles are unique, like the pages of a real run
+    documents = [DownloadedData(title=f"{document.title}{index}", data=document.data)
+                 for index, document in enumerate(documents)]
+    datasets = {
+        "documents": (documents, write_documents, read_documents),
+        "extracted_documents": ([(document.title, extract_all(target_string=document.data)) for document in documents],
+                                write_extracted_documents, read_extracted_documents)
+    }
+
+    results = []
+    for dataset_name, (objects, store_function, load_function) in datasets.items():
+        storage_formats = [("jsonpickle", _jsonpickle_store, _jsonpickle_load),
+                           ("json_lines", store_function, lambda text_file: list(load_function(text_file)))]
+        for format_name, store, load in storage_formats:
+            output = StringIO()
+            store(objects, output)
+            stored_text = output.getvalue()
+            size = len(stored_text.encode("utf-8"))
+            store_seconds = _best_time(lambda: store(objects, StringIO()), repeats=repeats)
+            load_seconds = _best_time(lambda: load(StringIO(stored_text)), repeats=repeats)
+            for operation, seconds in (("store", store_seconds), ("load", load_seconds)):
+                results.append({"benchmark": f"{operation}_{format_name}", "corpus": dataset_name,
+                                "operations": len(objects), "bytes": size, "seconds": seconds,
+                                "operations_per_second": len(objects) / seconds})
+    return results
+
+
+def run_benchmarks(scale: int, repeats: int) -> Dict[str, Any]:
+    return {
+        "environment": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "regex": regex.__version__,
+            "scale": scale,
+            "repeats": repeats
+        },
+        "results": benchmark_extractors(all_corpora(scale=scale), repeats=repeats) +
+                   benchmark_conversions(number_of_strings=10000 * scale, repeats=repeats) +
+                   benchmark_storage(number_of_documents=100 * scale, repeats=repeats)
+    }
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any]) -> None:
+    """
+    Prints the speedup of each benchmark compared to a previous run, above 1 means the current run is faster
+    """
+    baseline_seconds = {(result["benchmark"], result["corpus"]): result.get("seconds")
+                        for result in baseline["results"]}
+    for result in current["results"]:
+        key = (result["benchmark"], result["corpus"])
+        before = baseline_seconds.get(key)
+        after = result.get("seconds")
+        if before and after:
+            comparison = f"{before / after:8.2f}x"
+        else:
+            comparison = "     n/a"
+        print(f"{result['benchmark']:<38}{result['corpus']:<32}{comparison}")
+
+
+def main(arguments: List[str]) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the extractors and number conversions")
+    parser.add_argument("--output", help="File to write the JSON results to, by default they are printed")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare against")
+    parser.add_argument("--scale", type=int, default=1, help="Multiplies the size of the corpora")
+    parser.add_argument("--repeats", type=int, default=3, help="Number of timed runs, the fastest is reported")
+    args = parser.parse_args(arguments)
+
+    results = run_benchmarks(scale=args.scale, repeats=args.repeats)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2, ensure_ascii=False)
+    else:
+        json.dump(results, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            compare_results(baseline=json.load(file), current=results)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,34 +1,48 @@
 #!/usr/bin/python
 
 import sys
-from typing import List, Any, Tuple
+from os.path import join
+from typing import List, Any, Tuple, Optional
 from getopt import getopt, GetoptError
 
+from src.downloader.models.PageCache import PageCache
+from src.pipeline.wikipedia_pipeline import iter_extract_wikipedia_pages, iter_extract_wikipedia_dump_pages, \
+    write_extracted_pages
 from src.utils.io_utils import create_directory_if_not_exists
 
+OUTPUT_FILE_NAME = "extracted_pages.jsonl"
 
-def _parse_parameters_and_arguments(argv: List[str]) -> Tuple[List[str], str]:
+
+def _parse_parameters_and_arguments(argv: List[str]) -> Tuple[List[str], Optional[str], Optional[str], str]:
     try:
-        extracted_options, extracted_arguments = getopt(argv, "hp:", ["help", "page="])
+        extracted_options, extracted_arguments = getopt(argv, "hp:f:c:d:",
+                                                        ["help", "pages=", "page-file=", "cache=", "dump="])
     except GetoptError as err:
         print(err)
         _display_usage_text()
         sys.exit(2)
 
-    target_pages = _parse_options_for_extraction(extracted_options)
-    output_path = _parse_arguments_for_extraction(extracted_arguments)
+    target_pages, cache_path, dump_path = _parse_options_for_extraction(extracted_options)
+    try:
+        output_path = _parse_arguments_for_extraction(extracted_arguments)
+    except Exception as err:
+        print(err)
+        _display_usage_text()
+        sys.exit(2)
 
-    return target_pages, output_path
+    return target_pages, cache_path, dump_path, output_path
 
 
-def _parse_options_for_extraction(options: List[Any]) -> List[str]:
+def _parse_options_for_extraction(options: List[Any]) -> Tuple[List[str], Optional[str], Optional[str]]:
     """
     Takes option for the executed script
     :param options: A list of options specified at execution
-    :return: A ClassifierDetails object representing the options specified (or default if not specified)
+    :return: The pages to download, and the paths of the page cache and the dump (or None if not specified)
     """
 
     target_pages = list()
+    cache_path = None
+    dump_path = None
 
     try:
         for option, value in options:
@@ -36,22 +50,33 @@ def _parse_options_for_extraction(options: List[Any]) -> List[str]:
                 _display_usage_text()
                 sys.exit(2)
             elif option in ("-p", "--pages"):
-                target_pages = _validate_page_input(value)
+                target_pages.extend(_validate_page_input(value))
+            elif option in ("-f", "--page-file"):
+                target_pages.extend(_read_page_file(value))
+            elif option in ("-c", "--cache"):
+                cache_path = value
+            elif option in ("-d", "--dump"):
+                dump_path = value
             else:
                 raise RuntimeError("Invalid option " + option)
+        if not target_pages and dump_path is None:
+            raise ValueError("No pages to download, please specify pages with --pages or --page-file, or a --dump")
     except Exception as err:
         print(err)
         _display_usage_text()
         sys.exit(2)
 
-    return target_pages
+    return target_pages, cache_path, dump_path
 
 
-def _parse_arguments_for_extraction(argument: str) -> str:
+def _parse_arguments_for_extraction(arguments: List[str]) -> str:
     """
     Parse the arguments for the extractor
-    :param argument: A path to the folder where the results should be output
+    :param arguments: A path to the folder where the results should be output
     """
+    if len(arguments) != 1:
+        raise ValueError("Please specify exactly one path to output the results to")
+    return _validate_path_output(arguments[0])
 
 
 def _validate_page_input(page_input: str) -> List[str]:
@@ -66,6 +91,15 @@ def _validate_page_input(page_input: str) -> List[str]:
     return page_input.split(";;")
 
 
+def _read_page_file(path: str) -> List[str]:
+    """
+    Read the pages to parse from a file
+    :param path: A text file with one page per line
+    """
+    with open(path, "r", encoding="utf-8") as page_file:
+        return [line.strip() for line in page_file if line.strip()]
+
+
 def _validate_path_output(path: str) -> str:
     """
     Validate the path where the results should beo utput
@@ -79,9 +113,23 @@ def _display_usage_text() -> None:
     """
     Shows the explanation for parameters and arguments
     """
-    print("""Specify a path to either the path to a file with text to process (.txt) or 
-    a path with several such files.""")
+    print(f"""Downloads Wikipedia pages and extracts data from them, while the pages are being downloaded.
+    Usage: download_wikipedia_pages.py [--pages "page1;;page2"] [--page-file pages.txt] [--cache path] output_path
+           download_wikipedia_pages.py --dump jawiki-latest-pages-articles.xml.bz2 [--pages "page1;;page2"] output_path
+    -p, --pages: Pages to download, seperated by ;;
+    -f, --page-file: A text file with one page to download per line
+    -c, --cache: A folder where downloaded pages are kept, so they are not downloaded again
+    -d, --dump: Read the pages from a local Wikipedia dump instead of downloading them, by default all articles
+    output_path: A folder where the extracted data is written to {OUTPUT_FILE_NAME}, one line per page""")
 
 
 if __name__ == "__main__":
-    pages, path = _parse_parameters_and_arguments(sys.argv[1:])
+    pages, page_cache_path, wikipedia_dump_path, path = _parse_parameters_and_arguments(sys.argv[1:])
+    if wikipedia_dump_path is not None:
+        extracted_pages = iter_extract_wikipedia_dump_pages(wikipedia_dump_path, titles=pages or None)
+    else:
+        page_cache = PageCache(path=page_cache_path) if page_cache_path else None
+        extracted_pages = iter_extract_wikipedia_pages(pages, page_cache=page_cache)
+    with open(join(path, OUTPUT_FILE_NAME), "w", encoding="utf-8") as output_file:
+        number_of_pages = write_extracted_pages(extracted_pages, output=output_file)
+    print(f"Extracted data from {number_of_pages} pages to {join(path, OUTPUT_FILE_NAME)}")
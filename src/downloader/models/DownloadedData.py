@@ -1,14 +1,21 @@
+from typing import Optional
+
 from wikipediaapi import WikipediaPage
 
 
 class DownloadedData:
     """
     This object represents some data that has been downloaded for use with this tool.
+    The revision id (if known) identifies the version of the data at the source, and the fetch time is the
+    time (seconds since the epoch) the data was last confirmed to be up to date.
     """
 
-    def __init__(self, title: str, data: str) -> None:
+    def __init__(self, title: str, data: str, revision_id: Optional[int] = None,
+                 fetched_at: Optional[float] = None) -> None:
         self.title = title
         self.data = data
+        self.revision_id = revision_id
+        self.fetched_at = fetched_at
 
     @staticmethod
     def from_wikipedia_page(wikipedia_page: WikipediaPage) -> 'DownloadedData':
@@ -0,0 +1,82 @@
+import json
+from hashlib import sha256
+from os import replace, getpid
+from os.path import join
+from threading import get_ident
+from time import time
+from typing import Optional
+
+from src.downloader.models.DownloadedData import DownloadedData
+from src.utils.io_utils import create_directory_if_not_exists, is_file
+
+# Pages fetched within this many seconds are used without asking the source if they changed
+DEFAULT_PAGE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+class PageCache:
+    """
+    This object stores downloaded pages in a folder, one JSON file per page named by the hash of its title.
+    A page fetched less than ttl_seconds ago is fresh and can be used as it is. An older page is stale, it can still
+    be used if the source confirms that its revision has not changed (see wikipedia_downloader).
+    Files are written to a temporary file first, so the cache can be shared between threads and processes.
+    """
+    __slots__ = ("_path", "_ttl_seconds")
+
+    def __init__(self, path: str, ttl_seconds: Optional[float] = DEFAULT_PAGE_TTL_SECONDS) -> None:
+        """
+        :param path: Folder storing the pages, created when the first page is stored
+        :param ttl_seconds: Seconds a page stays fresh after it was fetched, None to never let pages go stale
+        """
+        self._path = path
+        self._ttl_seconds = ttl_seconds
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def _file_path(self, title: str) -> str:
+        return join(self._path, sha256(title.encode("utf-8")).hexdigest() + ".json")
+
+    def get(self, title: str) -> Optional[DownloadedData]:
+        """
+        :param title: Title of the page
+        :return: The stored page, fresh or stale, or None if the page is not stored
+        """
+        file_path = self._file_path(title)
+        if not is_file(file_path):
+            return None
+        try:
+            with open(file_path, "r", encoding="utf-8") as file:
+                stored_page = json.load(file)
+        except (OSError, ValueError):
+            return None  # Broken file, the page is downloaded again and the file replaced
+        if stored_page.get("title") != title:
+            return None
+        return DownloadedData(title=title, data=stored_page["data"], revision_id=stored_page.get("revision_id"),
+                              fetched_at=stored_page.get("fetched_at"))
+
+    def put(self, page: DownloadedData) -> None:
+        """
+        Stores a page, replacing the page with the same title
+        :param page: The page to store, the current time is used if its fetch time is not set
+        """
+        create_directory_if_not_exists(self._path)
+        file_path = self._file_path(page.title)
+        temporary_file_path = f"{file_path}.{getpid()}.{get_ident()}.tmp"
+        with open(temporary_file_path, "w", encoding="utf-8") as file:
+            json.dump({"title": page.title, "data": page.data, "revision_id": page.revision_id,
+                       "fetched_at": page.fetched_at if page.fetched_at is not None else time()},
+                      file, ensure_ascii=False)
+        replace(temporary_file_path, file_path)
+
+    def is_fresh(self, page: DownloadedData, now: Optional[float] = None) -> bool:
+        """
+        :param page: A page from the cache
+        :param now: The current time, by default the time of the call
+        :return: True if the page was fetched less than ttl_seconds ago
+        """
+        if self._ttl_seconds is None:
+            return True
+        if page.fetched_at is None:
+            return False
+        return (time() if now is None else now) - page.fetched_at < self._ttl_seconds
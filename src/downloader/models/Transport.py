@@ -0,0 +1,82 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.exceptions.downloader_exceptions import TransportError
+
+# Identifies the requests of this tool, as asked by the Wikimedia API etiquette
+DEFAULT_USER_AGENT = "japanese-data-extractor (https://github.com/KristerSJakobsson/japanese-data-extractor)"
+DEFAULT_TIMEOUT_SECONDS = 10.0
+
+# Responses that might succeed when the request is sent again
+RETRYABLE_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+
+class Transport(ABC):
+    """
+    This object sends the HTTP requests of the downloaders. Downloaders only depend on this interface,
+    so the requests can be sent in other ways, for example to a local server in the tests.
+    Implementations must be safe to use from several threads at once.
+    """
+
+    @abstractmethod
+    def get_json(self, url: str, parameters: Dict[str, Any]) -> Any:
+        """
+        Sends a GET request and decodes the JSON response
+        :param url: The URL to request
+        :param parameters: The query parameters of the request
+        :return: The decoded response
+        :raises TransportError: When the request failed, or the response was not JSON
+        """
+
+    def close(self) -> None:
+        """
+        Releases the connections held by the transport
+        """
+
+    def __enter__(self) -> 'Transport':
+        return self
+
+    def __exit__(self, *exception_info) -> None:
+        self.close()
+
+
+class RequestsTransport(Transport):
+    """
+    A transport sending requests with a requests Session, so connections are kept open and reused between requests.
+    """
+
+    def __init__(self, pool_size: int = 10, timeout: float = DEFAULT_TIMEOUT_SECONDS,
+                 headers: Optional[Dict[str, str]] = None) -> None:
+        """
+        :param pool_size: Number of connections kept open per host, should be at least the number of threads
+        :param timeout: Seconds to wait for the server before giving up a request
+        :param headers: Headers sent with each request, by default only the user agent of this tool
+        """
+        self._timeout = timeout
+        self._session = requests.Session()
+        self._session.headers.update(headers if headers is not None else {"User-Agent": DEFAULT_USER_AGENT})
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def get_json(self, url: str, parameters: Dict[str, Any]) -> Any:
+        try:
+            response = self._session.get(url, params=parameters, timeout=self._timeout)
+        except (requests.ConnectionError, requests.Timeout) as error:
+            raise TransportError(url=url, reason=repr(error), retryable=True) from error
+        except requests.RequestException as error:
+            raise TransportError(url=url, reason=repr(error), retryable=False) from error
+
+        if response.status_code != 200:
+            raise TransportError(url=url, reason=f"HTTP status {response.status_code}",
+                                 retryable=response.status_code in RETRYABLE_STATUS_CODES)
+        try:
+            return response.json()
+        except ValueError as error:
+            raise TransportError(url=url, reason=f"Invalid JSON response: {error}", retryable=False) from error
+
+    def close(self) -> None:
+        self._session.close()
@@ -1,15 +1,29 @@
-from typing import List
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from time import sleep, time
+from typing import List, Any, Dict, Optional, Iterable, Iterator
+
 from wikipediaapi import Wikipedia, WikipediaPage
 
-from src.exceptions.downloader_exceptions import PageNotFoundError
+from src.exceptions.downloader_exceptions import PageNotFoundError, TransportError
 from src.downloader.models.DownloadedData import DownloadedData
+from src.downloader.models.PageCache import PageCache
+from src.downloader.models.Transport import Transport, RequestsTransport
 
 wiki_extractor = Wikipedia(language='ja')
 
+WIKIPEDIA_API_URL = "https://ja.wikipedia.org/w/api.php"
+# Number of pages downloaded at the same time
+DEFAULT_DOWNLOAD_WORKERS = 8
+# Number of times a failed request is sent again, waiting twice as long each time
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_SECONDS = 0.5
+# Maximum number of titles the MediaWiki API accepts in a single query
+MAX_TITLES_PER_QUERY = 50
+
 
-def get_wikipedia_data_for_output(search_page_names: List[str]) -> List[DownloadedData]:
-    pages = download_wikipedia_pages(search_page_names=search_page_names)
-    return [DownloadedData.from_wikipedia_page(page) for page in pages]
+def get_wikipedia_data_for_output(search_page_names: List[str],
+                                  page_cache: Optional[PageCache] = None) -> List[DownloadedData]:
+    return download_wikipedia_pages_concurrently(search_page_names=search_page_names, page_cache=page_cache)
 
 
 def download_wikipedia_pages(search_page_names: List[str]) -> List[WikipediaPage]:
@@ -20,3 +34,209 @@ def download_wikipedia_pages(search_page_names: List[str]) -> List[WikipediaPage
             raise PageNotFoundError(page_name=page_name, page_source="Wikipedia")
         pages.append(page)
     return pages
+
+
+def download_wikipedia_pages_concurrently(search_page_names: List[str], transport: Optional[Transport] = None,
+                                          workers: int = DEFAULT_DOWNLOAD_WORKERS,
+                                          api_url: str = WIKIPEDIA_API_URL,
+                                          retries: int = DEFAULT_RETRIES,
+                                          backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+                                          page_cache: Optional[PageCache] = None) -> List[DownloadedData]:
+    """
+    Downloads the plain text of Wikipedia pages, several pages at a time
+    :param search_page_names: Titles of the pages to download
+    :param transport: Sends the requests, by default a RequestsTransport with a connection for each worker
+    :param workers: Number of pages downloaded at the same time
+    :param api_url: URL of the MediaWiki API
+    :param retries: Number of times a request failing with a temporary error is sent again
+    :param backoff_seconds: Seconds to wait before the first retry, doubled for each following retry
+    :param page_cache: Optional cache of the pages. Fresh pages are read from it without any request, stale pages
+    are only downloaded again if their revision changed, and downloaded pages are stored in it.
+    :return: The downloaded pages, in the same order as the titles
+    :raises PageNotFoundError: When a page does not exist
+    """
+    pages = {page.title: page for page in iter_download_wikipedia_pages(search_page_names=search_page_names,
+                                                                        transport=transport, workers=workers,
+                                                                        api_url=api_url, retries=retries,
+                                                                        backoff_seconds=backoff_seconds,
+                                                                        page_cache=page_cache)}
+    return [pages[page_name] for page_name in search_page_names]
+
+
+def iter_download_wikipedia_pages(search_page_names: Iterable[str], transport: Optional[Transport] = None,
+                                  workers: int = DEFAULT_DOWNLOAD_WORKERS,
+                                  api_url: str = WIKIPEDIA_API_URL,
+                                  retries: int = DEFAULT_RETRIES,
+                                  backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+                                  page_cache: Optional[PageCache] = None,
+                                  skip_missing_pages: bool = False) -> Iterator[DownloadedData]:
+    """
+    Downloads Wikipedia pages like download_wikipedia_pages_concurrently, but yields each page as soon as it is
+    available, in order of completion. Pages read from the page cache come first. Only a limited number of pages
+    are downloaded ahead of the consumer, so a slow consumer also slows down the downloads.
+    :param search_page_names: Titles of the pages to download, each title is only downloaded once
+    :param transport: Sends the requests, by default a RequestsTransport with a connection for each worker
+    :param workers: Number of pages downloaded at the same time
+    :param api_url: URL of the MediaWiki API
+    :param retries: Number of times a request failing with a temporary error is sent again
+    :param backoff_seconds: Seconds to wait before the first retry, doubled for each following retry
+    :param page_cache: Optional cache of the pages, see download_wikipedia_pages_concurrently
+    :param skip_missing_pages: Leave out pages that do not exist instead of raising PageNotFoundError
+    :return: An iterator of the downloaded pages
+    :raises PageNotFoundError: When a page does not exist (unless skipped)
+    """
+    page_names = list(dict.fromkeys(search_page_names))
+    own_transport = transport is None
+    if own_transport:
+        transport = RequestsTransport(pool_size=workers)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            cached_pages: Dict[str, DownloadedData] = {}
+            if page_cache is not None:
+                cached_pages = _load_cached_wikipedia_pages(page_cache=page_cache, titles=page_names,
+                                                            executor=executor, transport=transport, api_url=api_url,
+                                                            retries=retries, backoff_seconds=backoff_seconds)
+                yield from cached_pages.values()
+
+            # Keep two pages per worker in flight, so workers never wait while pages are consumed
+            maximum_pending = 2 * workers
+            pending = set()
+            for page_name in page_names:
+                if page_name in cached_pages:
+                    continue
+                pending.add(executor.submit(fetch_wikipedia_page, transport=transport, page_name=page_name,
+                                            api_url=api_url, retries=retries, backoff_seconds=backoff_seconds))
+                while len(pending) >= maximum_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from _downloaded_pages(done, page_cache=page_cache, skip_missing_pages=skip_missing_pages)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from _downloaded_pages(done, page_cache=page_cache, skip_missing_pages=skip_missing_pages)
+    finally:
+        if own_transport:
+            transport.close()
+
+
+def _downloaded_pages(done: Iterable[Future], page_cache: Optional[PageCache],
+                      skip_missing_pages: bool) -> Iterator[DownloadedData]:
+    # Stores the pages of finished downloads in the cache and yields them
+    for future in done:
+        try:
+            page = future.result()
+        except PageNotFoundError:
+            if skip_missing_pages:
+                continue
+            raise
+        if page_cache is not None:
+            page_cache.put(page)
+        yield page
+
+
+def _load_cached_wikipedia_pages(page_cache: PageCache, titles: Iterable[str], executor: ThreadPoolExecutor,
+                                 transport: Transport, api_url: str, retries: int,
+                                 backoff_seconds: float) -> Dict[str, DownloadedData]:
+    # Returns the cached pages that are fresh, or stale but still at the same revision
+    now = time()
+    fresh_pages = {}
+    stale_pages = {}
+    for title in dict.fromkeys(titles):
+        page = page_cache.get(title)
+        if page is None:
+            continue
+        if page_cache.is_fresh(page, now=now):
+            fresh_pages[title] = page
+        elif page.revision_id is not None:
+            stale_pages[title] = page
+
+    stale_titles = list(stale_pages.keys())
+    title_batches = [stale_titles[index:index + MAX_TITLES_PER_QUERY]
+                     for index in range(0, len(stale_titles), MAX_TITLES_PER_QUERY)]
+    for revision_ids in executor.map(lambda batch: fetch_wikipedia_revision_ids(transport=transport, titles=batch,
+                                                                                api_url=api_url, retries=retries,
+                                                                                backoff_seconds=backoff_seconds),
+                                     title_batches):
+        for title, revision_id in revision_ids.items():
+            page = stale_pages[title]
+            if revision_id == page.revision_id:
+                page.fetched_at = now
+                page_cache.put(page)
+                fresh_pages[title] = page
+    return fresh_pages
+
+
+def fetch_wikipedia_revision_ids(transport: Transport, titles: List[str], api_url: str = WIKIPEDIA_API_URL,
+                                 retries: int = DEFAULT_RETRIES,
+                                 backoff_seconds: float = DEFAULT_BACKOFF_SECONDS) -> Dict[str, Optional[int]]:
+    """
+    Asks for the current revision of several Wikipedia pages with a single request, without downloading them
+    :param transport: Sends the request
+    :param titles: Titles of the pages, at most MAX_TITLES_PER_QUERY
+    :param api_url: URL of the MediaWiki API
+    :param retries: Number of times the request is sent again when failing with a temporary error
+    :param backoff_seconds: Seconds to wait before the first retry, doubled for each following retry
+    :return: The current revision id of each title, None for pages that do not exist
+    """
+    parameters = {
+        "action": "query",
+        "format": "json",
+        "formatversion": 2,
+        "prop": "info",
+        "redirects": 1,
+        "titles": "|".join(titles)
+    }
+    response = _get_json_with_retries(transport=transport, url=api_url, parameters=parameters,
+                                      retries=retries, backoff_seconds=backoff_seconds)
+    query = response.get("query", {})
+    # The API answers with the normalized title (and the target of redirects), which are mapped back to the titles
+    normalized_titles = {item["from"]: item["to"] for item in query.get("normalized", [])}
+    redirected_titles = {item["from"]: item["to"] for item in query.get("redirects", [])}
+    revision_ids = {page["title"]: page.get("lastrevid") for page in query.get("pages", [])}
+
+    result = {}
+    for title in titles:
+        normalized_title = normalized_titles.get(title, title)
+        result[title] = revision_ids.get(redirected_titles.get(normalized_title, normalized_title))
+    return result
+
+
+def fetch_wikipedia_page(transport: Transport, page_name: str, api_url: str = WIKIPEDIA_API_URL,
+                         retries: int = DEFAULT_RETRIES,
+                         backoff_seconds: float = DEFAULT_BACKOFF_SECONDS) -> DownloadedData:
+    """
+    Downloads the plain text of a Wikipedia page with a single request, redirects are followed
+    :param transport: Sends the request
+    :param page_name: Title of the page
+    :param api_url: URL of the MediaWiki API
+    :param retries: Number of times the request is sent again when failing with a temporary error
+    :param backoff_seconds: Seconds to wait before the first retry, doubled for each following retry
+    :return: The downloaded page, with the title as requested and the current revision id
+    :raises PageNotFoundError: When the page does not exist
+    """
+    parameters = {
+        "action": "query",
+        "format": "json",
+        "formatversion": 2,
+        "prop": "extracts|info",
+        "explaintext": 1,
+        "exsectionformat": "plain",
+        "redirects": 1,
+        "titles": page_name
+    }
+    response = _get_json_with_retries(transport=transport, url=api_url, parameters=parameters,
+                                      retries=retries, backoff_seconds=backoff_seconds)
+    pages = response.get("query", {}).get("pages", [])
+    if not pages or pages[0].get("missing") or pages[0].get("invalid"):
+        raise PageNotFoundError(page_name=page_name, page_source="Wikipedia")
+    return DownloadedData(title=page_name, data=pages[0].get("extract", ""), revision_id=pages[0].get("lastrevid"),
+                          fetched_at=time())
+
+
+def _get_json_with_retries(transport: Transport, url: str, parameters: Dict[str, Any], retries: int,
+                           backoff_seconds: float) -> Any:
+    for attempt in range(retries + 1):
+        try:
+            return transport.get_json(url=url, parameters=parameters)
+        except TransportError as error:
+            if not error.retryable or attempt == retries:
+                raise
+        sleep(backoff_seconds * 2 ** attempt)
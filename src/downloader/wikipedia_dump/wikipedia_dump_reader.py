@@ -0,0 +1,82 @@
+import bz2
+from typing import Iterable, Iterator, Optional, BinaryIO
+from xml.etree.ElementTree import iterparse, Element
+
+from src.downloader.models.DownloadedData import DownloadedData
+from src.utils.wiki_markup_utils import strip_wiki_markup
+
+# Namespace of the articles, other namespaces contain talk pages, templates, categories etc.
+ARTICLE_NAMESPACE = 0
+
+
+def iter_wikipedia_dump_pages(dump_path: str, strip_markup: bool = False,
+                              namespaces: Optional[Iterable[int]] = (ARTICLE_NAMESPACE,),
+                              include_redirects: bool = False,
+                              titles: Optional[Iterable[str]] = None) -> Iterator[DownloadedData]:
+    """
+    Reads the pages of a Wikipedia dump, like jawiki-latest-pages-articles.xml.bz2 from https://dumps.wikimedia.org
+    The dump is parsed while it is read and each page is dropped once it has been yielded, so the memory used does
+    not depend on the size of the dump.
+    :param dump_path: Path to the dump, compressed with bzip2 if the name ends with .bz2
+    :param strip_markup: Turn the wiki markup of the pages into plain text, see strip_wiki_markup
+    :param namespaces: Namespaces of the pages to read, by default only articles, None for all pages
+    :param include_redirects: Also read pages redirecting to another page
+    :param titles: Titles of the pages to read, by default all pages. Reading stops when all of them were found.
+    :return: An iterator of the pages, with the revision id of the dump
+    """
+    namespaces = None if namespaces is None else frozenset(namespaces)
+    remaining_titles = None if titles is None else set(titles)
+    if remaining_titles is not None and not remaining_titles:
+        return
+
+    with _open_dump(dump_path) as dump_file:
+        for page in _iter_page_elements(dump_file):
+            if namespaces is not None and page.namespace not in namespaces:
+                continue
+            if page.redirect and not include_redirects:
+                continue
+            if remaining_titles is not None:
+                if page.title not in remaining_titles:
+                    continue
+                remaining_titles.remove(page.title)
+
+            text = strip_wiki_markup(page.text) if strip_markup else page.text
+            yield DownloadedData(title=page.title, data=text, revision_id=page.revision_id)
+
+            if remaining_titles is not None and not remaining_titles:
+                return
+
+
+class _DumpPage:
+    """
+    The parts of a page element that are used, read before the element is cleared
+    """
+    __slots__ = ("title", "namespace", "redirect", "revision_id", "text")
+
+    def __init__(self, element: Element, xml_namespace: str) -> None:
+        self.title = element.findtext(xml_namespace + "title")
+        self.namespace = int(element.findtext(xml_namespace + "ns", default=str(ARTICLE_NAMESPACE)))
+        self.redirect = element.find(xml_namespace + "redirect") is not None
+        revision = element.find(xml_namespace + "revision")
+        revision_id = None if revision is None else revision.findtext(xml_namespace + "id")
+        self.revision_id = None if revision_id is None else int(revision_id)
+        self.text = "" if revision is None else revision.findtext(xml_namespace + "text", default="")
+
+
+def _open_dump(dump_path: str) -> BinaryIO:
+    if dump_path.endswith(".bz2"):
+        return bz2.open(dump_path, "rb")
+    return open(dump_path, "rb")
+
+
+def _iter_page_elements(dump_file: BinaryIO) -> Iterator[_DumpPage]:
+    # The elements of the dump are qualified with the namespace of the export format, which depends on its version
+    events = iterparse(dump_file, events=("start", "end"))
+    _, root = next(events)
+    xml_namespace = root.tag[:root.tag.index("}") + 1] if root.tag.startswith("{") else ""
+    page_tag = xml_namespace + "page"
+    for event, element in events:
+        if event == "end" and element.tag == page_tag:
+            yield _DumpPage(element, xml_namespace)
+            # Pages are children of the root, clearing it drops the pages read so far
+            root.clear()
@@ -7,3 +7,15 @@ class PageNotFoundError(Exception):
 
     def __reduce__(self):
         return self.__class__, (self.page_name, self.page_source)
+
+
+class TransportError(Exception):
+    def __init__(self, url: str, reason: str, retryable: bool):
+        self.url = url
+        self.reason = reason
+        self.retryable = retryable  # True when sending the same request again might succeed
+
+        super().__init__('url: {}, reason: {}'.format(url, reason))
+
+    def __reduce__(self):
+        return self.__class__, (self.url, self.reason, self.retryable)
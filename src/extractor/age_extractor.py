@@ -0,0 +1,59 @@
+from typing import Union, TextIO, Iterable, Iterator, List
+
+import regex
+
+from src.extractor.constants import suffixes, special_values
+from src.extractor.models.ExtractedData import ExtractedList, ExtractedItem
+from src.extractor.models.ExtractedMatch import AgeMatch
+from src.extractor.models.LazyRegex import LazyRegex
+from src.extractor.models.RegexHandler import RegexHandler
+from src.extractor.models.TextEdit import TextEdit
+from src.utils.conversion_utils import parse_age
+from src.utils.number_conversion_utils import japanese_container_dict
+
+AGE_REGEX = LazyRegex(
+    "age.regexp",
+    special_value_age_zero=special_values["age_zero"],
+    suffix_age=suffixes["age"],
+    kanji_0=japanese_container_dict["0"],
+    kanji_0to1=japanese_container_dict["0to1"],
+    kanji_0to9=japanese_container_dict["0to9"],
+    kanji_0to100=japanese_container_dict["0to100"],
+    kanji_1=japanese_container_dict["1"],
+    kanji_1to9=japanese_container_dict["1to9"],
+    kanji_2=japanese_container_dict["2"],
+    kanji_2to9=japanese_container_dict["2to9"],
+    kanji_10=japanese_container_dict["10"],
+    kanji_100=japanese_container_dict["100"]
+)
+AGE_REGEX_IDENTIFIERS = {
+    "age_string": lambda raw_value: raw_value,
+    "age_value": parse_age
+}
+# Increase whenever the matches are converted to values differently
+AGE_EXTRACTOR_VERSION = 1
+# Every age ends with 歳 or 才, and is at most four characters before it
+AGE_ANCHOR_REGEX = regex.compile(r"\L<suffix_age>", suffix_age=suffixes["age"])
+AGE_MAX_MATCH_LENGTH = 8
+AGE_REGEX_HANDLER = RegexHandler(compiled_regex=AGE_REGEX,
+                                 regex_identifiers=AGE_REGEX_IDENTIFIERS,
+                                 anchor_regex=AGE_ANCHOR_REGEX,
+                                 max_match_length=AGE_MAX_MATCH_LENGTH)
+
+
+def extract_all_ages(target_string: str) -> ExtractedList:
+    return AGE_REGEX_HANDLER.search_string(target_string=target_string)
+
+
+def reextract_all_ages(previous_extracted_list: ExtractedList, previous_string: str,
+                       edit: TextEdit) -> ExtractedList:
+    return AGE_REGEX_HANDLER.search_edited_string(previous_extracted_list=previous_extracted_list,
+                                                  previous_string=previous_string, edit=edit)
+
+
+def extract_all_age_matches(target_string: str) -> List[AgeMatch]:
+    return AGE_REGEX_HANDLER.search_records(target_string=target_string, record_factory=AgeMatch)
+
+
+def iter_extract_all_ages(stream: Union[TextIO, Iterable[str]]) -> Iterator[ExtractedItem]:
+    return AGE_REGEX_HANDLER.iter_search(stream=stream)
@@ -0,0 +1,117 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import Optional, Callable, Any, AsyncIterable, AsyncIterator, Iterable, Dict
+
+from src.extractor.age_extractor import extract_all_ages, AGE_REGEX_HANDLER
+from src.extractor.combined_extractor import extract_all
+from src.extractor.currency_amount_extractor import extract_all_currency_amounts, CURRENCY_AMOUNT_REGEX_HANDLER
+from src.extractor.date_extractor import extract_all_dates, DATE_REGEX_HANDLER, date_post_processing
+from src.extractor.models.ExtractedData import ExtractedList, ExtractedItem
+from src.extractor.models.RegexHandler import RegexHandler, DEFAULT_STREAM_OVERLAP
+from src.extractor.models.StreamWindow import StreamWindow
+from src.extractor.phone_number_extractor import extract_all_phone_numbers, PHONE_NUMBER_REGEX_HANDLER
+from src.extractor.postal_code_extractor import extract_all_postal_codes, POSTAL_CODE_REGEX_HANDLER
+from src.extractor.time_extractor import extract_all_times, TIME_REGEX_HANDLER
+
+# Executor used when none is given to the functions below, None means the default executor of the event loop
+_default_executor: Optional[Executor] = None
+
+
+def set_default_executor(executor: Optional[Executor]) -> None:
+    """
+    Sets the executor the asynchronous extraction functions run in, unless another executor is given to them.
+    A ProcessPoolExecutor avoids competing with the event loop for the GIL when documents are large.
+    :param executor: Any executor, or None to use the default executor of the event loop
+    """
+    global _default_executor
+    _default_executor = executor
+
+
+async def _run_in_executor(function: Callable[..., Any], executor: Optional[Executor], *args: Any) -> Any:
+    """
+    Runs a blocking function in an executor without blocking the event loop.
+    If the awaiting task is cancelled before the function has started, the function is never run.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor or _default_executor, partial(function, *args))
+
+
+async def aextract_all_dates(target_string: str, executor: Optional[Executor] = None) -> ExtractedList:
+    return await _run_in_executor(extract_all_dates, executor, target_string)
+
+
+async def aextract_all_times(target_string: str, executor: Optional[Executor] = None) -> ExtractedList:
+    return await _run_in_executor(extract_all_times, executor, target_string)
+
+
+async def aextract_all_postal_codes(target_string: str, executor: Optional[Executor] = None) -> ExtractedList:
+    return await _run_in_executor(extract_all_postal_codes, executor, target_string)
+
+
+async def aextract_all_phone_numbers(target_string: str, executor: Optional[Executor] = None) -> ExtractedList:
+    return await _run_in_executor(extract_all_phone_numbers, executor, target_string)
+
+
+async def aextract_all_currency_amounts(target_string: str, executor: Optional[Executor] = None) -> ExtractedList:
+    return await _run_in_executor(extract_all_currency_amounts, executor, target_string)
+
+
+async def aextract_all_ages(target_string: str, executor: Optional[Executor] = None) -> ExtractedList:
+    return await _run_in_executor(extract_all_ages, executor, target_string)
+
+
+async def aextract_all(target_string: str, kinds: Optional[Iterable[str]] = None,
+                       executor: Optional[Executor] = None) -> Dict[str, ExtractedList]:
+    return await _run_in_executor(extract_all, executor, target_string, kinds)
+
+
+async def aiter_search(regex_handler: RegexHandler, stream: AsyncIterable[str], post_process: Callable = None,
+                       overlap: int = DEFAULT_STREAM_OVERLAP) -> AsyncIterator[ExtractedItem]:
+    """
+    Same as RegexHandler.iter_search, but for an asynchronous stream of text chunks.
+    The search runs in the event loop, but control is given back to it after every match,
+    so a long document does not stall other tasks for longer than the scan of one chunk.
+    :param regex_handler: The handler to search with
+    :param stream: An asynchronous iterable of text chunks
+    :param post_process: Optional function applied to each extracted match
+    :param overlap: Number of characters kept between chunks, must be longer than any match including lookaround
+    :return: An asynchronous iterator of the extracted data, with positions relative to the start of the stream
+    """
+    stream_window = StreamWindow(overlap=overlap)
+    stream_iterator = stream.__aiter__()
+    end_of_stream = False
+    while not end_of_stream:
+        try:
+            chunk = await stream_iterator.__anext__()
+        except StopAsyncIteration:
+            chunk = None
+            end_of_stream = True
+        for match, offset in stream_window.search(compiled_regex=regex_handler.compiled_regex, chunk=chunk):
+            extracted_data = regex_handler.extract_match(match, offset=offset)
+            yield post_process(extracted_data) if post_process else extracted_data
+            await asyncio.sleep(0)
+
+
+def aiter_extract_all_dates(stream: AsyncIterable[str]) -> AsyncIterator[ExtractedItem]:
+    return aiter_search(regex_handler=DATE_REGEX_HANDLER, stream=stream, post_process=date_post_processing)
+
+
+def aiter_extract_all_times(stream: AsyncIterable[str]) -> AsyncIterator[ExtractedItem]:
+    return aiter_search(regex_handler=TIME_REGEX_HANDLER, stream=stream)
+
+
+def aiter_extract_all_postal_codes(stream: AsyncIterable[str]) -> AsyncIterator[ExtractedItem]:
+    return aiter_search(regex_handler=POSTAL_CODE_REGEX_HANDLER, stream=stream)
+
+
+def aiter_extract_all_phone_numbers(stream: AsyncIterable[str]) -> AsyncIterator[ExtractedItem]:
+    return aiter_search(regex_handler=PHONE_NUMBER_REGEX_HANDLER, stream=stream)
+
+
+def aiter_extract_all_currency_amounts(stream: AsyncIterable[str]) -> AsyncIterator[ExtractedItem]:
+    return aiter_search(regex_handler=CURRENCY_AMOUNT_REGEX_HANDLER, stream=stream)
+
+
+def aiter_extract_all_ages(stream: AsyncIterable[str]) -> AsyncIterator[ExtractedItem]:
+    return aiter_search(regex_handler=AGE_REGEX_HANDLER, stream=stream)
@@ -0,0 +1,87 @@
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from os import cpu_count
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Hashable
+
+from src.extractor.combined_extractor import extract_all, validate_kinds
+from src.extractor.models.ExtractedData import ExtractedList
+
+ExtractedDocument = Dict[str, ExtractedList]
+
+# The kinds of extractors run by the current worker process, set by the worker initializer
+_worker_kinds: List[str] = []
+
+
+def _initialize_worker(kinds: List[str]) -> None:
+    """
+    Prepares a worker process, making sure all regexes are compiled once before the first document arrives
+    :param kinds: The kinds of extractors the worker will run
+    """
+    global _worker_kinds
+    _worker_kinds = kinds
+    extract_all(target_string="", kinds=kinds)
+
+
+def _extract_documents(identified_documents: List[Tuple[Hashable, str]]) -> List[Tuple[Hashable, ExtractedDocument]]:
+    return [(identifier, extract_all(target_string=document, kinds=_worker_kinds))
+            for identifier, document in identified_documents]
+
+
+def _extract_document(document: str) -> ExtractedDocument:
+    return extract_all(target_string=document, kinds=_worker_kinds)
+
+
+def extract_batch(documents: Iterable[str], extractors: Optional[Iterable[str]] = None,
+                  workers: Optional[int] = None, chunksize: int = 1) -> List[ExtractedDocument]:
+    """
+    Extracts data from many documents in parallel using a pool of worker processes
+    :param documents: The documents to extract data from
+    :param extractors: The kinds of data to extract (see combined_extractor.EXTRACTORS), by default all kinds
+    :param workers: Number of worker processes, by default the number of processors
+    :param chunksize: Number of documents sent to a worker at a time, larger values reduce the overhead for short documents
+    :return: The extracted data for each document (same as extract_all), in the same order as the input
+    """
+    kinds = validate_kinds(extractors)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initialize_worker, initargs=(kinds,)) as executor:
+        return list(executor.map(_extract_document, documents, chunksize=chunksize))
+
+
+def extract_batch_as_completed(identified_documents: Iterable[Tuple[Hashable, str]],
+                               extractors: Optional[Iterable[str]] = None,
+                               workers: Optional[int] = None,
+                               chunksize: int = 1) -> Iterator[Tuple[Hashable, ExtractedDocument]]:
+    """
+    Extracts data from many documents in parallel, yielding the result of each document as soon as it is done.
+    Only a limited number of chunks are sent to the workers at a time, so the input can be a lazy iterable.
+    :param identified_documents: Tuples of an identifier (for example the page title) and the document
+    :param extractors: The kinds of data to extract (see combined_extractor.EXTRACTORS), by default all kinds
+    :param workers: Number of worker processes, by default the number of processors
+    :param chunksize: Number of documents sent to a worker at a time
+    :return: An iterator of tuples with the identifier and the extracted data of the document, in order of completion
+    """
+    if chunksize < 1:
+        raise ValueError(f"The chunksize must be at least one: {chunksize}")
+
+    kinds = validate_kinds(extractors)
+    workers = workers or cpu_count() or 1
+    # Keep two chunks per worker in flight, so workers never wait while results are consumed
+    maximum_pending = 2 * workers
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initialize_worker, initargs=(kinds,)) as executor:
+        pending = set()
+        chunk = []
+        for identified_document in identified_documents:
+            chunk.append(identified_document)
+            if len(chunk) < chunksize:
+                continue
+            pending.add(executor.submit(_extract_documents, chunk))
+            chunk = []
+            while len(pending) >= maximum_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+        if chunk:
+            pending.add(executor.submit(_extract_documents, chunk))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
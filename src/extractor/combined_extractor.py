@@ -0,0 +1,168 @@
+import itertools
+from bisect import bisect_right
+from typing import Dict, Iterable, Optional, Callable, List, Tuple
+
+from src.extractor.age_extractor import extract_all_ages, reextract_all_ages, AGE_REGEX, AGE_EXTRACTOR_VERSION
+from src.extractor.currency_amount_extractor import extract_all_currency_amounts, reextract_all_currency_amounts, \
+    CURRENCY_AMOUNT_REGEX, CURRENCY_AMOUNT_EXTRACTOR_VERSION
+from src.extractor.date_extractor import extract_all_dates, reextract_all_dates, DATE_REGEX, DATE_EXTRACTOR_VERSION
+from src.extractor.models.ExtractedData import ExtractedList
+from src.extractor.models.ExtractionCache import ExtractionCache
+from src.extractor.models.LazyRegex import LazyRegex
+from src.extractor.models.TextEdit import TextEdit
+from src.extractor.phone_number_extractor import extract_all_phone_numbers, reextract_all_phone_numbers, \
+    PHONE_NUMBER_REGEX, PHONE_NUMBER_EXTRACTOR_VERSION
+from src.extractor.postal_code_extractor import extract_all_postal_codes, reextract_all_postal_codes, \
+    POSTAL_CODE_REGEX, POSTAL_CODE_EXTRACTOR_VERSION
+from src.extractor.time_extractor import extract_all_times, reextract_all_times, TIME_REGEX, TIME_EXTRACTOR_VERSION
+from src.utils.normalization_utils import normalize_text
+
+# All kinds of data that can be extracted together, mapped to the function extracting them
+EXTRACTORS: Dict[str, Callable[[str], ExtractedList]] = {
+    "date": extract_all_dates,
+    "time": extract_all_times,
+    "postal_code": extract_all_postal_codes,
+    "phone_number": extract_all_phone_numbers,
+    "currency_amount": extract_all_currency_amounts,
+    "age": extract_all_ages
+}
+
+# The same kinds of data, mapped to the function extracting them again after an edit of the string
+REEXTRACTORS: Dict[str, Callable[[ExtractedList, str, TextEdit], ExtractedList]] = {
+    "date": reextract_all_dates,
+    "time": reextract_all_times,
+    "postal_code": reextract_all_postal_codes,
+    "phone_number": reextract_all_phone_numbers,
+    "currency_amount": reextract_all_currency_amounts,
+    "age": reextract_all_ages
+}
+
+# The regex of each kind, a new version of it invalidates the results of the kind in the result cache
+EXTRACTOR_REGEXES: Dict[str, LazyRegex] = {
+    "date": DATE_REGEX,
+    "time": TIME_REGEX,
+    "postal_code": POSTAL_CODE_REGEX,
+    "phone_number": PHONE_NUMBER_REGEX,
+    "currency_amount": CURRENCY_AMOUNT_REGEX,
+    "age": AGE_REGEX
+}
+
+# The version of the conversion of the matches of each kind to values, which the regex version does not cover.
+# A new version invalidates the results of the kind in the result cache as well.
+EXTRACTOR_VERSIONS: Dict[str, int] = {
+    "date": DATE_EXTRACTOR_VERSION,
+    "time": TIME_EXTRACTOR_VERSION,
+    "postal_code": POSTAL_CODE_EXTRACTOR_VERSION,
+    "phone_number": PHONE_NUMBER_EXTRACTOR_VERSION,
+    "currency_amount": CURRENCY_AMOUNT_EXTRACTOR_VERSION,
+    "age": AGE_EXTRACTOR_VERSION
+}
+
+
+def validate_kinds(kinds: Optional[Iterable[str]]) -> List[str]:
+    """
+    Validates the kinds of extractors requested
+    :param kinds: The kinds of extractors to run, or None for all of them
+    :return: A list of valid kinds, in the order they were requested
+    """
+    if kinds is None:
+        return list(EXTRACTORS.keys())
+
+    validated_kinds = list(kinds)
+    for kind in validated_kinds:
+        if kind not in EXTRACTORS:
+            raise ValueError(f"Unknown kind of extractor: {kind}")
+    return validated_kinds
+
+
+def extractor_version(kind: str) -> str:
+    """
+    Gives the version of an extractor, that changes whenever its regex or the conversion of its matches changes
+    :param kind: The kind of data extracted, a key of EXTRACTORS
+    :return: The version, used to invalidate the results of older versions in the result cache
+    """
+    return f"{EXTRACTOR_VERSIONS[kind]}:{EXTRACTOR_REGEXES[kind].version}"
+
+
+def extract_all(target_string: str, kinds: Optional[Iterable[str]] = None,
+                cache: Optional[ExtractionCache] = None, normalize: bool = False) -> Dict[str, ExtractedList]:
+    """
+    Extracts data of several kinds (date, time etc.) from the same string
+    :param target_string: String to extract data from
+    :param kinds: The kinds of data to extract, by default all kinds in EXTRACTORS
+    :param cache: Optional cache of results, the string is only searched for the kinds not found in the cache
+    :param normalize: Translate full-width characters to half-width before extracting (see normalize_text), so
+    for example "〒０１２－２３２１" is found as well. The spans are those of the original string, while the
+    extracted strings and values are those of the normalized string.
+    :return: A dictionary with the extracted list for each kind, identical to the corresponding extract_all_* result
+    """
+    if normalize:
+        normalized_text = normalize_text(target_string)
+        extracted_data = extract_all(target_string=normalized_text.text, kinds=kinds, cache=cache)
+        return {kind: normalized_text.restore_spans(extracted_list) for kind, extracted_list in extracted_data.items()}
+    if cache is None:
+        return {kind: EXTRACTORS[kind](target_string) for kind in validate_kinds(kinds)}
+    return {kind: cache.extract(kind=kind, version=extractor_version(kind), target_string=target_string,
+                                extract_function=EXTRACTORS[kind])
+            for kind in validate_kinds(kinds)}
+
+
+def reextract_all(previous_extracted_data: Dict[str, ExtractedList], previous_string: str,
+                  edit: TextEdit) -> Dict[str, ExtractedList]:
+    """
+    Extracts the same kinds of data as before from a string after an edit, only searching the text around the edit
+    :param previous_extracted_data: The result of extract_all (or reextract_all) on the string before the edit
+    :param previous_string: The string before the edit
+    :param edit: The edit made to the string
+    :return: A dictionary with the extracted list for each kind, identical to extract_all on the edited string
+    """
+    return {kind: REEXTRACTORS[kind](previous_extracted_data[kind], previous_string, edit)
+            for kind in validate_kinds(previous_extracted_data.keys())}
+
+
+def extract_all_by_paragraph(target_string: str, kinds: Optional[Iterable[str]] = None,
+                             paragraph_cache: Optional[Dict[Tuple[Tuple[str, ...], str],
+                                                            Dict[str, ExtractedList]]] = None
+                             ) -> Dict[str, ExtractedList]:
+    """
+    Extracts data of several kinds from the same string, but only searches each distinct paragraph (text between
+    newlines) once, which saves most of the work for texts repeating the same paragraphs (for example
+    the templates and navigation of Wikipedia pages).
+    The result is the same as extract_all as long as no match (including lookaround) crosses a newline.
+    :param target_string: String to extract data from
+    :param kinds: The kinds of data to extract, by default all kinds in EXTRACTORS
+    :param paragraph_cache: The data extracted from each paragraph seen before, pass the same dictionary for all
+    documents of a corpus to also skip the paragraphs they share. The data is stored by the kinds and the paragraph,
+    so the dictionary can be shared by calls extracting different kinds.
+    :return: A dictionary with the extracted list for each kind, identical to the extract_all result
+    """
+    validated_kinds = validate_kinds(kinds)
+    kinds_key = tuple(validated_kinds)
+    if paragraph_cache is None:
+        paragraph_cache = {}
+
+    paragraphs = target_string.split("\n")
+    new_paragraphs = [paragraph for paragraph in dict.fromkeys(paragraphs)
+                      if paragraph and (kinds_key, paragraph) not in paragraph_cache]
+    if new_paragraphs:
+        # The new paragraphs are searched together, as one text, and the matches are then sorted out by paragraph
+        paragraph_starts = list(itertools.accumulate([0] + [len(paragraph) + 1 for paragraph in new_paragraphs[:-1]]))
+        paragraph_data = [{kind: [] for kind in validated_kinds} for _ in new_paragraphs]
+        for kind, extracted_list in extract_all("\n".join(new_paragraphs), kinds=validated_kinds).items():
+            for (start, end), data in extracted_list:
+                index = bisect_right(paragraph_starts, start) - 1
+                paragraph_start = paragraph_starts[index]
+                paragraph_data[index][kind].append(((start - paragraph_start, end - paragraph_start), data))
+        paragraph_cache.update(zip([(kinds_key, paragraph) for paragraph in new_paragraphs], paragraph_data))
+
+    # The extracted data is copied, since the data of a paragraph is shared by all its occurrences
+    extracted_data = {kind: [] for kind in validated_kinds}
+    paragraph_start = 0
+    for paragraph in paragraphs:
+        if paragraph:
+            for kind, extracted_list in paragraph_cache[kinds_key, paragraph].items():
+                if extracted_list:
+                    extracted_data[kind].extend([((start + paragraph_start, end + paragraph_start), dict(data))
+                                                 for (start, end), data in extracted_list])
+        paragraph_start = paragraph_start + len(paragraph) + 1
+    return extracted_data
@@ -0,0 +1,52 @@
+from typing import Union, TextIO, Iterable, Iterator, List
+
+from src.extractor.constants import separators, prefixes, suffixes
+from src.extractor.models.ExtractedData import ExtractedList, ExtractedItem
+from src.extractor.models.ExtractedMatch import CurrencyAmountMatch
+from src.extractor.models.LazyRegex import LazyRegex
+from src.extractor.models.RegexHandler import RegexHandler
+from src.extractor.models.TextEdit import TextEdit
+from src.utils.conversion_utils import parse_currency_amount
+from src.utils.number_conversion_utils import japanese_container_dict
+
+CURRENCY_AMOUNT_REGEX = LazyRegex(
+    "currency_amount.regexp",
+    prefix_currency_amount=prefixes["currency"],
+    suffix_currency_amount=suffixes["currency"],
+    japanese_number_any=japanese_container_dict["all_numbers"],
+    seperator_currency_amount=separators["comma"],
+    japanese_number_digit=japanese_container_dict["1to9"],
+    japanese_number_zero=japanese_container_dict["0"],
+    japanese_number_unit=japanese_container_dict["numbers_units"],
+    japanese_number_multiplier=japanese_container_dict["numbers_multipliers"]
+)
+CURRENCY_AMOUNT_REGEX_IDENTIFIERS = {
+    "currency_amount_string": lambda raw_value: raw_value,
+    "currency_amount_value": parse_currency_amount
+}
+# Increase whenever the matches are converted to values differently
+CURRENCY_AMOUNT_EXTRACTOR_VERSION = 2
+# Amounts can have any number of digits (1,000,000,000円), so no length bounds a match
+# and the whole string is searched again after an edit
+CURRENCY_AMOUNT_REGEX_HANDLER = RegexHandler(compiled_regex=CURRENCY_AMOUNT_REGEX,
+                                             regex_identifiers=CURRENCY_AMOUNT_REGEX_IDENTIFIERS,
+                                             max_match_length=None)
+
+
+def extract_all_currency_amounts(target_string: str) -> ExtractedList:
+    return CURRENCY_AMOUNT_REGEX_HANDLER.search_string(target_string=target_string)
+
+
+def reextract_all_currency_amounts(previous_extracted_list: ExtractedList, previous_string: str,
+                                   edit: TextEdit) -> ExtractedList:
+    return CURRENCY_AMOUNT_REGEX_HANDLER.search_edited_string(previous_extracted_list=previous_extracted_list,
+                                                              previous_string=previous_string, edit=edit)
+
+
+def extract_all_currency_amount_matches(target_string: str) -> List[CurrencyAmountMatch]:
+    return CURRENCY_AMOUNT_REGEX_HANDLER.search_records(target_string=target_string,
+                                                        record_factory=CurrencyAmountMatch)
+
+
+def iter_extract_all_currency_amounts(stream: Union[TextIO, Iterable[str]]) -> Iterator[ExtractedItem]:
+    return CURRENCY_AMOUNT_REGEX_HANDLER.iter_search(stream=stream)
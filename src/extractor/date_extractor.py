@@ -1,19 +1,20 @@
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Union, TextIO, Iterable, Iterator, List
 
 import regex
 
 from src.extractor.constants import separators, prefixes, suffixes
 from src.extractor.models.ComplexDate import ComplexDate
 from src.extractor.models.DateValue import Year, Month, Day
-from src.extractor.models.ExtractedData import ExtractedList, ExtractedDataPosition, ExtractedData
+from src.extractor.models.ExtractedData import ExtractedList, ExtractedDataPosition, ExtractedData, ExtractedItem
+from src.extractor.models.ExtractedMatch import DateMatch
+from src.extractor.models.LazyRegex import LazyRegex
 from src.extractor.models.RegexHandler import RegexHandler
+from src.extractor.models.TextEdit import TextEdit
 from src.utils.conversion_utils import parse_year, parse_month, parse_day
-from src.utils.io_utils import load_regex
 from src.utils.number_conversion_utils import japanese_container_dict
 
-DATE_REGEX_STRING = load_regex(regex_file_name="date.regexp")
-DATE_REGEX = regex.compile(
-    DATE_REGEX_STRING,
+DATE_REGEX = LazyRegex(
+    "date.regexp",
     prefix_relative_year=prefixes["date_relative_year"],
     prefix_relative_month=prefixes["date_relative_month"],
     prefix_japanese_year_names=prefixes["date_japanese_year"],
@@ -42,6 +43,17 @@ DATE_REGEX_IDENTIFIERS = {
     "date_month": parse_month,
     "date_day": parse_day
 }
+# Increase whenever the matches are converted to values differently
+DATE_EXTRACTOR_VERSION = 1
+# Every date contains a digit, or a kanji number directly followed by 日, and is far shorter than the maximum length
+DATE_ANCHOR_REGEX = regex.compile(r"\d+|\L<kanji_0to1000>\L<suffix_day>",
+                                  kanji_0to1000=japanese_container_dict["0to1000"],
+                                  suffix_day=suffixes["date_japanese_day"])
+DATE_MAX_MATCH_LENGTH = 32
+DATE_REGEX_HANDLER = RegexHandler(compiled_regex=DATE_REGEX,
+                                  regex_identifiers=DATE_REGEX_IDENTIFIERS,
+                                  anchor_regex=DATE_ANCHOR_REGEX,
+                                  max_match_length=DATE_MAX_MATCH_LENGTH)
 
 
 def date_post_processing(extracted_data: Tuple[ExtractedDataPosition, ExtractedData]):
@@ -62,6 +74,19 @@ def date_post_processing(extracted_data: Tuple[ExtractedDataPosition, ExtractedD
 
 
 def extract_all_dates(target_string: str) -> ExtractedList:
-    extractor = RegexHandler(compiled_regex=DATE_REGEX,
-                             regex_identifiers=DATE_REGEX_IDENTIFIERS)
-    return extractor.search_string(target_string=target_string, post_process=date_post_processing)
+    return DATE_REGEX_HANDLER.search_string(target_string=target_string, post_process=date_post_processing)
+
+
+def reextract_all_dates(previous_extracted_list: ExtractedList, previous_string: str,
+                        edit: TextEdit) -> ExtractedList:
+    return DATE_REGEX_HANDLER.search_edited_string(previous_extracted_list=previous_extracted_list,
+                                                   previous_string=previous_string, edit=edit,
+                                                   post_process=date_post_processing)
+
+
+def extract_all_date_matches(target_string: str) -> List[DateMatch]:
+    return DATE_REGEX_HANDLER.search_records(target_string=target_string, record_factory=DateMatch.from_groups)
+
+
+def iter_extract_all_dates(stream: Union[TextIO, Iterable[str]]) -> Iterator[ExtractedItem]:
+    return DATE_REGEX_HANDLER.iter_search(stream=stream, post_process=date_post_processing)
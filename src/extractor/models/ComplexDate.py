@@ -1,12 +1,11 @@
 from datetime import date
 from typing import Optional
 
-from dateutil.relativedelta import relativedelta
-
 from .DateValue import Year, Month, Day
 
 
 class ComplexDate:
+    __slots__ = ("year", "month", "day")
 
     def __init__(self, year: Optional[Year], month: Optional[Month], day: Optional[Day]):
         self.year = year
@@ -36,6 +35,8 @@ class ComplexDate:
         return False
 
     def to_dateutil_date(self, relative_to: Optional[date] = date.today()) -> date:
+        # dateutil is only needed here, so it is not imported together with the extractors
+        from dateutil.relativedelta import relativedelta
 
         if self.day:
             if self.day.is_relative():
@@ -12,6 +12,7 @@ class DateValue(ABC):
     """
     This model represents a date value, either relative or absolute.
     """
+    __slots__ = ("value", "type")
 
     def __init__(self, value: int, type: DateValueType):
         self.value = value
@@ -33,15 +34,21 @@ class DateValue(ABC):
 
 
 class Year(DateValue):
+    __slots__ = ()
+
     def __eq__(self, other: Optional['Year']) -> bool:
         return DateValue.compare(self, other)
 
 
 class Month(DateValue):
+    __slots__ = ()
+
     def __eq__(self, other: Optional['Month']) -> bool:
         return DateValue.compare(self, other)
 
 
 class Day(DateValue):
+    __slots__ = ()
+
     def __eq__(self, other: Optional['Day']) -> bool:
         return DateValue.compare(self, other)
@@ -6,4 +6,5 @@ from src.extractor.models.PostalCode import PostalCode
 ExtractedDataType = Any #TypeVar('T', int, str, datetime, PostalCode)
 ExtractedData = Dict[str, ExtractedDataType]
 ExtractedDataPosition = Tuple[int, int]
-ExtractedList = List[Tuple[ExtractedDataPosition, ExtractedData]]
\ No newline at end of file
+ExtractedItem = Tuple[ExtractedDataPosition, ExtractedData]
+ExtractedList = List[ExtractedItem]
@@ -0,0 +1,76 @@
+from typing import NamedTuple, Optional, Iterable, Any
+
+from src.extractor.models.ComplexDate import ComplexDate
+from src.extractor.models.DateValue import Year, Month, Day
+from src.extractor.models.ExtractedData import ExtractedDataPosition, ExtractedItem, ExtractedList
+from src.extractor.models.PostalCode import PostalCode
+from src.extractor.models.TimeDecorator import TimeDecorator
+
+# Compact records of extracted matches, one type per kind of extractor.
+# The first field is always the span of the match, the other fields are named after the capture groups of the regex
+# (in the same order as the regex identifiers), followed by any fields added in post processing.
+
+
+class DateMatch(NamedTuple):
+    span: ExtractedDataPosition
+    date_string: str
+    date_year: Optional[Year]
+    date_month: Optional[Month]
+    date_day: Optional[Day]
+    date: ComplexDate
+
+    @classmethod
+    def from_groups(cls, span: ExtractedDataPosition, date_string: str, date_year: Optional[Year],
+                    date_month: Optional[Month], date_day: Optional[Day]) -> 'DateMatch':
+        return cls(span, date_string, date_year, date_month, date_day,
+                   ComplexDate(year=date_year, month=date_month, day=date_day))
+
+
+class TimeMatch(NamedTuple):
+    span: ExtractedDataPosition
+    time_string: str
+    time_decorator: Optional[TimeDecorator]
+    time_hour: int
+    time_minute: Optional[int]
+
+
+class PostalCodeMatch(NamedTuple):
+    span: ExtractedDataPosition
+    postal_code_string: str
+    postal_code_value: PostalCode
+
+
+class PhoneNumberMatch(NamedTuple):
+    span: ExtractedDataPosition
+    phone_number_string: str
+    phone_number_value: str
+
+
+class CurrencyAmountMatch(NamedTuple):
+    span: ExtractedDataPosition
+    currency_amount_string: str
+    currency_amount_value: int
+
+
+class AgeMatch(NamedTuple):
+    span: ExtractedDataPosition
+    age_string: str
+    age_value: int
+
+
+def to_extracted_item(record: Any) -> ExtractedItem:
+    """
+    Converts a match record to the dictionary based representation returned by the extract_all_* functions
+    :param record: Any of the match records (DateMatch etc.)
+    :return: A tuple with the position of the match and a dictionary with the extracted data
+    """
+    return record[0], dict(zip(record._fields[1:], record[1:]))
+
+
+def to_extracted_list(records: Iterable[Any]) -> ExtractedList:
+    """
+    Converts match records to the dictionary based representation returned by the extract_all_* functions
+    :param records: Any of the match records (DateMatch etc.)
+    :return: A list of tuples with the position of each match and a dictionary with the extracted data
+    """
+    return [to_extracted_item(record) for record in records]
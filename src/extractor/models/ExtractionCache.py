@@ -0,0 +1,159 @@
+import pickle
+import sqlite3
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import Lock
+from typing import NamedTuple, Optional, Callable, Tuple
+
+from src.extractor.models.ExtractedData import ExtractedList
+
+# Default number of results kept in memory
+DEFAULT_CACHE_SIZE = 1024
+
+
+class ExtractionCacheInfo(NamedTuple):
+    """
+    Container tuple for the statistics of an ExtractionCache
+    """
+    hits: int
+    misses: int
+    disk_hits: int  # Hits that were found on disk but not in memory, included in hits
+    invalidations: int  # Results found for an older version of the extractor, counted as misses
+    currsize: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ExtractionCache:
+    """
+    This object caches extracted data by the content of the text, so texts seen before are not searched again.
+    Results are stored by the kind of data and a hash of the text, together with the version of the extractor
+    (see combined_extractor.extractor_version). A result stored by another version is never returned, but replaced.
+    The most recently used results are kept in memory, and optionally all results are stored in an sqlite file.
+    Results are stored pickled, so each lookup returns a new copy that can be changed freely.
+    The file is read with pickle, so only use files written by this cache.
+    The cache can be shared between threads.
+    """
+    __slots__ = ("_maxsize", "_memory", "_connection", "_lock",
+                 "_hits", "_misses", "_disk_hits", "_invalidations")
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE, path: Optional[str] = None) -> None:
+        """
+        :param maxsize: Number of results kept in memory, 0 to only use the file
+        :param path: Path to an sqlite file storing all results, by default results are only kept in memory
+        """
+        if maxsize < 0:
+            raise ValueError(f"The size of the cache can not be negative: {maxsize}")
+        self._maxsize = maxsize
+        self._memory: 'OrderedDict[Tuple[str, bytes], Tuple[str, bytes]]' = OrderedDict()
+        self._connection: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            self._connection.execute("CREATE TABLE IF NOT EXISTS extraction_results "
+                                     "(kind TEXT, text_hash BLOB, version TEXT, result BLOB, "
+                                     "PRIMARY KEY (kind, text_hash))")
+            self._connection.commit()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._disk_hits = 0
+        self._invalidations = 0
+
+    def extract(self, kind: str, version: str, target_string: str,
+                extract_function: Callable[[str], ExtractedList]) -> ExtractedList:
+        """
+        Returns the cached result for the text, or extracts and stores it
+        :param kind: The kind of data extracted, for example "date"
+        :param version: The version of the extractor
+        :param target_string: String to extract data from
+        :param extract_function: Extracts the data from the string when there is no cached result
+        :return: The extracted data
+        """
+        key = (kind, blake2b(target_string.encode("utf-8", "surrogatepass"), digest_size=16).digest())
+        pickled_result = self._load(key, version)
+        if pickled_result is not None:
+            return pickle.loads(pickled_result)
+
+        extracted_list = extract_function(target_string)
+        self._store(key, version, pickle.dumps(extracted_list, protocol=pickle.HIGHEST_PROTOCOL))
+        return extracted_list
+
+    def _load(self, key: Tuple[str, bytes], version: str) -> Optional[bytes]:
+        with self._lock:
+            stored_version, pickled_result = self._memory.get(key, (None, None))
+            if stored_version == version:
+                self._memory.move_to_end(key, last=True)
+            elif stored_version is None and self._connection is not None:
+                row = self._connection.execute("SELECT version, result FROM extraction_results "
+                                               "WHERE kind = ? AND text_hash = ?", key).fetchone()
+                if row is not None:
+                    stored_version, pickled_result = row
+                    if stored_version == version:
+                        self._disk_hits = self._disk_hits + 1
+                        self._remember(key, version, pickled_result)
+
+            if stored_version == version:
+                self._hits = self._hits + 1
+                return pickled_result
+
+            if stored_version is not None:
+                self._invalidations = self._invalidations + 1
+            self._misses = self._misses + 1
+            return None
+
+    def _store(self, key: Tuple[str, bytes], version: str, pickled_result: bytes) -> None:
+        with self._lock:
+            self._remember(key, version, pickled_result)
+            if self._connection is not None:
+                self._connection.execute("INSERT OR REPLACE INTO extraction_results VALUES (?, ?, ?, ?)",
+                                         (*key, version, pickled_result))
+                self._connection.commit()
+
+    def _remember(self, key: Tuple[str, bytes], version: str, pickled_result: bytes) -> None:
+        # Keeps the result in memory, dropping the least recently used results
+        if self._maxsize == 0:
+            return
+        self._memory[key] = (version, pickled_result)
+        self._memory.move_to_end(key, last=True)
+        while len(self._memory) > self._maxsize:
+            self._memory.popitem(last=False)
+
+    def cache_info(self) -> ExtractionCacheInfo:
+        """
+        Statistics of the cache, like cache_info of functools.lru_cache
+        :return: The number of hits and misses, and the number of results in memory
+        """
+        with self._lock:
+            return ExtractionCacheInfo(hits=self._hits, misses=self._misses, disk_hits=self._disk_hits,
+                                       invalidations=self._invalidations, currsize=len(self._memory),
+                                       maxsize=self._maxsize)
+
+    def clear(self) -> None:
+        """
+        Removes all results, from memory and from the file, and resets the statistics
+        """
+        with self._lock:
+            self._memory.clear()
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM extraction_results")
+                self._connection.commit()
+            self._hits = self._misses = self._disk_hits = self._invalidations = 0
+
+    def close(self) -> None:
+        """
+        Closes the file of the cache, if any. The results in memory can still be used.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __enter__(self) -> 'ExtractionCache':
+        return self
+
+    def __exit__(self, *exception_info) -> None:
+        self.close()
@@ -0,0 +1,48 @@
+from threading import Lock
+from typing import Dict, Iterable, Optional, Pattern, Any
+
+from src.utils.io_utils import load_regex
+from src.utils.regex_utils import compile_regex, compiled_regex_cache_key
+
+
+class LazyRegex:
+    """
+    This object represents a regex stored in a .regexp file that is only loaded and compiled when first used.
+    It can be used in place of the compiled regex, all attributes (finditer, pattern etc.) are forwarded to it.
+    """
+    __slots__ = ("_regex_file_name", "_named_lists", "_compiled_regex", "_version", "_lock")
+
+    def __init__(self, regex_file_name: str, **named_lists: Iterable[str]) -> None:
+        self._regex_file_name = regex_file_name
+        self._named_lists: Dict[str, Iterable[str]] = named_lists
+        self._compiled_regex: Optional[Pattern] = None
+        self._version: Optional[str] = None
+        self._lock = Lock()
+
+    @property
+    def compiled_regex(self) -> Pattern:
+        compiled_regex = self._compiled_regex
+        if compiled_regex is None:
+            with self._lock:
+                if self._compiled_regex is None:
+                    self._compiled_regex = compile_regex(regex_string=load_regex(regex_file_name=self._regex_file_name),
+                                                         named_lists=self._named_lists)
+                compiled_regex = self._compiled_regex
+        return compiled_regex
+
+    @property
+    def version(self) -> str:
+        """
+        :return: A hash of the regex file and the named lists, that changes whenever the regex matches differently
+        """
+        if self._version is None:
+            self._version = compiled_regex_cache_key(regex_string=load_regex(regex_file_name=self._regex_file_name),
+                                                     named_lists=self._named_lists)
+        return self._version
+
+    @property
+    def is_compiled(self) -> bool:
+        return self._compiled_regex is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.compiled_regex, name)
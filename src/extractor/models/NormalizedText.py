@@ -0,0 +1,56 @@
+from array import array
+from bisect import bisect_right
+
+from src.extractor.models.ExtractedData import ExtractedDataPosition, ExtractedList
+
+
+class NormalizedText:
+    """
+    This model represents a text after normalization (see normalization_utils.normalize_text), together with
+    a map from positions in the normalized text back to positions in the original text.
+    Normalization translates characters one to one or deletes them, so the map only contains the runs of
+    deleted characters: the position of each run in the normalized text and the number of characters deleted
+    up to and including the run.
+    """
+    __slots__ = ("original_text", "text", "_deletion_positions", "_deleted_counts")
+
+    def __init__(self, original_text: str, text: str, deletion_positions: array, deleted_counts: array):
+        self.original_text = original_text
+        self.text = text
+        self._deletion_positions = deletion_positions
+        self._deleted_counts = deleted_counts
+
+    def __str__(self):
+        return self.text
+
+    def original_position(self, position: int) -> int:
+        """
+        Maps the position of a character in the normalized text to its position in the original text
+        :param position: Position in the normalized text
+        :return: Position in the original text
+        """
+        index = bisect_right(self._deletion_positions, position)
+        if index == 0:
+            return position
+        return position + self._deleted_counts[index - 1]
+
+    def original_span(self, span: ExtractedDataPosition) -> ExtractedDataPosition:
+        """
+        Maps a span in the normalized text to the span of the same characters in the original text.
+        Deleted characters directly after the span are not included.
+        :param span: Start and end of a span in the normalized text
+        :return: Start and end of the span in the original text
+        """
+        start, end = span
+        if end <= start:
+            original_start = self.original_position(start)
+            return original_start, original_start
+        return self.original_position(start), self.original_position(end - 1) + 1
+
+    def restore_spans(self, extracted_list: ExtractedList) -> ExtractedList:
+        """
+        Maps the spans of data extracted from the normalized text to spans in the original text
+        :param extracted_list: Data extracted from the normalized text
+        :return: The same data with the spans of the original text
+        """
+        return [(self.original_span(span), extracted_data) for span, extracted_data in extracted_list]
@@ -11,6 +11,7 @@ class PostalCode:
     the next two for a neighborhood and the last two for a street in a city (408-0301 to 408-0307 for the Mukawa-cho neighborhood in Hokuto).
     Source: Wikipedia, https://en.wikipedia.org/wiki/Postal_codes_in_Japan
     """
+    __slots__ = ("prefecture_id", "city_id", "neighborhood_id", "street_id")
 
     def __init__(self, postal_code: str):
         self.validate_postal_code(postal_code)
@@ -1,39 +1,232 @@
-from typing import Tuple, List, Pattern, Dict, Callable
-from src.extractor.models.ExtractedData import ExtractedList
+import itertools
+from types import MappingProxyType
+from typing import Tuple, List, Pattern, Dict, Callable, Mapping, Iterable, Iterator, TextIO, Union, Match, TypeVar, \
+    Optional
+from src.extractor.models.ExtractedData import ExtractedList, ExtractedItem
+from src.extractor.models.StreamWindow import StreamWindow
+from src.extractor.models.TextEdit import TextEdit
+
+# Default size of the chunks read from file objects when streaming
+DEFAULT_STREAM_CHUNK_SIZE = 65536
+# Default number of characters kept between chunks when streaming, must be longer than any match (and its lookaround)
+DEFAULT_STREAM_OVERLAP = 256
+
+MatchRecord = TypeVar('MatchRecord')
 
 
 class RegexHandler:
     """
-    This object contains precompiled regexes, search results and other related data.
+    This object contains a precompiled regex and the conversions of its capture groups.
     This contains:
     - A precompiled regular expression
     - A dictionary of mappings with conversions from the various fields in the regular expression
+    - Optionally the maximum length of a match, that allows searching only the text around an edit again
+    - Optionally a cheap anchor regex, that finds the characters every match must contain (requires the
+      maximum length of a match). The full regex is then only run on the text around the anchors.
+    The handler keeps no state between searches, so a single instance can be shared between calls and threads.
     """
+    __slots__ = ("_compiled_regex", "_regex_identifiers", "_anchor_regex", "_max_match_length")
 
     def __init__(self, compiled_regex: Pattern,
-                 regex_identifiers: Dict[str, Callable[[Tuple[str, str]], ExtractedList]]) -> None:
+                 regex_identifiers: Dict[str, Callable[[Tuple[str, str]], ExtractedList]],
+                 anchor_regex: Optional[Pattern] = None,
+                 max_match_length: Optional[int] = None) -> None:
         if compiled_regex is None or regex_identifiers is None:
             raise ValueError("Tried to save an empty regex or identifier list to a RegexHandler!")
-        self._regex_identifiers = regex_identifiers  # A list of identifiers in the regex
+        if anchor_regex is not None and (max_match_length is None or max_match_length < 1):
+            raise ValueError("An anchor regex requires the maximum length of a match to be set!")
+        self._regex_identifiers = MappingProxyType(dict(regex_identifiers))  # A read-only copy of the identifiers
         self._compiled_regex = compiled_regex
-        self._result_stored_list = []  # List of match objects
-        self._loaded_string = ""
+        self._anchor_regex = anchor_regex
+        self._max_match_length = max_match_length
+
+    @property
+    def compiled_regex(self) -> Pattern:
+        return self._compiled_regex
+
+    @property
+    def regex_identifiers(self) -> Mapping[str, Callable]:
+        return self._regex_identifiers
+
+    @property
+    def anchor_regex(self) -> Optional[Pattern]:
+        return self._anchor_regex
+
+    @property
+    def max_match_length(self) -> Optional[int]:
+        return self._max_match_length
+
+    def finditer(self, target_string: str) -> Iterator[Match]:
+        """
+        Finds all matches of the regex in the input string, the same as finditer of the compiled regex.
+        If the handler has an anchor regex, only the windows of text around anchors are searched.
+        :param target_string: String to search
+        :return: An iterator of the matches
+        """
+        if self._anchor_regex is None:
+            return self._compiled_regex.finditer(target_string)
+        return self._finditer_around_anchors(target_string)
+
+    def _finditer_around_anchors(self, target_string: str) -> Iterator[Match]:
+        # Every match contains an anchor and is at most max_match_length long (including lookahead),
+        # so it lies within max_match_length characters of the anchor. Overlapping windows are merged,
+        # thus no match crosses the border of a window and each window can be searched on its own.
+        # Windows closer than max_match_length are merged as well, since starting a new search costs more.
+        # The search of a window may look max_match_length past its end, like the search of the full string would.
+        max_match_length = self._max_match_length
+        window_start = window_end = None
+        for anchor in self._anchor_regex.finditer(target_string):
+            anchor_start, anchor_end = anchor.span()
+            if window_end is not None and anchor_start - 2 * max_match_length <= window_end:
+                window_end = anchor_end + max_match_length
+                continue
+            if window_end is not None:
+                yield from self._search_window(target_string, window_start, window_end)
+            window_start = max(0, anchor_start - max_match_length)
+            window_end = anchor_end + max_match_length
+        if window_end is not None:
+            yield from self._search_window(target_string, window_start, window_end)
+
+    def _search_window(self, target_string: str, window_start: int, window_end: int) -> Iterator[Match]:
+        search_end = min(len(target_string), window_end + self._max_match_length)
+        for match in self._compiled_regex.finditer(target_string, window_start, search_end):
+            if match.start() >= window_end:
+                break
+            yield match
 
     def search_string(self, target_string: str, post_process: Callable = None) -> ExtractedList:
         """
-        Ensures that all results up to the input order is stored in the object.
+        Extracts and converts all matches of the regex in the input string.
         :param target_string String to extract data from
+        :param post_process Optional function applied to each extracted match
         """
-        extracted_data = []
-        for match in self._compiled_regex.finditer(target_string):
-            capture_groups = match.groupdict()
-            regex_span = match.span()
-            capture_data = {}
-            for key, value in capture_groups.items():
-                capture_data[key] = self._regex_identifiers[key](value)
-            extracted_data.append((regex_span, capture_data))
+        extracted_data = [self.extract_match(match) for match in self.finditer(target_string)]
 
         if post_process:
             extracted_data = [post_process(data) for data in extracted_data]
 
         return extracted_data
+
+    def search_edited_string(self, previous_extracted_list: ExtractedList, previous_string: str, edit: TextEdit,
+                             post_process: Callable = None) -> ExtractedList:
+        """
+        Extracts and converts all matches of the regex in a string after an edit, reusing the data extracted
+        from the string before the edit. Only the text around the edit is searched again, the data before it is
+        kept as it is and the spans of the data after it are shifted (the extracted data itself is shared).
+        The result is the same as search_string on the edited string as long as no match (including lookaround)
+        is longer than max_match_length. Without max_match_length the whole edited string is searched.
+        :param previous_extracted_list: The result of search_string on the string before the edit
+        :param previous_string: The string before the edit
+        :param edit: The edit made to the string
+        :param post_process: Optional function applied to each extracted match, the same as for the previous result
+        :return: The extracted data of the edited string
+        """
+        target_string = edit.apply(previous_string)
+        max_match_length = self._max_match_length
+        if max_match_length is None:
+            return self.search_string(target_string=target_string, post_process=post_process)
+
+        # Matches starting max_match_length before the edit did not see the edited text, so they stay the same.
+        # The search continues where they left off, or where the text could have made a difference.
+        kept_count = _count_starting_before(previous_extracted_list, edit.offset - max_match_length)
+        search_start = max(0, edit.offset - max_match_length)
+        if kept_count:
+            search_start = max(search_start, previous_extracted_list[kept_count - 1][0][1])
+
+        # Once the search reaches a position max_match_length after the edit, and neither the new nor the previous
+        # matches cross that position, the search continues exactly like it did before the edit.
+        # While a match crosses it the position is moved to the end of the match.
+        shift = edit.shift
+        resync_position = edit.offset + len(edit.inserted_text) + max_match_length
+        while True:
+            matches = list(self._search_window(target_string, search_start, resync_position))
+            previous_count = _count_starting_before(previous_extracted_list, resync_position - shift, kept_count)
+            crossing_end = resync_position
+            if matches:
+                crossing_end = max(crossing_end, matches[-1].end())
+            if previous_count > kept_count:
+                crossing_end = max(crossing_end, previous_extracted_list[previous_count - 1][0][1] + shift)
+            if crossing_end == resync_position:
+                break
+            resync_position = crossing_end
+
+        extracted_data = [self.extract_match(match) for match in matches]
+        if post_process:
+            extracted_data = [post_process(data) for data in extracted_data]
+
+        return previous_extracted_list[:kept_count] + extracted_data + \
+            [((start + shift, end + shift), data) for (start, end), data in previous_extracted_list[previous_count:]]
+
+    def search_records(self, target_string: str,
+                       record_factory: Callable[..., MatchRecord]) -> List[MatchRecord]:
+        """
+        Extracts and converts all matches of the regex in the input string into compact records.
+        Unlike search_string, no dictionary is created for each match.
+        :param target_string: String to extract data from
+        :param record_factory: Called with the span and the converted capture groups, in the order of the identifiers
+        :return: A list with a record for each match
+        """
+        group_names = tuple(self._regex_identifiers.keys())
+        converters = tuple(self._regex_identifiers.values())
+        if len(group_names) == 1:
+            # Match.group returns a single value instead of a tuple when called with one group
+            converter = converters[0]
+            return [record_factory(match.span(), converter(match.group(group_names[0])))
+                    for match in self.finditer(target_string)]
+
+        records = []
+        for match in self.finditer(target_string):
+            values = match.group(*group_names)
+            records.append(record_factory(match.span(),
+                                          *[converter(value) for converter, value in zip(converters, values)]))
+        return records
+
+    def iter_search(self, stream: Union[TextIO, Iterable[str]], post_process: Callable = None,
+                    overlap: int = DEFAULT_STREAM_OVERLAP,
+                    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> Iterator[ExtractedItem]:
+        """
+        Extracts and converts all matches of the regex from a stream of text, yielding each match as soon as it is found.
+        The result is the same as search_string on the concatenated text, but only the current chunk and
+        an overlap window of the previous text is kept in memory.
+        :param stream: A text file object or an iterable of text chunks
+        :param post_process: Optional function applied to each extracted match
+        :param overlap: Number of characters kept between chunks, must be longer than any match including lookaround
+        :param chunk_size: Number of characters read at a time when the stream is a file object
+        :return: An iterator of the extracted data, with positions relative to the start of the stream
+        """
+        if hasattr(stream, "read"):
+            chunks = iter(lambda: stream.read(chunk_size), "")
+        else:
+            chunks = iter(stream)
+
+        stream_window = StreamWindow(overlap=overlap)
+        for chunk in itertools.chain(chunks, [None]):
+            for match, offset in stream_window.search(compiled_regex=self._compiled_regex, chunk=chunk):
+                extracted_data = self.extract_match(match, offset=offset)
+                yield post_process(extracted_data) if post_process else extracted_data
+
+    def extract_match(self, match: Match, offset: int = 0) -> ExtractedItem:
+        """
+        Converts a single match of the regex
+        :param match: A match of the regex of this handler
+        :param offset: Added to the span of the match, for matches found in a part of a longer text
+        :return: A tuple with the position of the match and the extracted data
+        """
+        regex_identifiers = self._regex_identifiers
+        capture_data = {}
+        for key, value in match.groupdict().items():
+            capture_data[key] = regex_identifiers[key](value)
+        start, end = match.span()
+        return (start + offset, end + offset), capture_data
+
+
+def _count_starting_before(extracted_list: ExtractedList, position: int, low: int = 0) -> int:
+    # Binary search for the number of extracted items (sorted by position) that start before the position
+    high = len(extracted_list)
+    while low < high:
+        middle = (low + high) // 2
+        if extracted_list[middle][0][0] < position:
+            low = middle + 1
+        else:
+            high = middle
+    return low
@@ -0,0 +1,48 @@
+from typing import Optional, Pattern, Iterator, Tuple, Match
+
+
+class StreamWindow:
+    """
+    This object holds the part of a text stream that is kept in memory while searching it chunk by chunk.
+    Matches are only returned once they are followed by at least the overlap of text,
+    so they are the same as when searching the full text, as long as no match (including lookaround)
+    is longer than the overlap. The overlap before the search position is kept as context for lookbehinds.
+    """
+    __slots__ = ("_overlap", "_buffer", "_buffer_offset", "_scan_position")
+
+    def __init__(self, overlap: int) -> None:
+        if overlap < 1:
+            raise ValueError(f"The overlap must be at least one character: {overlap}")
+        self._overlap = overlap
+        self._buffer = ""  # The text currently kept in memory
+        self._buffer_offset = 0  # Position of the start of the buffer in the stream
+        self._scan_position = 0  # Position in the buffer from where the search continues
+
+    def search(self, compiled_regex: Pattern, chunk: Optional[str]) -> Iterator[Tuple[Match, int]]:
+        """
+        Adds a chunk of text to the window and searches the part of it that can no longer change.
+        The returned iterator needs to be consumed before the next chunk is added.
+        :param compiled_regex: The regex to search with
+        :param chunk: The next chunk of text, or None at the end of the stream
+        :return: An iterator of the matches together with the offset of the window in the stream
+        """
+        end_of_stream = chunk is None
+        if not end_of_stream:
+            self._buffer = self._buffer + chunk
+
+        # Matches starting before the limit are followed by enough text to be the same as in the full text
+        limit = len(self._buffer) if end_of_stream else len(self._buffer) - self._overlap
+        if limit <= self._scan_position:
+            return
+
+        for match in compiled_regex.finditer(self._buffer, pos=self._scan_position):
+            if match.start() >= limit:
+                break
+            self._scan_position = match.end()
+            yield match, self._buffer_offset
+
+        self._scan_position = max(self._scan_position, limit)
+        cut_position = max(0, self._scan_position - self._overlap)
+        self._buffer = self._buffer[cut_position:]
+        self._buffer_offset = self._buffer_offset + cut_position
+        self._scan_position = self._scan_position - cut_position
@@ -0,0 +1,28 @@
+from typing import NamedTuple
+
+
+class TextEdit(NamedTuple):
+    """
+    Container tuple for a single edit of a text: deleted_length characters are removed at offset
+    and inserted_text is inserted in their place
+    """
+    offset: int
+    deleted_length: int
+    inserted_text: str
+
+    @property
+    def shift(self) -> int:
+        """
+        :return: How far the text after the edit moves, negative if the edit made the text shorter
+        """
+        return len(self.inserted_text) - self.deleted_length
+
+    def apply(self, text: str) -> str:
+        """
+        Applies the edit to a text
+        :param text: The text before the edit
+        :return: The text after the edit
+        """
+        if self.offset < 0 or self.deleted_length < 0 or self.offset + self.deleted_length > len(text):
+            raise ValueError(f"The edit is outside of the text of length {len(text)}: {self}")
+        return text[:self.offset] + self.inserted_text + text[self.offset + self.deleted_length:]
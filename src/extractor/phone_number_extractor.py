@@ -1,14 +1,15 @@
-import regex
+from typing import Union, TextIO, Iterable, Iterator, List
 
 from src.extractor.constants import separators
-from src.extractor.models.ExtractedData import ExtractedList
+from src.extractor.models.ExtractedData import ExtractedList, ExtractedItem
+from src.extractor.models.ExtractedMatch import PhoneNumberMatch
+from src.extractor.models.LazyRegex import LazyRegex
 from src.extractor.models.RegexHandler import RegexHandler
+from src.extractor.models.TextEdit import TextEdit
 from src.utils.conversion_utils import parse_phone_number
-from src.utils.io_utils import load_regex
 
-PHONE_NUMBER_REGEX_STRING = load_regex(regex_file_name="postal_code.regexp")
-PHONE_NUMBER_REGEX = regex.compile(
-    PHONE_NUMBER_REGEX_STRING,
+PHONE_NUMBER_REGEX = LazyRegex(
+    "phone_number.regexp",
     seperator_phone_number=separators["dash"] + separators["blank"],
     # Seperator: Dash & Blanks
     seperator_space=separators["blank"],  # Seperator: Blanks
@@ -19,9 +20,28 @@ PHONE_NUMBER_REGEX_IDENTIFIERS = {
     "phone_number_string": lambda raw_value: raw_value,
     "phone_number_value": parse_phone_number
 }
+# Increase whenever the matches are converted to values differently
+PHONE_NUMBER_EXTRACTOR_VERSION = 1
+# Phone numbers can have any number of blanks between their parts, so no length bounds a match
+# and the whole string is searched again after an edit
+PHONE_NUMBER_REGEX_HANDLER = RegexHandler(compiled_regex=PHONE_NUMBER_REGEX,
+                                          regex_identifiers=PHONE_NUMBER_REGEX_IDENTIFIERS,
+                                          max_match_length=None)
 
 
 def extract_all_phone_numbers(target_string: str) -> ExtractedList:
-    extractor = RegexHandler(compiled_regex=PHONE_NUMBER_REGEX,
-                             regex_identifiers=PHONE_NUMBER_REGEX_IDENTIFIERS)
-    return extractor.search_string(target_string=target_string)
+    return PHONE_NUMBER_REGEX_HANDLER.search_string(target_string=target_string)
+
+
+def reextract_all_phone_numbers(previous_extracted_list: ExtractedList, previous_string: str,
+                                edit: TextEdit) -> ExtractedList:
+    return PHONE_NUMBER_REGEX_HANDLER.search_edited_string(previous_extracted_list=previous_extracted_list,
+                                                           previous_string=previous_string, edit=edit)
+
+
+def extract_all_phone_number_matches(target_string: str) -> List[PhoneNumberMatch]:
+    return PHONE_NUMBER_REGEX_HANDLER.search_records(target_string=target_string, record_factory=PhoneNumberMatch)
+
+
+def iter_extract_all_phone_numbers(stream: Union[TextIO, Iterable[str]]) -> Iterator[ExtractedItem]:
+    return PHONE_NUMBER_REGEX_HANDLER.iter_search(stream=stream)
@@ -1,15 +1,16 @@
-import regex
+from typing import Union, TextIO, Iterable, Iterator, List
 
 from src.extractor.constants import separators, prefixes
-from src.extractor.models.ExtractedData import ExtractedList
+from src.extractor.models.ExtractedData import ExtractedList, ExtractedItem
+from src.extractor.models.ExtractedMatch import PostalCodeMatch
+from src.extractor.models.LazyRegex import LazyRegex
 from src.extractor.models.RegexHandler import RegexHandler
+from src.extractor.models.TextEdit import TextEdit
 from src.utils.conversion_utils import parse_postal_code
-from src.utils.io_utils import load_regex
 from src.utils.number_conversion_utils import japanese_container_dict
 
-POSTAL_CODE_REGEX_STRING = load_regex(regex_file_name="postal_code.regexp")
-POSTAL_CODE_REGEX = regex.compile(
-    POSTAL_CODE_REGEX_STRING,
+POSTAL_CODE_REGEX = LazyRegex(
+    "postal_code.regexp",
     seperator_postal_code=separators["postal_code_numbers"],
     prefix_postal_code=prefixes["postal_code"],
     seperator_space=separators["blank"],
@@ -20,10 +21,28 @@ POSTAL_CODE_REGEX_IDENTIFIERS = {
     "postal_code_string": lambda raw_value: raw_value,
     "postal_code_value": parse_postal_code
 }
+# Increase whenever the matches are converted to values differently
+POSTAL_CODE_EXTRACTOR_VERSION = 1
+# No postal code (with its lookaround) is longer than this, used to search only the text around an edit again
+POSTAL_CODE_MAX_MATCH_LENGTH = 16
+POSTAL_CODE_REGEX_HANDLER = RegexHandler(compiled_regex=POSTAL_CODE_REGEX,
+                                         regex_identifiers=POSTAL_CODE_REGEX_IDENTIFIERS,
+                                         max_match_length=POSTAL_CODE_MAX_MATCH_LENGTH)
 
 
 def extract_all_postal_codes(target_string: str) -> ExtractedList:
-    extractor = RegexHandler(compiled_regex=POSTAL_CODE_REGEX,
-                             regex_identifiers=POSTAL_CODE_REGEX_IDENTIFIERS)
-    return extractor.search_string(target_string=target_string)
+    return POSTAL_CODE_REGEX_HANDLER.search_string(target_string=target_string)
 
+
+def reextract_all_postal_codes(previous_extracted_list: ExtractedList, previous_string: str,
+                               edit: TextEdit) -> ExtractedList:
+    return POSTAL_CODE_REGEX_HANDLER.search_edited_string(previous_extracted_list=previous_extracted_list,
+                                                          previous_string=previous_string, edit=edit)
+
+
+def extract_all_postal_code_matches(target_string: str) -> List[PostalCodeMatch]:
+    return POSTAL_CODE_REGEX_HANDLER.search_records(target_string=target_string, record_factory=PostalCodeMatch)
+
+
+def iter_extract_all_postal_codes(stream: Union[TextIO, Iterable[str]]) -> Iterator[ExtractedItem]:
+    return POSTAL_CODE_REGEX_HANDLER.iter_search(stream=stream)
@@ -1,19 +1,18 @@
 from datetime import time
-from typing import Optional, Tuple
-
-import regex
+from typing import Optional, Tuple, Union, TextIO, Iterable, Iterator, List
 
 from src.extractor.constants import separators, prefixes, suffixes, special_values
-from src.extractor.models.ExtractedData import ExtractedList, ExtractedDataPosition, ExtractedData
+from src.extractor.models.ExtractedData import ExtractedList, ExtractedDataPosition, ExtractedData, ExtractedItem
+from src.extractor.models.ExtractedMatch import TimeMatch
+from src.extractor.models.LazyRegex import LazyRegex
 from src.extractor.models.RegexHandler import RegexHandler
+from src.extractor.models.TextEdit import TextEdit
 from src.extractor.models.TimeDecorator import TimeDecorator
 from src.utils.conversion_utils import parse_time_minutes, parse_time_hour, parse_time_decorator
-from src.utils.io_utils import load_regex
 from src.utils.number_conversion_utils import japanese_container_dict
 
-TIME_REGEX_STRING = load_regex(regex_file_name="time.regexp")
-TIME_REGEX = regex.compile(
-    TIME_REGEX_STRING,
+TIME_REGEX = LazyRegex(
+    "time.regexp",
     prefix_hour_decorator=prefixes["time_hour"],
     suffix_hour=suffixes["time_hour"],
     suffix_minute=suffixes["time_minute"],
@@ -39,6 +38,13 @@ TIME_REGEX_IDENTIFIERS = {
     "time_hour": parse_time_hour,
     "time_minute": parse_time_minutes,
 }
+# Increase whenever the matches are converted to values differently
+TIME_EXTRACTOR_VERSION = 1
+# No time (with its lookaround) is longer than this, used to search only the text around an edit again
+TIME_MAX_MATCH_LENGTH = 16
+TIME_REGEX_HANDLER = RegexHandler(compiled_regex=TIME_REGEX,
+                                  regex_identifiers=TIME_REGEX_IDENTIFIERS,
+                                  max_match_length=TIME_MAX_MATCH_LENGTH)
 
 
 def time_post_processing(extracted_data: Tuple[ExtractedDataPosition, ExtractedData]):
@@ -62,6 +68,18 @@ def time_post_processing(extracted_data: Tuple[ExtractedDataPosition, ExtractedD
 
 
 def extract_all_times(target_string: str) -> ExtractedList:
-    extractor = RegexHandler(compiled_regex=TIME_REGEX,
-                             regex_identifiers=TIME_REGEX_IDENTIFIERS)
-    return extractor.search_string(target_string=target_string)
+    return TIME_REGEX_HANDLER.search_string(target_string=target_string)
+
+
+def reextract_all_times(previous_extracted_list: ExtractedList, previous_string: str,
+                        edit: TextEdit) -> ExtractedList:
+    return TIME_REGEX_HANDLER.search_edited_string(previous_extracted_list=previous_extracted_list,
+                                                   previous_string=previous_string, edit=edit)
+
+
+def extract_all_time_matches(target_string: str) -> List[TimeMatch]:
+    return TIME_REGEX_HANDLER.search_records(target_string=target_string, record_factory=TimeMatch)
+
+
+def iter_extract_all_times(stream: Union[TextIO, Iterable[str]]) -> Iterator[ExtractedItem]:
+    return TIME_REGEX_HANDLER.iter_search(stream=stream)
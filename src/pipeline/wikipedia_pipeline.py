@@ -0,0 +1,116 @@
+from queue import Queue, Full
+from threading import Thread, Event
+from typing import Iterable, Iterator, Tuple, Optional, TextIO, Any, Dict
+
+from src.downloader.models.PageCache import PageCache
+from src.downloader.models.Transport import Transport
+from src.downloader.wikipedia.wikipedia_downloader import iter_download_wikipedia_pages, DEFAULT_DOWNLOAD_WORKERS
+from src.downloader.wikipedia_dump.wikipedia_dump_reader import iter_wikipedia_dump_pages
+from src.extractor.batch_extractor import extract_batch_as_completed, ExtractedDocument
+from src.utils.json_lines_utils import write_extracted_documents
+
+# Default number of downloaded pages waiting for extraction, downloading pauses while the queue is full
+DEFAULT_QUEUE_SIZE = 64
+
+# Put in the queue after the last page
+_END_OF_PAGES = object()
+
+
+def iter_extract_wikipedia_pages(search_page_names: Iterable[str], extractors: Optional[Iterable[str]] = None,
+                                 download_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+                                 extract_workers: Optional[int] = None,
+                                 queue_size: int = DEFAULT_QUEUE_SIZE,
+                                 page_cache: Optional[PageCache] = None,
+                                 transport: Optional[Transport] = None) -> Iterator[Tuple[str, ExtractedDocument]]:
+    """
+    Downloads Wikipedia pages and extracts data from them at the same time. A thread downloads the pages into
+    a bounded queue, and the pages in the queue are extracted by a pool of worker processes as soon as they arrive.
+    When the extraction falls behind the queue fills up, and downloading waits until there is room again.
+    Pages that do not exist are left out.
+    :param search_page_names: Titles of the pages to download
+    :param extractors: The kinds of data to extract (see combined_extractor.EXTRACTORS), by default all kinds
+    :param download_workers: Number of pages downloaded at the same time
+    :param extract_workers: Number of worker processes extracting data, by default the number of processors
+    :param queue_size: Number of downloaded pages that can wait for extraction
+    :param page_cache: Optional cache of the downloaded pages
+    :param transport: Sends the requests of the downloader, by default a RequestsTransport
+    :return: An iterator of tuples with the title and the extracted data of each page, in order of completion
+    """
+    if queue_size < 1:
+        raise ValueError(f"The queue must have room for at least one page: {queue_size}")
+
+    page_queue = Queue(maxsize=queue_size)
+    stopped = Event()
+    download_thread = Thread(target=_download_pages_into_queue, daemon=True,
+                             args=(page_queue, stopped, dict(search_page_names=search_page_names,
+                                                             transport=transport, workers=download_workers,
+                                                             page_cache=page_cache, skip_missing_pages=True)))
+    download_thread.start()
+    try:
+        yield from extract_batch_as_completed(identified_documents=_iter_queued_pages(page_queue),
+                                              extractors=extractors, workers=extract_workers)
+    finally:
+        # Also stops the downloads when the extraction failed or the iterator was not consumed to the end
+        stopped.set()
+        download_thread.join()
+
+
+def iter_extract_wikipedia_dump_pages(dump_path: str, extractors: Optional[Iterable[str]] = None,
+                                      extract_workers: Optional[int] = None, strip_markup: bool = True,
+                                      titles: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, ExtractedDocument]]:
+    """
+    Extracts data from the articles of a local Wikipedia dump. The dump is read while the pages are extracted,
+    and only a limited number of pages are read ahead of the extraction.
+    :param dump_path: Path to the dump, see iter_wikipedia_dump_pages
+    :param extractors: The kinds of data to extract (see combined_extractor.EXTRACTORS), by default all kinds
+    :param extract_workers: Number of worker processes extracting data, by default the number of processors
+    :param strip_markup: Extract from the plain text of the pages instead of their wiki markup
+    :param titles: Titles of the pages to extract, by default all articles
+    :return: An iterator of tuples with the title and the extracted data of each page, in order of completion
+    """
+    pages = iter_wikipedia_dump_pages(dump_path=dump_path, strip_markup=strip_markup, titles=titles)
+    yield from extract_batch_as_completed(identified_documents=((page.title, page.data) for page in pages),
+                                          extractors=extractors, workers=extract_workers)
+
+
+def write_extracted_pages(extracted_pages: Iterable[Tuple[str, ExtractedDocument]], output: TextIO) -> int:
+    """
+    Writes extracted pages as JSON Lines (see json_lines_utils), each line written as soon as the page is extracted
+    :param extracted_pages: Tuples with the title and the extracted data of each page
+    :param output: A text file to write to
+    :return: Number of pages written
+    """
+    return write_extracted_documents(extracted_pages, output=output, flush=True)
+
+
+def _download_pages_into_queue(page_queue: Queue, stopped: Event, download_arguments: Dict[str, Any]) -> None:
+    # Runs in the download thread, errors are passed on through the queue and raised by the consumer
+    try:
+        for page in iter_download_wikipedia_pages(**download_arguments):
+            if not _put_unless_stopped(page_queue, (page.title, page.data), stopped):
+                return
+    except Exception as error:
+        _put_unless_stopped(page_queue, error, stopped)
+        return
+    _put_unless_stopped(page_queue, _END_OF_PAGES, stopped)
+
+
+def _put_unless_stopped(page_queue: Queue, item: Any, stopped: Event) -> bool:
+    # Waits for room in the queue, but gives up when the consumer has stopped
+    while not stopped.is_set():
+        try:
+            page_queue.put(item, timeout=0.1)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def _iter_queued_pages(page_queue: Queue) -> Iterator[Tuple[str, str]]:
+    while True:
+        item = page_queue.get()
+        if item is _END_OF_PAGES:
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield item
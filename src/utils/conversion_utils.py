@@ -1,5 +1,5 @@
 from collections import namedtuple
-from typing import Optional
+from typing import Optional, Dict
 
 from src.extractor.constants import separators, prefixes, special_values
 from src.extractor.models.DateValue import Year, Month, Day, DateValueType
@@ -7,13 +7,7 @@ from src.extractor.models.PostalCode import PostalCode
 from src.extractor.models.TimeDecorator import TimeDecorator
 from src.utils.number_conversion_utils import dirty_mixed_number_to_value, clean_mixed_number_to_value
 from src.utils.number_conversion_utils import japanese_container_dict, parse_single_char_kanji_as_number
-
-HALF2FULL = dict((i, i + 0xFEE0) for i in range(0x21, 0x7F))
-HALF2FULL[0x20] = 0x3000
-
-FULL2HALF = dict((i + 0xFEE0, i) for i in range(0x21, 0x7F))
-FULL2HALF[0x3000] = 0x20
-
+from src.utils.translation_utils import FULL2HALF, HALF2FULL, TranslationTable
 
 Era = namedtuple('Era', ['gregorian_calendar_offset', 'length_in_years'])
 JAPANESE_ERAS = {
@@ -42,12 +36,12 @@ def half_width_string_to_full_width(half_width_string: str) -> str:
     return half_width_string.translate(HALF2FULL)
 
 
-def parse_time_decorator(decorator_string: str) -> Optional[TimeDecorator]:
+def parse_time_decorator(decorator_string: Optional[str]) -> Optional[TimeDecorator]:
     """
     Coverts decorator value to the corresponding enum value.
     :return: An enum representation AM and PM input
     """
-    if decorator_string == "":
+    if not decorator_string:
         return None
     elif decorator_string == "午後":
         return TimeDecorator.PM
@@ -65,52 +59,149 @@ def parse_time_hour(hour_string: str) -> int:
     return clean_mixed_number_to_value(hour_string)
 
 
-def parse_time_minutes(minutes_string: str) -> int:
+def parse_time_minutes(minutes_string: Optional[str]) -> Optional[int]:
     """
     Converts an input minute value to the corresponding int.
-    :return: A numerical representation of the input minutes.
+    :return: A numerical representation of the input minutes, or None if no minutes were specified.
     """
-    if minutes_string in special_values["time_half_hour"]:
+    if not minutes_string:
+        return None
+    elif minutes_string in special_values["time_half_hour"]:
         # Special case for 半
         return 30
     else:
         return clean_mixed_number_to_value(minutes_string)
 
 
+def postal_code_digit(character: str) -> Optional[str]:
+    """
+    Converts a character of a postal code to a half-width digit
+    :param character: Any character
+    :return: The digit, or None if the character is not a digit or kanji digit
+    """
+    if character.isdigit():
+        return full_width_string_to_half_width(character)
+    elif character in japanese_container_dict["0to9"]:
+        return str(parse_single_char_kanji_as_number(character).value)
+    return None
+
+
+POSTAL_CODE_DIGITS_TABLE = TranslationTable(postal_code_digit)
+
+
 def parse_postal_code(postal_code: str) -> PostalCode:
     """
     Function used to convert postal code to default model
     :param postal_code: Some postal code, possibly formatted with kanji or full-width numbers
     :return: Correctly formatted postal code nnn-nnnn
     """
-    converted_code = ""
-
     # Assume it's not a japanese number, contains only numbers and seperator
-    for char in postal_code:
-        if char.isdigit():
-            converted_code = converted_code + full_width_string_to_half_width(char)
-        elif char in japanese_container_dict["0to9"]:
-            converted_code = converted_code + str(parse_single_char_kanji_as_number(char).value)
-
+    converted_code = postal_code.translate(POSTAL_CODE_DIGITS_TABLE)
     return PostalCode.from_string(postal_code=converted_code)
 
 
+PHONE_NUMBER_SEPARATORS = frozenset(separators["dash"] + separators["blank"] +
+                                    separators["left_parenthesis"] + separators["right_parenthesis"])
+
+
+def phone_number_character(character: str) -> Optional[str]:
+    """
+    Converts a character of a phone number to its clean representation
+    :param character: Any character
+    :return: None for separators, the half-width digit for digits and the half-width form for other characters
+    """
+    if character in PHONE_NUMBER_SEPARATORS:
+        return None
+    elif character.isdecimal():
+        return str(int(character))
+    return full_width_string_to_half_width(character)
+
+
+PHONE_NUMBER_TABLE = TranslationTable(phone_number_character)
+
+
 def parse_phone_number(phone_number: str) -> str:
     """
     Converts a phone number to a clean representation of the same number.
     :param phone_number: The raw data
     :return: A string cleaned of seperators, however if it had + to begin with it will still have this character.
     """
-    cleaned_phone_number = ""
-    for char in phone_number:
-        if char in separators["dash"] + separators["blank"]:
-            pass
-        else:
-            if char.isnumeric():
-                cleaned_phone_number += str(int(char))
-            else:
-                cleaned_phone_number += char
-    return cleaned_phone_number
+    return phone_number.translate(PHONE_NUMBER_TABLE)
+
+
+# Ages are parsed by looking up this table of all ages from 0 to 120
+MAXIMUM_AGE = 120
+KANJI_DIGITS = "〇一二三四五六七八九"
+
+
+def age_to_traditional_kanji(age: int) -> str:
+    """
+    Writes an age in traditional style kanji, such as 百二十
+    :param age: An age between 0 and 999
+    :return: The age in kanji
+    """
+    if age == 0:
+        return KANJI_DIGITS[0]
+    hundreds, rest = divmod(age, 100)
+    tens, ones = divmod(rest, 10)
+    kanji_string = ""
+    if hundreds:
+        kanji_string = (KANJI_DIGITS[hundreds] if hundreds > 1 else "") + "百"
+    if tens:
+        kanji_string = kanji_string + (KANJI_DIGITS[tens] if tens > 1 else "") + "十"
+    if ones:
+        kanji_string = kanji_string + KANJI_DIGITS[ones]
+    return kanji_string
+
+
+def age_lookup_table(maximum_age: int) -> Dict[str, int]:
+    """
+    Creates a table with all ages up to the maximum age, each written in all common ways
+    :param maximum_age: The highest age in the table
+    :return: The age for each way of writing it, such as "20", "２０", "二〇" and "二十"
+    """
+    western_to_kanji = str.maketrans("0123456789", KANJI_DIGITS)
+    age_values = {special_value: 0 for special_value in special_values["age_zero"]}
+    for age in range(maximum_age + 1):
+        age_values[str(age)] = age
+        age_values[half_width_string_to_full_width(str(age))] = age
+        age_values[str(age).translate(western_to_kanji)] = age
+        age_values[age_to_traditional_kanji(age)] = age
+    return age_values
+
+
+AGE_VALUES = age_lookup_table(MAXIMUM_AGE)
+
+# Translates mixed full-width/half-width digits and the daiji (壱弐参拾) to the forms in AGE_VALUES
+AGE_NORMALIZATION_TABLE = dict(FULL2HALF)
+AGE_NORMALIZATION_TABLE.update(str.maketrans("零壱弐参拾", "〇一二三十"))
+
+
+def parse_age(age: str) -> int:
+    """
+    Converts an age to an integer, such as "二十歳" to 20
+    :param age: An age written with kanji, full-width or half-width numbers, without the suffix
+    :return: The age
+    """
+    value = AGE_VALUES.get(age)
+    if value is None:
+        value = AGE_VALUES.get(age.translate(AGE_NORMALIZATION_TABLE))
+    if value is None:
+        # Not an age the regex matches, but still try to convert it
+        value = clean_mixed_number_to_value(age)
+    return value
+
+
+def parse_currency_amount(currency_amount: str) -> Optional[int]:
+    """
+    Converts a currency amount to an integer, such as "２,000億５万" to 200000050000
+    :param currency_amount: An amount written with kanji, full-width or half-width numbers, without the currency
+    :return: The amount, or None if the amount can not be converted (for example "20百")
+    """
+    try:
+        return dirty_mixed_number_to_value(currency_amount)
+    except ValueError:
+        return None
 
 
 def parse_relative_year_value(relative_year: str) -> int:
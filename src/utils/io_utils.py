@@ -1,10 +1,12 @@
 from os import makedirs
 from os.path import join, exists, isdir, isfile
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
 from definitions import CLASSIFIERS_PATH, REGEX_PATH
-import jsonpickle
-from pandas import DataFrame, read_csv
+
+# pandas and jsonpickle are slow to import, so they are only imported by the functions using them
+if TYPE_CHECKING:
+    from pandas import DataFrame
 
 
 def is_directory(path: str) -> bool:
@@ -46,12 +48,14 @@ def prepare_read_get_full_path(path: str, filename: str) -> str:
     return file_path
 
 
-def store_dataframe(dataframe: DataFrame, path: str, filename: str):
+def store_dataframe(dataframe: 'DataFrame', path: str, filename: str):
     output_path = prepare_storage_get_full_path(path, filename)
     dataframe.to_csv(output_path, index=True, index_label="id")
 
 
-def load_dataframe(path: str, filename: str) -> DataFrame:
+def load_dataframe(path: str, filename: str) -> 'DataFrame':
+    from pandas import read_csv
+
     read_path = prepare_read_get_full_path(path, filename)
     return read_csv(read_path, index_col=0)
 
@@ -63,6 +67,8 @@ def load_regex(regex_file_name: str) -> str:
 
 
 def store_serializable_object(serializable_object: Any, path: str, filename: str):
+    import jsonpickle
+
     output_path = prepare_storage_get_full_path(path, filename)
     json_object = jsonpickle.encode(serializable_object)
     with open(output_path, 'w') as my_file:
@@ -70,6 +76,8 @@ def store_serializable_object(serializable_object: Any, path: str, filename: str
 
 
 def load_serializable_object(path: str, filename: str) -> Any:
+    import jsonpickle
+
     read_path = prepare_read_get_full_path(path, filename)
     with open(read_path, 'r') as my_file:
         raw_text = my_file.read()
@@ -0,0 +1,263 @@
+import json
+from os.path import getsize
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from src.downloader.models.DownloadedData import DownloadedData
+from src.extractor.models.ComplexDate import ComplexDate
+from src.extractor.models.DateValue import DateValue, DateValueType, Year, Month, Day
+from src.extractor.models.ExtractedData import ExtractedList
+from src.extractor.models.PostalCode import PostalCode
+from src.extractor.models.TimeDecorator import TimeDecorator
+from src.utils.io_utils import prepare_storage_get_full_path, prepare_read_get_full_path
+
+# Files start with a header line naming the kind of records and the version of their schema
+DOCUMENTS_FORMAT = "documents"
+EXTRACTED_DOCUMENTS_FORMAT = "extracted_documents"
+FORMAT_VERSION = 1
+
+# The extracted data of each kind is stored by column, with the spans in this column
+SPAN_COLUMN = "span"
+
+
+def _encode_date_value(date_value: Optional[DateValue]) -> Optional[List[int]]:
+    return None if date_value is None else [date_value.value, date_value.type.value]
+
+
+def _date_value_decoder(date_value_class: type) -> Callable[[Optional[List[int]]], Optional[DateValue]]:
+    return lambda value: None if value is None else date_value_class(value[0], DateValueType(value[1]))
+
+
+def _encode_complex_date(date: ComplexDate) -> List[Optional[List[int]]]:
+    return [_encode_date_value(date.year), _encode_date_value(date.month), _encode_date_value(date.day)]
+
+
+def _decode_complex_date(value: List[Optional[List[int]]]) -> ComplexDate:
+    return ComplexDate(year=_date_value_decoder(Year)(value[0]), month=_date_value_decoder(Month)(value[1]),
+                       day=_date_value_decoder(Day)(value[2]))
+
+
+def _encode_postal_code(postal_code: PostalCode) -> str:
+    return f"{postal_code.prefecture_id:02d}{postal_code.city_id}" \
+           f"{postal_code.neighborhood_id:02d}{postal_code.street_id:02d}"
+
+
+# Encoders and decoders of the extracted values that are not JSON types, by the name of the value
+# All other values are stored as they are
+VALUE_CODECS: Dict[str, Tuple[Callable[[Any], Any], Callable[[Any], Any]]] = {
+    "date": (_encode_complex_date, _decode_complex_date),
+    "date_year": (_encode_date_value, _date_value_decoder(Year)),
+    "date_month": (_encode_date_value, _date_value_decoder(Month)),
+    "date_day": (_encode_date_value, _date_value_decoder(Day)),
+    "time_decorator": (lambda decorator: None if decorator is None else decorator.value,
+                       lambda value: None if value is None else TimeDecorator(value)),
+    "postal_code_value": (lambda postal_code: None if postal_code is None else _encode_postal_code(postal_code),
+                          lambda value: None if value is None else PostalCode(value))
+}
+
+
+def encode_document(document: DownloadedData) -> str:
+    """
+    Encodes a downloaded document as a single JSON line
+    :param document: The document
+    :return: The line, without line break
+    """
+    # Documents stored with jsonpickle before the revision and fetch time were added do not have them
+    return _dumps({"title": document.title, "data": document.data,
+                   "revision_id": getattr(document, "revision_id", None),
+                   "fetched_at": getattr(document, "fetched_at", None)})
+
+
+def decode_document(line: str) -> DownloadedData:
+    """
+    Decodes a line encoded by encode_document
+    :param line: The line
+    :return: The document
+    """
+    record = json.loads(line)
+    return DownloadedData(title=record["title"], data=record["data"], revision_id=record["revision_id"],
+                          fetched_at=record["fetched_at"])
+
+
+def encode_extracted_document(title: Hashable, extracted_document: Dict[str, ExtractedList]) -> str:
+    """
+    Encodes the data extracted from a document as a single JSON line. The extracted data of each kind is stored by
+    column: one list with the spans, and one list for each value, so the names of the values are only stored once.
+    All matches of a kind must have the same values, as they do for all extractors.
+    :param title: Identifies the document, a string or a number
+    :param extracted_document: The extracted data of each kind, as returned by combined_extractor.extract_all
+    :return: The line, without line break
+    """
+    columns_by_kind = {}
+    for kind, extracted_list in extracted_document.items():
+        columns = {SPAN_COLUMN: [list(span) for span, _ in extracted_list]}
+        names = list(extracted_list[0][1]) if extracted_list else []
+        for _, extracted_data in extracted_list:
+            if len(extracted_data) != len(names) or any(name not in extracted_data for name in names):
+                raise ValueError(f"The matches of {kind} have different values: {names} and {list(extracted_data)}")
+        for name in names:
+            encode = VALUE_CODECS[name][0] if name in VALUE_CODECS else None
+            values = [extracted_data[name] for _, extracted_data in extracted_list]
+            columns[name] = [encode(value) for value in values] if encode else values
+        columns_by_kind[kind] = columns
+    return _dumps({"title": title, "extracted_data": columns_by_kind})
+
+
+def decode_extracted_document(line: str) -> Tuple[Hashable, Dict[str, ExtractedList]]:
+    """
+    Decodes a line encoded by encode_extracted_document
+    :param line: The line
+    :return: The title and the extracted data of the document
+    """
+    record = json.loads(line)
+    extracted_document = {}
+    for kind, columns in record["extracted_data"].items():
+        spans = [tuple(span) for span in columns.pop(SPAN_COLUMN)]
+        for name, values in columns.items():
+            if name in VALUE_CODECS:
+                decode = VALUE_CODECS[name][1]
+                columns[name] = [decode(value) for value in values]
+        names = list(columns)
+        extracted_document[kind] = [(span, {name: columns[name][index] for name in names})
+                                    for index, span in enumerate(spans)]
+    return record["title"], extracted_document
+
+
+def write_documents(documents: Iterable[DownloadedData], output: TextIO, header: bool = True,
+                    flush: bool = False) -> int:
+    """
+    Writes documents as JSON Lines
+    :param documents: The documents
+    :param output: A text file to write to
+    :param header: Start with the header line, leave it out when appending to a file that already has one
+    :param flush: Flush the file after each document, so readers see each document as soon as it is written
+    :return: Number of documents written
+    """
+    return _write_lines(map(encode_document, documents), output=output,
+                        format_name=DOCUMENTS_FORMAT if header else None, flush=flush)
+
+
+def read_documents(input_file: TextIO) -> Iterator[DownloadedData]:
+    """
+    Reads documents written by write_documents, one at a time
+    :param input_file: A text file to read from
+    :return: An iterator of the documents
+    """
+    return map(decode_document, _read_lines(input_file, format_name=DOCUMENTS_FORMAT))
+
+
+def write_extracted_documents(extracted_documents: Iterable[Tuple[Hashable, Dict[str, ExtractedList]]],
+                              output: TextIO, header: bool = True, flush: bool = False) -> int:
+    """
+    Writes the data extracted from documents as JSON Lines
+    :param extracted_documents: Tuples with the title and the extracted data of each document
+    :param output: A text file to write to
+    :param header: Start with the header line, leave it out when appending to a file that already has one
+    :param flush: Flush the file after each document, so readers see each document as soon as it is written
+    :return: Number of documents written
+    """
+    lines = (encode_extracted_document(title, extracted_document) for title, extracted_document in extracted_documents)
+    return _write_lines(lines, output=output, format_name=EXTRACTED_DOCUMENTS_FORMAT if header else None, flush=flush)
+
+
+def read_extracted_documents(input_file: TextIO) -> Iterator[Tuple[Hashable, Dict[str, ExtractedList]]]:
+    """
+    Reads the data written by write_extracted_documents, one document at a time
+    :param input_file: A text file to read from
+    :return: An iterator of tuples with the title and the extracted data of each document
+    """
+    return map(decode_extracted_document, _read_lines(input_file, format_name=EXTRACTED_DOCUMENTS_FORMAT))
+
+
+def append_documents(documents: Iterable[DownloadedData], path: str, filename: str) -> int:
+    """
+    Appends documents to a JSON Lines file, creating it if needed
+    :param documents: The documents
+    :param path: The path of the file
+    :param filename: The name of the file
+    :return: Number of documents written
+    """
+    output_path = prepare_storage_get_full_path(path, filename)
+    with open(output_path, "a", encoding="utf-8") as output:
+        return write_documents(documents, output=output, header=_needs_header(output_path, DOCUMENTS_FORMAT))
+
+
+def iter_documents(path: str, filename: str) -> Iterator[DownloadedData]:
+    """
+    Reads the documents of a JSON Lines file, one at a time
+    :param path: The path of the file
+    :param filename: The name of the file
+    :return: An iterator of the documents
+    """
+    read_path = prepare_read_get_full_path(path, filename)
+    with open(read_path, "r", encoding="utf-8") as input_file:
+        yield from read_documents(input_file)
+
+
+def append_extracted_documents(extracted_documents: Iterable[Tuple[Hashable, Dict[str, ExtractedList]]],
+                               path: str, filename: str) -> int:
+    """
+    Appends the data extracted from documents to a JSON Lines file, creating it if needed
+    :param extracted_documents: Tuples with the title and the extracted data of each document
+    :param path: The path of the file
+    :param filename: The name of the file
+    :return: Number of documents written
+    """
+    output_path = prepare_storage_get_full_path(path, filename)
+    with open(output_path, "a", encoding="utf-8") as output:
+        return write_extracted_documents(extracted_documents, output=output,
+                                         header=_needs_header(output_path, EXTRACTED_DOCUMENTS_FORMAT))
+
+
+def iter_extracted_documents(path: str, filename: str) -> Iterator[Tuple[Hashable, Dict[str, ExtractedList]]]:
+    """
+    Reads the extracted data of a JSON Lines file, one document at a time
+    :param path: The path of the file
+    :param filename: The name of the file
+    :return: An iterator of tuples with the title and the extracted data of each document
+    """
+    read_path = prepare_read_get_full_path(path, filename)
+    with open(read_path, "r", encoding="utf-8") as input_file:
+        yield from read_extracted_documents(input_file)
+
+
+def _dumps(record: Dict[str, Any]) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+
+
+def _write_lines(lines: Iterable[str], output: TextIO, format_name: Optional[str], flush: bool) -> int:
+    if format_name is not None:
+        output.write(_dumps({"format": format_name, "version": FORMAT_VERSION}) + "\n")
+    number_of_lines = 0
+    for line in lines:
+        output.write(line + "\n")
+        if flush:
+            output.flush()
+        number_of_lines = number_of_lines + 1
+    return number_of_lines
+
+
+def _read_lines(input_file: TextIO, format_name: str) -> Iterator[str]:
+    _check_header(input_file.readline(), format_name)
+    for line in input_file:
+        if line.strip():
+            yield line
+
+
+def _needs_header(file_path: str, format_name: str) -> bool:
+    # A new file needs a header, an existing one must already have the header of the same format
+    if getsize(file_path) == 0:
+        return True
+    with open(file_path, "r", encoding="utf-8") as existing_file:
+        _check_header(existing_file.readline(), format_name)
+    return False
+
+
+def _check_header(line: str, format_name: str) -> None:
+    try:
+        header = json.loads(line)
+    except ValueError:
+        header = None
+    if not isinstance(header, dict) or header.get("format") != format_name:
+        raise ValueError(f"Not a JSON Lines file of {format_name}: {line[:100]!r}")
+    if header.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported version of {format_name}: {header.get('version')}")
@@ -0,0 +1,63 @@
+from array import array
+from functools import lru_cache
+from typing import Dict, Optional
+
+import regex
+
+from src.extractor.constants import separators
+from src.extractor.models.NormalizedText import NormalizedText
+from src.utils.number_conversion_utils import japanese_number_dict, NumberType
+from src.utils.translation_utils import FULL2HALF
+
+# Kanji digits (including 零 and the daiji 壱弐参) translated to half-width digits
+KANJI_DIGITS = {ord(number.character): str(number.value) for number in japanese_number_dict.values()
+                if number.type in (NumberType.REGULAR, NumberType.ZERO)}
+
+# Dashes and blanks, that are removed when normalizing separators
+SEPARATOR_CHARACTERS = "".join(separators["dash"] + separators["blank"])
+SeparatorRunsRegex = regex.compile("[" + regex.escape(SEPARATOR_CHARACTERS) + "]+")
+
+
+@lru_cache(maxsize=None)
+def normalization_table(full_width: bool, kanji_digits: bool, remove_separators: bool) -> Dict[int, Optional[str]]:
+    """
+    Combines the translation tables of the normalizations into one table for str.translate
+    :param full_width: Translate full-width characters to half-width
+    :param kanji_digits: Translate the kanji digits 〇 to 九 to half-width digits
+    :param remove_separators: Remove dashes and blanks
+    :return: The combined table
+    """
+    table = {}
+    if full_width:
+        table.update({full: chr(half) for full, half in FULL2HALF.items()})
+    if kanji_digits:
+        table.update(KANJI_DIGITS)
+    if remove_separators:
+        table.update({ord(character): None for character in SEPARATOR_CHARACTERS})
+    return table
+
+
+def normalize_text(text: str, full_width: bool = True, kanji_digits: bool = False,
+                   remove_separators: bool = False) -> NormalizedText:
+    """
+    Normalizes a whole text in one pass, for example so a simpler regex can be used to extract data from it.
+    The normalized text can map the spans of the extracted data back to the original text.
+    :param text: The text to normalize
+    :param full_width: Translate full-width characters to half-width, for example "２０１９" to "2019"
+    :param kanji_digits: Translate the kanji digits to half-width digits, for example "二〇一九" to "2019"
+    :param remove_separators: Remove dashes and blanks, for example "03-1234 5678" to "0312345678"
+    :return: The normalized text together with the map back to the original text
+    """
+    deletion_positions = array("q")
+    deleted_counts = array("q")
+    if remove_separators:
+        deleted_count = 0
+        for separator_run in SeparatorRunsRegex.finditer(text):
+            start, end = separator_run.span()
+            deletion_positions.append(start - deleted_count)
+            deleted_count = deleted_count + end - start
+            deleted_counts.append(deleted_count)
+
+    normalized_text = text.translate(normalization_table(full_width, kanji_digits, remove_separators))
+    return NormalizedText(original_text=text, text=normalized_text,
+                          deletion_positions=deletion_positions, deleted_counts=deleted_counts)
@@ -1,8 +1,10 @@
+from array import array
 from enum import Enum
+from functools import lru_cache
 from typing import NamedTuple
-from typing import Tuple, Any
+from typing import Any, Dict, Optional, Iterable
 
-import regex
+from src.utils.translation_utils import TranslationTable
 
 
 class NumberType(Enum):
@@ -24,7 +26,14 @@ class CustomNumber(NamedTuple):
     type: NumberType
 
 
-ExtractNumberAndNonNumbersRegex = regex.compile(r"^(?P<numbers>\d*)(?P<nonnumbers>\w*)$")
+class BatchNumberValues(NamedTuple):
+    """
+    Container tuple for the result of converting many number strings at once, values[i] is the value of the i:th
+    string unless errors[i] is 1, in which case the string could not be converted and values[i] is 0
+    """
+    values: array
+    errors: array
+
 
 # Summarize all kanji and relevant information
 japanese_number_dict = {
@@ -61,6 +70,7 @@ japanese_container_dict = {
                              japanese_number_dict.values())],
     "numbers_multipliers": [x.character for x in
                             filter((lambda x: x.type == NumberType.MULTIPLE), japanese_number_dict.values())],
+    "numbers_units": [x.character for x in filter((lambda x: x.type == NumberType.UNIT), japanese_number_dict.values())],
     "0": [x.character for x in filter((lambda x: x.value == 0), japanese_number_dict.values())],
     "0to1": [x.character for x in filter((lambda x: 0 <= x.value <= 1), japanese_number_dict.values())],
     "0to2": [x.character for x in filter((lambda x: 0 <= x.value <= 2), japanese_number_dict.values())],
@@ -83,8 +93,39 @@ japanese_container_dict = {
     "100": [x.character for x in filter((lambda x: x.value == 100), japanese_number_dict.values())]
 }
 
+# Sets of characters, for fast membership tests
+ALL_NUMBERS = frozenset(japanese_container_dict["all_numbers"])
+POWERS_OF_TEN = frozenset(japanese_container_dict["powers_of_ten"])
+NUMBERS_MULTIPLIERS = frozenset(japanese_container_dict["numbers_multipliers"])
+DIGIT_CHARACTERS = frozenset("0123456789０１２３４５６７８９")
+KANJI_DIGITS = frozenset(character for character, number in japanese_number_dict.items()
+                         if number.type is NumberType.ZERO or number.type is NumberType.REGULAR)
+NUMBER_CHARACTERS = ALL_NUMBERS | DIGIT_CHARACTERS
+
+# The value and type of every character of a number (kanji, daiji, half-width and full-width digits), by codepoint
+NUMBER_TABLE: Dict[int, CustomNumber] = {ord(character): number for character, number in japanese_number_dict.items()}
+NUMBER_TABLE.update({ord(digit): CustomNumber(digit, int(digit), NumberType.REGULAR if int(digit) else NumberType.ZERO)
+                     for digit in DIGIT_CHARACTERS})
+
+# Translates the kanji digits of western style numbers (二〇一九) to half-width digits
+KANJI_DIGITS_TABLE = {ord(character): str(japanese_number_dict[character].value) for character in KANJI_DIGITS}
+
+# Keeps kanji numbers and numerals, and removes any other character
+NUMBER_CHARACTERS_TABLE = TranslationTable(
+    lambda character: character if character in ALL_NUMBERS or character.isnumeric() else None)
+
+# Range of the signed 64 bit integers of the arrays returned by batch_mixed_numbers_to_values
+BATCH_VALUE_MIN = -2 ** 63
+BATCH_VALUE_MAX = 2 ** 63 - 1
+# Strings of up to this many digits are always within the range above
+BATCH_MAX_DIGITS = 18
+
+# Number of converted strings remembered by each of the cached conversion functions
+NUMBER_CONVERSION_CACHE_SIZE = 8192
+
 
 # Note that this function does not take decimal numbers for now!
+@lru_cache(maxsize=NUMBER_CONVERSION_CACHE_SIZE)
 def dirty_mixed_number_to_value(mixed: str) -> int:
     """
     Converts any dirty number represented with kanji or mixed kanji/numerals to a digit. Dirty mean it may
@@ -93,19 +134,16 @@ def dirty_mixed_number_to_value(mixed: str) -> int:
     :return: The corresponding numerical value
     """
 
-    if mixed is "":
+    if mixed == "":
         raise ValueError("Invalid empty string input to the mixed_to_value function.")
 
     # First, remove anything that is not Kanji numbers or numerals and store cleaned string
-    clean_string = ""
-
-    for char in mixed:
-        if char in japanese_container_dict["all_numbers"] or char.isnumeric():
-            clean_string = clean_string + char
+    clean_string = mixed.translate(NUMBER_CHARACTERS_TABLE)
 
     return clean_mixed_number_to_value(clean_string)
 
 
+@lru_cache(maxsize=NUMBER_CONVERSION_CACHE_SIZE)
 def clean_mixed_number_to_value(number_string: str) -> int:
     """
     Converts any clean number represented with kanji or mixed kanji/numerals to a digit.
@@ -114,17 +152,15 @@ def clean_mixed_number_to_value(number_string: str) -> int:
     :return: The corresponding numerical value
     """
     # Two cases: Either the kanji_string are western style 二〇〇〇/2000/２０００ or Japanese style 二千/53453百万,
-    # we can distinguish these cases using a simple regex that checks if the japanese "powers of ten" are used"
+    # we can distinguish these cases by checking if the japanese "powers of ten" are used
 
-    is_traditional = regex.search(r"\L<japanese_powers_of_ten>", number_string,
-                                  japanese_powers_of_ten=japanese_container_dict["powers_of_ten"])
-    if is_traditional:
+    if not POWERS_OF_TEN.isdisjoint(number_string):
         return traditional_style_kanji_to_value(number_string)
+    integer = integer_string_to_value(number_string)
+    if integer is not None:
+        return integer
     else:
-        try:
-            return int(number_string)
-        except ValueError:
-            return western_style_kanji_to_value(number_string)
+        return western_style_kanji_to_value(number_string)
 
 
 def traditional_style_kanji_to_value(kanji_string: str) -> int:
@@ -138,61 +174,163 @@ def traditional_style_kanji_to_value(kanji_string: str) -> int:
     if kanji_string.isdigit():
         raise ValueError(f"Number is a valid number and is thus not a kanji string: {kanji_string}")
 
-    final_number = 0
-    split_kanji_by_number_multipliers = regex.split(r"(\L<japanese_multipliers>)",
-                                                    kanji_string,
-                                                    japanese_multipliers=japanese_container_dict[
-                                                        "numbers_multipliers"])
-    # Remove blanks from list
-    while ("" in split_kanji_by_number_multipliers):
-        split_kanji_by_number_multipliers.remove("")
-
-    if len(split_kanji_by_number_multipliers) is 0:
+    if not kanji_string:
         raise ValueError(f"Number contains no parsable information: {kanji_string}")
 
-    # Since we capture the splits, the value will be split like: "三百五十万二百"　→ ["三百五十", "万", "二百", ""]
-    index = 0
-
+    # A single scan over the characters: the multipliers split the number into groups below ten thousand,
+    # "三百五十万二百" → "三百五十", 万, "二百", and the kanji groups are converted while they are scanned
+    final_number = 0
     # First we assume that the number might have a western pre-component, like 200万, and thus the base is 1
     base_value = 1
-    while index < len(split_kanji_by_number_multipliers):
-        selected_value = split_kanji_by_number_multipliers[index]
-        for character in selected_value:
-            if not character.isdigit() and character not in japanese_container_dict["all_numbers"]:
-                raise ValueError(f"Number could not be parsed due to containing \"{character}\": {kanji_string}")
-
-        if selected_value in japanese_container_dict["numbers_multipliers"]:
+    length = len(kanji_string)
+    index = 0
+    while index < length:
+        character = kanji_string[index]
+        if character in NUMBERS_MULTIPLIERS:
             # Take the value before each multiplier and multiply by the multiplier
-            multiplier_value = japanese_number_dict[selected_value].value
-            final_number = final_number + multiplier_value * base_value
+            final_number = final_number + NUMBER_TABLE[ord(character)].value * base_value
             # After the first value, the base will always be 0 unless changed
             base_value = 0
-        elif selected_value.isdigit():
-            base_value = int(selected_value)
+            index = index + 1
+        elif character.isdecimal():
+            # Groups starting with digits, like 47176百 or ９千２百, are rare and converted on their own
+            group_start = index
+            while index < length and kanji_string[index] not in NUMBERS_MULTIPLIERS:
+                index = index + 1
+            base_value = _group_below_ten_thousand_to_value(kanji_string[group_start:index], kanji_string)
         else:
-            number, nonnumber = split_number_and_kanji(selected_value)
-            value_of_nonnumber = string_number_below_ten_thousand_to_value(nonnumber)
-            if number > value_of_nonnumber:
-                # Ex: 47176百
-                base_value = number * value_of_nonnumber
-            else:
-                # Ex: ９千２百３十４
-                base_value = string_number_below_ten_thousand_to_value(selected_value)
+            # Same as kanji_number_below_ten_thousand_to_value, for example 三百五十
+            group_start = index
+            group_value = 0
+            multiplier_value = 1
+            previous_type = None
+            contains_zero = False
+            while index < length:
+                character = kanji_string[index]
+                current_number = NUMBER_TABLE.get(ord(character))
+                if current_number is None:
+                    current_number = parse_single_char_digit_as_number(character)
+                current_type = current_number.type
+                if current_type is NumberType.MULTIPLE:
+                    break
+                if current_type is NumberType.REGULAR:
+                    if previous_type is NumberType.REGULAR:
+                        raise ValueError(f"Number contained two or more consecutive japanese numbers that were not "
+                                         f"multipliers {kanji_string}")
+                    multiplier_value = current_number.value
+                elif current_type is NumberType.UNIT:
+                    group_value = group_value + current_number.value * multiplier_value
+                    multiplier_value = 1
+                else:
+                    contains_zero = True
+                previous_type = current_type
+                index = index + 1
+            if contains_zero and index - group_start > 1:
+                raise ValueError(f"Number unexpectedly contained a zero: {kanji_string}")
+            if previous_type is NumberType.REGULAR:
+                group_value = group_value + multiplier_value
+            if group_value >= 10000:
+                raise ValueError(f"Number contained a value equal to or above ten thousand between multipliers: "
+                                 f"{kanji_string}")
+            base_value = group_value
+
+    return final_number + base_value
+
+
+def _group_below_ten_thousand_to_value(group: str, kanji_string: str) -> int:
+    # Converts the part of a traditional style number between two multipliers, such as 三百五十, 47176百 or ９千２百
+    if not NUMBER_CHARACTERS.issuperset(group):
+        for character in group:
+            if not character.isdigit() and character not in ALL_NUMBERS:
+                raise ValueError(f"Number could not be parsed due to containing \"{character}\": {kanji_string}")
 
-        index = index + 1
+    if group.isdigit():
+        return int(group)
+
+    # Split the leading digits from the kanji, like 47176 and 百
+    number_length = 0
+    while number_length < len(group) and group[number_length].isdecimal():
+        number_length = number_length + 1
+    nonnumber = group[number_length:]
+    for character in nonnumber:
+        if character not in ALL_NUMBERS and not character.isdecimal():
+            raise ValueError(f"Number could not be parsed due to containing \"{character}\": {kanji_string}")
+
+    value_of_nonnumber = string_number_below_ten_thousand_to_value(nonnumber)
+    if number_length == 0:
+        # Ex: 三百五十
+        return value_of_nonnumber
+    number = int(group[:number_length])
+    if number > value_of_nonnumber:
+        # Ex: 47176百
+        return number * value_of_nonnumber
+    # Ex: ９千２百３十４
+    return string_number_below_ten_thousand_to_value(group)
+
+
+def number_conversion_cache_info() -> Dict[str, Any]:
+    """
+    Statistics of the caches used by the number conversion functions
+    :return: The cache info (hits, misses, maxsize, currsize) for each cached function
+    """
+    return {
+        "dirty_mixed_number_to_value": dirty_mixed_number_to_value.cache_info(),
+        "clean_mixed_number_to_value": clean_mixed_number_to_value.cache_info()
+    }
 
-    final_number = final_number + base_value
 
-    return final_number
+def clear_number_conversion_cache() -> None:
+    """
+    Empties the caches used by the number conversion functions and resets their statistics
+    """
+    dirty_mixed_number_to_value.cache_clear()
+    clean_mixed_number_to_value.cache_clear()
 
 
-def split_number_and_kanji(kanji_number: str) -> Tuple[int, str]:
-    matches = ExtractNumberAndNonNumbersRegex.search(kanji_number)
-    number = matches.group("numbers")
-    nonnumber = matches.group("nonnumbers")
-    if not number and not nonnumber:
-        raise ValueError(f"Number could not be parsed: {kanji_number}")
-    return int(number) if number.isdigit() else 1, nonnumber
+def batch_mixed_numbers_to_values(mixed_strings: Iterable[str]) -> BatchNumberValues:
+    """
+    Converts many dirty number strings at once, such as a column of extracted numbers.
+    Each distinct string is only converted once, strings of only digits are converted with int directly and the
+    remaining strings with dirty_mixed_number_to_value.
+    Strings that can not be converted, or whose value does not fit in a signed 64 bit integer, do not raise
+    an exception but are marked in the errors of the result, as are elements that are not strings, such as None.
+    :param mixed_strings: Any dirty digit/kanji strings, such as ["2019", "２,000億", "ゼロ"]
+    :return: Arrays with the value (signed 64 bit integers) and error flag (0 or 1) of each string
+    """
+    strings = mixed_strings if isinstance(mixed_strings, list) else list(mixed_strings)
+    unique_strings = dict.fromkeys(strings)
+
+    digit_strings = [string for string in unique_strings
+                     if isinstance(string, str) and string.isdecimal() and len(string) <= BATCH_MAX_DIGITS]
+    values_by_string = dict(zip(digit_strings, map(int, digit_strings)))
+
+    for string in unique_strings:
+        if string in values_by_string or not isinstance(string, str):
+            continue
+        try:
+            value = dirty_mixed_number_to_value(string)
+        except ValueError:
+            continue
+        if BATCH_VALUE_MIN <= value <= BATCH_VALUE_MAX:
+            values_by_string[string] = value
+
+    return BatchNumberValues(values=array("q", [values_by_string.get(string, 0) for string in strings]),
+                             errors=array("b", [string not in values_by_string for string in strings]))
+
+
+def integer_string_to_value(integer_string: str) -> Optional[int]:
+    """
+    Converts a string of digits the way int() does (surrounding blanks and a sign are allowed), but returns None
+    instead of raising an exception when the string is not an integer
+    :param integer_string: Any string, such as "2019", "２０１９" or " -5"
+    :return: The corresponding numerical value, or None if the string is not an integer
+    """
+    if integer_string.isdecimal():
+        return int(integer_string)
+    stripped_string = integer_string.strip()
+    if stripped_string[:1] in ("+", "-") and stripped_string[1:].isdecimal() or stripped_string.isdecimal():
+        return int(stripped_string)
+    return None
 
 
 def western_style_kanji_to_value(kanji_string: str) -> int:
@@ -202,19 +340,11 @@ def western_style_kanji_to_value(kanji_string: str) -> int:
     :param kanji_string: Any western style kanji string, such as "弐〇〇〇"
     :return: The corresponding numerical value
     """
-    try:
-        final_number = ""
-        for char in kanji_string:
-            number = parse_single_char_kanji_as_number(kanji=char)
-            if number.type in [NumberType.ZERO, NumberType.REGULAR]:
-                final_number = final_number + str(number.value)
-            else:
-                raise ValueError
-
-        return int(final_number)
-    except ValueError:
+    if not kanji_string or not KANJI_DIGITS.issuperset(kanji_string):
         raise ValueError(f"Failed to parse the string as a western style number: {kanji_string}")
 
+    return int(kanji_string.translate(KANJI_DIGITS_TABLE))
+
 
 def string_number_below_ten_thousand_to_value(numeric_string: str) -> int:
     """
@@ -223,45 +353,10 @@ def string_number_below_ten_thousand_to_value(numeric_string: str) -> int:
     :param numeric_string: Any digit or kanji up to 万 (exclusive)
     :return: A integer transformation of the number
     """
-    # Try to convert, if it fails, assume it is a Kanji number
-    try:
-        # Try converting it with python
-        final_numerical_value = int(numeric_string)
-    except ValueError:
-        # Upon failure, assume it is a Japanese value string
-        rest_value = 0
-        multiplier_value = 1
-        final_numerical_value = 0
-        previous_numerical_type = None
-        for index, char in enumerate(numeric_string):
-            current_number = parse_single_char_digit_as_number(char)
-
-            if current_number.type == NumberType.MULTIPLE:
-                raise ValueError(f"Number unexpectedly contained a multiplier above ten thousand: {numeric_string}")
-
-            if current_number.type == NumberType.ZERO and len(numeric_string) > 1:
-                raise ValueError(f"Number unexpectedly contained a zero: {numeric_string}")
-
-            if current_number.type == NumberType.REGULAR and previous_numerical_type == NumberType.REGULAR:
-                raise ValueError(
-                    f"Number contained two or more consecutive japanese numbers that were not multipliers {numeric_string}")
-
-            if index == len(numeric_string) - 1:
-                if current_number.type == NumberType.REGULAR:
-                    # Save the remainder for the final value, for example 二百五十五 → 5
-                    rest_value = current_number.value
-                elif current_number.type == NumberType.UNIT:
-                    # Save the remainder for the final value, for example 二百五十 → 0
-                    rest_value = 0
-                    final_numerical_value = final_numerical_value + current_number.value * multiplier_value
-            else:
-                if current_number.type == NumberType.REGULAR:
-                    multiplier_value = current_number.value
-                elif current_number.type == NumberType.UNIT:
-                    final_numerical_value = final_numerical_value + current_number.value * multiplier_value
-                    multiplier_value = 1
-            previous_numerical_type = current_number.type
-        final_numerical_value = final_numerical_value + rest_value
+    final_numerical_value = integer_string_to_value(numeric_string)
+    if final_numerical_value is None:
+        # Otherwise, assume it is a Japanese value string
+        final_numerical_value = kanji_number_below_ten_thousand_to_value(numeric_string)
 
     if final_numerical_value < 0:
         raise ValueError(
@@ -274,24 +369,69 @@ def string_number_below_ten_thousand_to_value(numeric_string: str) -> int:
     return final_numerical_value
 
 
+def kanji_number_below_ten_thousand_to_value(numeric_string: str) -> int:
+    """
+    Converts a traditional style kanji number below 万, possibly mixed with digits, such as "９千２百３十４"
+    :param numeric_string: Any digit or kanji up to 万 (exclusive)
+    :return: A integer transformation of the number
+    """
+    rest_value = 0
+    multiplier_value = 1
+    final_numerical_value = 0
+    previous_numerical_type = None
+    last_index = len(numeric_string) - 1
+    for index, char in enumerate(numeric_string):
+        current_number = NUMBER_TABLE.get(ord(char))
+        if current_number is None:
+            current_number = parse_single_char_digit_as_number(char)
+        current_type = current_number.type
+
+        if current_type is NumberType.MULTIPLE:
+            raise ValueError(f"Number unexpectedly contained a multiplier above ten thousand: {numeric_string}")
+
+        if current_type is NumberType.ZERO and last_index > 0:
+            raise ValueError(f"Number unexpectedly contained a zero: {numeric_string}")
+
+        if current_type is NumberType.REGULAR and previous_numerical_type is NumberType.REGULAR:
+            raise ValueError(
+                f"Number contained two or more consecutive japanese numbers that were not multipliers {numeric_string}")
+
+        if index == last_index:
+            if current_type is NumberType.REGULAR:
+                # Save the remainder for the final value, for example 二百五十五 → 5
+                rest_value = current_number.value
+            elif current_type is NumberType.UNIT:
+                # Save the remainder for the final value, for example 二百五十 → 0
+                final_numerical_value = final_numerical_value + current_number.value * multiplier_value
+        else:
+            if current_type is NumberType.REGULAR:
+                multiplier_value = current_number.value
+            elif current_type is NumberType.UNIT:
+                final_numerical_value = final_numerical_value + current_number.value * multiplier_value
+                multiplier_value = 1
+        previous_numerical_type = current_type
+
+    return final_numerical_value + rest_value
+
+
 def parse_single_char_digit_as_number(digit: Any) -> CustomNumber:
     """
     Parses a single char digit to a numeric value and type
     :param digit: The character to parse (eg. 9、９、九, 百)
     :return: A tuple with the value and NumberType
     """
-    try:
-        return parse_single_char_kanji_as_number(kanji=digit)
-    except ValueError:
-        if digit.isdigit():
-            input_number = int(digit)
-            if input_number == 0:
-                return CustomNumber(str(digit), input_number, NumberType.ZERO)
-            else:
-                return CustomNumber(str(digit), input_number, NumberType.REGULAR)
+    number = NUMBER_TABLE.get(ord(digit)) if isinstance(digit, str) and len(digit) == 1 else None
+    if number is not None:
+        return number
+    if isinstance(digit, str) and digit.isdecimal():
+        # Digits of other scripts, such as Arabic-Indic digits
+        input_number = int(digit)
+        if input_number == 0:
+            return CustomNumber(str(digit), input_number, NumberType.ZERO)
         else:
-            raise ValueError(
-                f"The numeric value could not be interpreted as either a kanji number or normal number: {digit}")
+            return CustomNumber(str(digit), input_number, NumberType.REGULAR)
+    raise ValueError(
+        f"The numeric value could not be interpreted as either a kanji number or normal number: {digit}")
 
 
 def parse_single_char_kanji_as_number(kanji: Any) -> CustomNumber:
@@ -300,7 +440,7 @@ def parse_single_char_kanji_as_number(kanji: Any) -> CustomNumber:
     :param kanji: The kanji to parse (eg. 九, 百)
     :return: A tuple with the value and NumberType
     """
-    if kanji in japanese_number_dict.keys():
-        return japanese_number_dict[kanji]
-    else:
+    number = japanese_number_dict.get(kanji)
+    if number is None:
         raise ValueError(f"The numeric value could not be interpreted as a kanji number: {kanji}")
+    return number
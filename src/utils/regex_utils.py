@@ -0,0 +1,70 @@
+from os import replace, getpid
+from os.path import join
+from sys import version_info
+from typing import Optional, Pattern, Dict, Iterable
+
+import regex
+
+from src.utils.io_utils import create_directory_if_not_exists, is_file
+
+# Path to a folder with pickled compiled regexes, the cache is only used when a path has been set
+_compiled_regex_cache_path: Optional[str] = None
+
+
+def set_compiled_regex_cache_path(path: Optional[str]) -> None:
+    """
+    Enables (or disables) the on-disk cache of compiled regexes.
+    Since regexes are compiled on first use, this only needs to be called before the first extraction.
+    :param path: Path to a folder where the compiled regexes are stored, or None to disable the cache
+    """
+    global _compiled_regex_cache_path
+    _compiled_regex_cache_path = path
+
+
+def compiled_regex_cache_key(regex_string: str, named_lists: Dict[str, Iterable[str]]) -> str:
+    """
+    Creates a key identifying a compiled regex, which changes whenever the regex, the named lists or
+    the versions of Python and the regex library change.
+    :param regex_string: The regex before compilation
+    :param named_lists: The named lists used by the regex
+    :return: A hexadecimal hash
+    """
+    from hashlib import sha256
+
+    key = sha256()
+    key.update(f"{tuple(version_info)}\n{regex.__version__}\n{regex_string}\n".encode("utf-8"))
+    for name in sorted(named_lists.keys()):
+        key.update(f"{name}={sorted(named_lists[name])}\n".encode("utf-8"))
+    return key.hexdigest()
+
+
+def compile_regex(regex_string: str, named_lists: Dict[str, Iterable[str]]) -> Pattern:
+    """
+    Compiles a regex with named lists, reading and storing the compiled regex in the on-disk cache if enabled
+    :param regex_string: The regex to compile
+    :param named_lists: The named lists used by the regex
+    :return: The compiled regex
+    """
+    cache_path = _compiled_regex_cache_path
+    if cache_path is None:
+        return regex.compile(regex_string, **named_lists)
+
+    # Only imported when the cache is used, to keep importing the extractors fast
+    import pickle
+
+    cache_file_path = join(cache_path, compiled_regex_cache_key(regex_string, named_lists) + ".pickle")
+    if is_file(cache_file_path):
+        try:
+            with open(cache_file_path, "rb") as cache_file:
+                return pickle.load(cache_file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError):
+            pass  # Broken cache file, compile again and replace it
+
+    compiled_regex = regex.compile(regex_string, **named_lists)
+    create_directory_if_not_exists(cache_path)
+    # Write to a temporary file first, so that other processes never read a partially written file
+    temporary_file_path = f"{cache_file_path}.{getpid()}.tmp"
+    with open(temporary_file_path, "wb") as cache_file:
+        pickle.dump(compiled_regex, cache_file)
+    replace(temporary_file_path, cache_file_path)
+    return compiled_regex
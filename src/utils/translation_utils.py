@@ -0,0 +1,29 @@
+from typing import Callable, Optional
+
+HALF2FULL = dict((i, i + 0xFEE0) for i in range(0x21, 0x7F))
+HALF2FULL[0x20] = 0x3000
+
+FULL2HALF = dict((i + 0xFEE0, i) for i in range(0x21, 0x7F))
+FULL2HALF[0x3000] = 0x20
+
+
+class TranslationTable(dict):
+    """
+    A table for str.translate that translates characters using a function, for when the characters
+    to translate can not be listed up front (for example all numeric characters).
+    The function is only called the first time a character is seen, after that str.translate finds the
+    translation in the table itself.
+    """
+    __slots__ = ("_translate_character",)
+
+    def __init__(self, translate_character: Callable[[str], Optional[str]]) -> None:
+        """
+        :param translate_character: Returns the translation of a character, or None to delete it
+        """
+        super().__init__()
+        self._translate_character = translate_character
+
+    def __missing__(self, codepoint: int) -> Optional[str]:
+        translation = self._translate_character(chr(codepoint))
+        self[codepoint] = translation
+        return translation
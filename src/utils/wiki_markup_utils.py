@@ -0,0 +1,70 @@
+from html import unescape
+from typing import Pattern, Match
+
+import regex
+
+# Namespaces of links that are removed instead of replaced by their text, in Japanese and English
+REMOVED_LINK_NAMESPACES = ("ファイル", "画像", "カテゴリ", "file", "image", "media", "category")
+
+CommentRegex = regex.compile(r"<!--.*?-->", regex.DOTALL)
+ReferenceRegex = regex.compile(r"<ref(?:\s[^>]*)?/>|<ref(?:\s[^>]*)?>.*?</ref\s*>", regex.DOTALL | regex.IGNORECASE)
+# The innermost template or table, nested ones are removed from the inside out
+TemplateRegex = regex.compile(r"\{\{[^{}]*\}\}")
+TableRegex = regex.compile(r"\{\|(?:(?!\{\|).)*?\|\}", regex.DOTALL)
+# The innermost internal link, with the target and the optional label after the last |
+InternalLinkRegex = regex.compile(r"\[\[([^\[\]|]*)(?:\|([^\[\]]*))?\]\]")
+ExternalLinkRegex = regex.compile(r"\[(?:https?:)?//[^\s\]]*(?:\s([^\]]*))?\]")
+HtmlTagRegex = regex.compile(r"</?[a-zA-Z][^<>]*>")
+EmphasisRegex = regex.compile(r"'{2,}")
+HeadingRegex = regex.compile(r"^(=+)\s*(.*?)\s*\1\s*$", regex.MULTILINE)
+ListMarkerRegex = regex.compile(r"^[*#:;]+\s*", regex.MULTILINE)
+EmptyLinesRegex = regex.compile(r"\n{3,}")
+
+
+def strip_wiki_markup(wiki_text: str) -> str:
+    """
+    Turns the wiki markup of a Wikipedia page into plain text. Links are replaced by their text, headings and lists
+    by their content, and templates, tables, references, files, categories and comments are removed.
+    This is an approximation, but keeps the running text that data is extracted from.
+    :param wiki_text: The source of a page, as found in a Wikipedia dump
+    :return: The plain text
+    """
+    text = CommentRegex.sub("", wiki_text)
+    text = ReferenceRegex.sub("", text)
+    text = _remove_nested(TemplateRegex, text)
+    text = _remove_nested(TableRegex, text)
+    text = _replace_internal_links(text)
+    text = ExternalLinkRegex.sub(lambda match: match.group(1) or "", text)
+    text = HtmlTagRegex.sub("", text)
+    text = EmphasisRegex.sub("", text)
+    text = HeadingRegex.sub(r"\2", text)
+    text = ListMarkerRegex.sub("", text)
+    text = unescape(text)
+    return EmptyLinesRegex.sub("\n\n", text).strip()
+
+
+def _remove_nested(compiled_regex: Pattern, text: str) -> str:
+    # Removes the innermost matches until there are none left
+    count = 1
+    while count:
+        text, count = compiled_regex.subn("", text)
+    return text
+
+
+def _replace_internal_links(text: str) -> str:
+    # Links can be nested in the caption of a file, so the innermost links are replaced until there are none left
+    count = 1
+    while count:
+        text, count = InternalLinkRegex.subn(_internal_link_text, text)
+    return text
+
+
+def _internal_link_text(match: Match) -> str:
+    target, label = match.group(1), match.group(2)
+    namespace, separator, _ = target.partition(":")
+    if separator and namespace.strip().lower() in REMOVED_LINK_NAMESPACES:
+        return ""
+    if label is None:
+        return target
+    # Files have several parameters, the label is the last one
+    return label.rsplit("|", 1)[-1]
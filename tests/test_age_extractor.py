@@ -0,0 +1,69 @@
+# Tests /src/extractor/age_extractor
+
+import unittest
+
+from src.extractor.age_extractor import extract_all_ages, extract_all_age_matches, iter_extract_all_ages
+from src.extractor.models.ExtractedMatch import AgeMatch, to_extracted_list
+
+
+class TestExtract(unittest.TestCase):
+    def test_extract_single_age_western_numbers(self):
+        string_containing_age = "次男は５歳です。"
+        extracted_data = extract_all_ages(target_string=string_containing_age)
+
+        expected_extraction = [((3, 5),
+                                {
+                                    "age_string": "５歳",
+                                    "age_value": 5
+                                })]
+
+        self.assertEqual(extracted_data, expected_extraction,
+                         f"Result {extracted_data} is not the same as expectation {expected_extraction}")
+
+    def test_extract_all_ages_kanji_numbers(self):
+        age_strings_and_values = {
+            "ゼロ歳": 0,
+            "〇歳": 0,
+            "十二歳": 12,
+            "二十才": 20,
+            "弐拾歳": 20,
+            "九十九歳": 99,
+            "一〇五才": 105,
+            "百二十歳": 120
+        }
+
+        for age_string, age_value in age_strings_and_values.items():
+            string_containing_age = f"祖父は{age_string}です。"
+            extracted_data = extract_all_ages(target_string=string_containing_age)
+
+            expected_extraction = [((3, 3 + len(age_string)),
+                                    {
+                                        "age_string": age_string,
+                                        "age_value": age_value
+                                    })]
+
+            self.assertEqual(extracted_data, expected_extraction,
+                             f"Result {extracted_data} is not the same as expectation {expected_extraction}")
+
+    def test_ages_above_maximum_are_not_extracted(self):
+        for string_containing_age in ["百二十一歳", "121歳", "十一二歳", "1000才"]:
+            extracted_data = extract_all_ages(target_string=string_containing_age)
+
+            self.assertEqual(extracted_data, [], f"Unexpected result {extracted_data} for {string_containing_age}")
+
+    def test_extract_all_age_matches(self):
+        string_containing_ages = "長男は十二歳、次男は５歳です。"
+        extracted_matches = extract_all_age_matches(target_string=string_containing_ages)
+
+        self.assertEqual(len(extracted_matches), 2)
+        self.assertIsInstance(extracted_matches[0], AgeMatch)
+        self.assertEqual([match.age_value for match in extracted_matches], [12, 5])
+        self.assertEqual(to_extracted_list(extracted_matches), extract_all_ages(target_string=string_containing_ages))
+
+    def test_iter_extract_all_ages_same_as_extract_all_ages(self):
+        string_containing_ages = "長男は十二歳、次男は５歳です。" * 5
+        chunks = [string_containing_ages[index:index + 4] for index in range(0, len(string_containing_ages), 4)]
+
+        extracted_data = list(iter_extract_all_ages(stream=chunks))
+
+        self.assertEqual(extracted_data, extract_all_ages(target_string=string_containing_ages))
@@ -0,0 +1,75 @@
+# Tests /src/extractor/async_extractor
+
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from unittest.mock import patch
+
+from src.extractor.async_extractor import aextract_all_dates, aextract_all, aiter_extract_all_dates, \
+    aextract_all_postal_codes, set_default_executor
+from src.extractor.combined_extractor import extract_all
+from src.extractor.date_extractor import extract_all_dates
+
+
+class TestAsyncExtract(unittest.TestCase):
+    string_containing_data = "今日は平成三一年四月三日です。会議は午後3時15分から、〒012‐2321の事務所で。2019-04-03にも。"
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        set_default_executor(None)
+        self.loop.close()
+
+    def test_aextract_all_dates(self):
+        extracted_data = self.loop.run_until_complete(aextract_all_dates(target_string=self.string_containing_data))
+
+        expected_extraction = extract_all_dates(target_string=self.string_containing_data)
+
+        self.assertEqual(len(extracted_data), 2)
+        self.assertEqual(extracted_data, expected_extraction,
+                         f"Result {extracted_data} is not the same as expectation {expected_extraction}")
+
+    def test_aextract_all_with_executor(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            set_default_executor(executor)
+            extracted_data = self.loop.run_until_complete(aextract_all(target_string=self.string_containing_data))
+
+        self.assertEqual(extracted_data, extract_all(target_string=self.string_containing_data))
+
+    def test_cancelled_extraction_is_not_run(self):
+        release_executor = Event()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Keep the only worker busy, so the extraction is still waiting when it is cancelled
+            executor.submit(release_executor.wait)
+
+            async def cancel_extraction():
+                task = asyncio.ensure_future(aextract_all_postal_codes(target_string=self.string_containing_data,
+                                                                       executor=executor))
+                await asyncio.sleep(0.01)
+                task.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+
+            with patch("src.extractor.async_extractor.extract_all_postal_codes") as extract_function:
+                self.loop.run_until_complete(cancel_extraction())
+                release_executor.set()
+                executor.shutdown(wait=True)
+
+        extract_function.assert_not_called()
+
+    def test_aiter_extract_all_dates(self):
+        async def chunks():
+            for index in range(0, len(self.string_containing_data), 4):
+                await asyncio.sleep(0)
+                yield self.string_containing_data[index:index + 4]
+
+        async def collect():
+            return [extracted_item async for extracted_item in aiter_extract_all_dates(stream=chunks())]
+
+        extracted_data = self.loop.run_until_complete(collect())
+
+        expected_extraction = extract_all_dates(target_string=self.string_containing_data)
+        self.assertEqual(extracted_data, expected_extraction,
+                         f"Result {extracted_data} is not the same as expectation {expected_extraction}")
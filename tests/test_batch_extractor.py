@@ -0,0 +1,42 @@
+# Tests /src/extractor/batch_extractor
+
+import unittest
+
+from src.extractor.batch_extractor import extract_batch, extract_batch_as_completed
+from src.extractor.combined_extractor import extract_all
+
+
+class TestExtract(unittest.TestCase):
+    documents = ["今日は平成三一年四月三日です。",
+                 "会議は午後3時15分から、〒012‐2321の事務所で。",
+                 "何もない文章。",
+                 "前の会議は2019-04-03の10:30で、場所は二二二の一二一二でした。"]
+
+    def test_extract_batch_in_input_order(self):
+        extracted_data = extract_batch(documents=self.documents, workers=2, chunksize=2)
+
+        expected_extraction = [extract_all(target_string=document) for document in self.documents]
+
+        self.assertEqual(extracted_data, expected_extraction,
+                         f"Result {extracted_data} is not the same as expectation {expected_extraction}")
+
+    def test_extract_batch_selected_extractors(self):
+        extracted_data = extract_batch(documents=self.documents, extractors=["postal_code"], workers=1)
+
+        expected_extraction = [extract_all(target_string=document, kinds=["postal_code"])
+                               for document in self.documents]
+
+        self.assertEqual(extracted_data, expected_extraction,
+                         f"Result {extracted_data} is not the same as expectation {expected_extraction}")
+
+    def test_extract_batch_as_completed_with_identifiers(self):
+        identified_documents = ((index, document) for index, document in enumerate(self.documents))
+
+        extracted_data = dict(extract_batch_as_completed(identified_documents=identified_documents,
+                                                         extractors=["date"], workers=2, chunksize=1))
+
+        expected_extraction = {index: extract_all(target_string=document, kinds=["date"])
+                               for index, document in enumerate(self.documents)}
+
+        self.assertEqual(extracted_data, expected_extraction,
+                         f"Result {extracted_data} is not the same as expectation {expected_extraction}")
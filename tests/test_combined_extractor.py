@@ -0,0 +1,115 @@
+# Tests /src/extractor/combined_extractor
+
+import unittest
+
+from src.extractor.age_extractor import extract_all_ages
+from src.extractor.combined_extractor import extract_all, reextract_all, extract_all_by_paragraph
+from src.extractor.currency_amount_extractor import extract_all_currency_amounts
+from src.extractor.date_extractor import extract_all_dates
+from src.extractor.models.TextEdit import TextEdit
+from src.extractor.phone_number_extractor import extract_all_phone_numbers
+from src.extractor.postal_code_extractor import extract_all_postal_codes
+from src.extractor.time_extractor import extract_all_times
+
+
+class TestExtract(unittest.TestCase):
+    string_containing_data = """今日は平成三一年四月三日です。会議は午後3時15分から、〒012‐2321の事務所(電話03-1234-5678)で。会費は３,000円。講師は四十二歳、
+    前の会議は2019-04-03の10:30で、場所は二二二の一二一二(電話０１２０-１２３-４５６)でした。交通費は千五百円でした。参加者は35才でした。"""
+
+    def test_extract_all_kinds_same_as_separate_extractors(self):
+        extracted_data = extract_all(target_string=self.string_containing_data)
+
+        expected_extraction = {
+            "date": extract_all_dates(target_string=self.string_containing_data),
+            "time": extract_all_times(target_string=self.string_containing_data),
+            "postal_code": extract_all_postal_codes(target_string=self.string_containing_data),
+            "phone_number": extract_all_phone_numbers(target_string=self.string_containing_data),
+            "currency_amount": extract_all_currency_amounts(target_string=self.string_containing_data),
+            "age": extract_all_ages(target_string=self.string_containing_data)
+        }
+
+        self.assertEqual(extracted_data, expected_extraction,
+                         f"Result {extracted_data} is not the same as expectation {expected_extraction}")
+        for kind, extracted_list in extracted_data.items():
+            self.assertEqual(len(extracted_list), 2, f"Expected two matches of {kind} but got {extracted_list}")
+
+    def test_extract_selected_kinds(self):
+        extracted_data = extract_all(target_string=self.string_containing_data, kinds=["postal_code"])
+
+        self.assertEqual(list(extracted_data.keys()), ["postal_code"])
+
+    def test_extract_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            extract_all(target_string=self.string_containing_data, kinds=["date", "unknown"])
+
+    def test_extract_normalized(self):
+        full_width_string = "電話：０３－１２３４－５６７８、〒０１２－２３２１、２０１９／０４／０３、ＪＰＹ１,０００"
+        half_width_string = "電話:03-1234-5678、〒012-2321、2019/04/03、JPY1,000"
+
+        self.assertEqual({kind: extracted_list for kind, extracted_list in extract_all(full_width_string).items()
+                          if extracted_list}, {})
+
+        extracted_data = extract_all(target_string=full_width_string, normalize=True)
+
+        self.assertEqual(extracted_data, extract_all(target_string=half_width_string))
+        self.assertEqual([full_width_string[start:end] for kind in ("phone_number", "postal_code", "date")
+                          for (start, end), _ in extracted_data[kind]],
+                         ["０３－１２３４－５６７８", "〒０１２－２３２１", "２０１９／０４／０３"])
+
+    def test_reextract_all_same_as_extract_all(self):
+        previous_extracted_data = extract_all(target_string=self.string_containing_data)
+        edits = [
+            TextEdit(offset=0, deleted_length=0, inserted_text="昨日は2019年12月31日、"),
+            TextEdit(offset=self.string_containing_data.index("３,000円"), deleted_length=6, inserted_text="五千円"),
+            TextEdit(offset=self.string_containing_data.index("35才"), deleted_length=1, inserted_text=""),
+            TextEdit(offset=len(self.string_containing_data), deleted_length=0, inserted_text="〒100-0001")
+        ]
+
+        for edit in edits:
+            extracted_data = reextract_all(previous_extracted_data=previous_extracted_data,
+                                           previous_string=self.string_containing_data, edit=edit)
+
+            self.assertEqual(extracted_data, extract_all(target_string=edit.apply(self.string_containing_data)),
+                             f"Extracting again after {edit} is not the same as extracting from the edited string")
+
+    def test_reextract_all_long_matches(self):
+        # Amounts and phone numbers have no maximum length, an edit at their end changes the whole match
+        long_string = "代金は1" + ",000" * 10 + "円です。電話は03" + "　" * 40 + "1234-5678まで"
+        previous_extracted_data = extract_all(target_string=long_string)
+        edits = [
+            TextEdit(offset=long_string.index("円"), deleted_length=1, inserted_text="人"),
+            TextEdit(offset=long_string.index("5678"), deleted_length=0, inserted_text="9")
+        ]
+
+        for edit in edits:
+            extracted_data = reextract_all(previous_extracted_data=previous_extracted_data,
+                                           previous_string=long_string, edit=edit)
+
+            self.assertEqual(extracted_data, extract_all(target_string=edit.apply(long_string)),
+                             f"Extracting again after {edit} is not the same as extracting from the edited string")
+
+    def test_extract_all_by_paragraph_same_as_extract_all(self):
+        boilerplate = "お問い合わせ：電話03-1234-5678（平日9:00～17:00）"
+        documents = [boilerplate + "\n" + self.string_containing_data + "\n\n" + boilerplate,
+                     "2020年1月1日に更新\n" + boilerplate]
+        paragraph_cache = {}
+
+        for document in documents:
+            self.assertEqual(extract_all_by_paragraph(target_string=document, paragraph_cache=paragraph_cache),
+                             extract_all(target_string=document))
+        self.assertEqual(len(paragraph_cache), 4)
+
+    def test_extract_all_by_paragraph_different_kinds(self):
+        paragraph_cache = {}
+
+        for kinds in [["date"], ["phone_number", "age"], None, ["date"]]:
+            self.assertEqual(extract_all_by_paragraph(target_string=self.string_containing_data, kinds=kinds,
+                                                      paragraph_cache=paragraph_cache),
+                             extract_all(target_string=self.string_containing_data, kinds=kinds))
+        self.assertEqual(len(paragraph_cache), 6)
+
+    def test_extract_all_by_paragraph_copies_data(self):
+        extracted_data = extract_all_by_paragraph(target_string="35才\n35才", kinds=["age"])
+
+        extracted_data["age"][0][1]["age_value"] = 36
+        self.assertEqual([data["age_value"] for _, data in extracted_data["age"]], [36, 35])
@@ -5,7 +5,7 @@ from typing import Dict, List, Callable, Any
 
 from src.extractor.models.PostalCode import PostalCode
 from src.utils.conversion_utils import full_width_string_to_half_width, half_width_string_to_full_width, \
-    parse_postal_code
+    parse_postal_code, parse_age, parse_phone_number
 
 
 class TestNumberConvertionUtils(unittest.TestCase):
@@ -76,3 +76,36 @@ class TestNumberConvertionUtils(unittest.TestCase):
             invalid_numbers=invalid_postal_codes,
             verify_function=parse_postal_code
         )
+
+    def test_parse_age(self):
+        ages_and_values = {
+            "ゼロ": 0,
+            "〇": 0,
+            "7": 7,
+            "４２": 42,
+            "1２": 12,
+            "二十": 20,
+            "二〇": 20,
+            "弐拾": 20,
+            "九十九": 99,
+            "百": 100,
+            "一〇五": 105,
+            "百二十": 120,
+            "１２０": 120
+        }
+
+        self.verify_each_value_equals_expectation_in_dictionary(
+            value_and_expectation=ages_and_values,
+            verify_function=parse_age)
+
+    def test_parse_phone_number(self):
+        phone_numbers_and_values = {
+            "03-1234-5678": "0312345678",
+            "(03)1234 5678": "0312345678",
+            "０１２０ー１２３ー４５６": "0120123456",
+            "＋８１ ９０ １２３４ ５６７８": "+819012345678"
+        }
+
+        self.verify_each_value_equals_expectation_in_dictionary(
+            value_and_expectation=phone_numbers_and_values,
+            verify_function=parse_phone_number)
@@ -0,0 +1,92 @@
+# Tests /src/extractor/currency_amount_extractor
+
+import unittest
+
+from src.extractor.currency_amount_extractor import extract_all_currency_amounts, \
+    extract_all_currency_amount_matches, iter_extract_all_currency_amounts
+from src.extractor.models.ExtractedMatch import CurrencyAmountMatch, to_extracted_list
+
+
+class TestExtract(unittest.TestCase):
+    def test_extract_single_currency_amount_western_numbers(self):
+        string_containing_currency_amount = "お会計は1,234,567円になります。"
+        extracted_data = extract_all_currency_amounts(target_string=string_containing_currency_amount)
+
+        expected_extraction = [((4, 14),
+                                {
+                                    "currency_amount_string": "1,234,567円",
+                                    "currency_amount_value": 1234567
+                                })]
+
+        self.assertEqual(extracted_data, expected_extraction,
+                         f"Result {extracted_data} is not the same as expectation {expected_extraction}")
+
+    def test_extract_single_currency_amount_mixed_numbers(self):
+        string_containing_currency_amount = "代金は２,000億５万円です。"
+        extracted_data = extract_all_currency_amounts(target_string=string_containing_currency_amount)
+
+        expected_extraction = [((3, 12),
+                                {
+                                    "currency_amount_string": "２,000億５万円",
+                                    "currency_amount_value": 200000050000
+                                })]
+
+        self.assertEqual(extracted_data, expected_extraction,
+                         f"Result {extracted_data} is not the same as expectation {expected_extraction}")
+
+    def test_extract_multiple_currency_amounts(self):
+        string_containing_currency_amounts = "￥1,000と三百円と5000日本円、それにJPY47,176百万。"
+        extracted_data = extract_all_currency_amounts(target_string=string_containing_currency_amounts)
+
+        expected_values = {
+            "￥1,000": 1000,
+            "三百円": 300,
+            "5000日本円": 5000,
+            "JPY47,176百万": 47176000000
+        }
+        extracted_values = {data["currency_amount_string"]: data["currency_amount_value"]
+                            for _, data in extracted_data}
+
+        self.assertEqual(extracted_values, expected_values,
+                         f"Result {extracted_values} is not the same as expectation {expected_values}")
+
+    def test_number_without_currency_is_not_extracted(self):
+        extracted_data = extract_all_currency_amounts(target_string="参加者は1,000人で、三百冊の本がある。")
+
+        self.assertEqual(extracted_data, [])
+
+    def test_approximate_currency_amount_is_not_extracted(self):
+        for string_containing_approximate_amount in ["会費は二三千円程度です。", "四五百円", "一二万円", "十数万円", "数百円"]:
+            extracted_data = extract_all_currency_amounts(target_string=string_containing_approximate_amount)
+
+            self.assertEqual(extracted_data, [], string_containing_approximate_amount)
+
+    def test_extract_western_style_kanji_currency_amount(self):
+        extracted_data = extract_all_currency_amounts(target_string="二〇〇〇円と3万五千円")
+
+        self.assertEqual([data["currency_amount_value"] for _, data in extracted_data], [2000, 35000])
+
+    def test_currency_amount_that_can_not_be_converted(self):
+        extracted_data = extract_all_currency_amounts(target_string="20百円")
+
+        self.assertEqual(extracted_data, [((0, 4), {"currency_amount_string": "20百円", "currency_amount_value": None})])
+
+    def test_extract_all_currency_amount_matches(self):
+        string_containing_currency_amounts = "会費は３,000円、交通費は千五百円でした。"
+        extracted_matches = extract_all_currency_amount_matches(target_string=string_containing_currency_amounts)
+
+        self.assertEqual(len(extracted_matches), 2)
+        self.assertIsInstance(extracted_matches[0], CurrencyAmountMatch)
+        self.assertEqual([match.currency_amount_value for match in extracted_matches], [3000, 1500])
+        self.assertEqual(to_extracted_list(extracted_matches),
+                         extract_all_currency_amounts(target_string=string_containing_currency_amounts))
+
+    def test_iter_extract_all_currency_amounts_same_as_extract_all_currency_amounts(self):
+        string_containing_currency_amounts = "会費は３,000円、交通費は千五百円でした。" * 5
+        chunks = [string_containing_currency_amounts[index:index + 4]
+                  for index in range(0, len(string_containing_currency_amounts), 4)]
+
+        extracted_data = list(iter_extract_all_currency_amounts(stream=chunks))
+
+        self.assertEqual(extracted_data,
+                         extract_all_currency_amounts(target_string=string_containing_currency_amounts))
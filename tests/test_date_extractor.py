@@ -1,10 +1,15 @@
 # Tests /src/extractor/date_extractor
 
+import subprocess
+import sys
 import unittest
 
-from src.extractor.date_extractor import extract_all_dates
+from definitions import ROOT_DIR
+from src.extractor.date_extractor import extract_all_dates, iter_extract_all_dates, extract_all_date_matches, \
+    DATE_REGEX
 from src.extractor.models.ComplexDate import ComplexDate
 from src.extractor.models.DateValue import Year, Month, Day, DateValueType
+from src.extractor.models.ExtractedMatch import DateMatch, to_extracted_list
 
 
 class TestExtract(unittest.TestCase):
@@ -107,6 +112,48 @@ class TestExtract(unittest.TestCase):
             self.assertEqual(extracted_data, expected_extraction,
                              f"Result {extracted_data} is not the same as expectation {expected_extraction}")
 
+    def test_iter_extract_all_dates_same_as_extract_all_dates(self):
+        string_containing_dates = "今日は平成三一年四月三日です。昨日は2019-04-02で、来月1日に戻ります。"
+        expected_extraction = extract_all_dates(target_string=string_containing_dates)
+        chunks = [string_containing_dates[index:index + 3] for index in range(0, len(string_containing_dates), 3)]
+
+        extracted_data = list(iter_extract_all_dates(stream=chunks))
+
+        self.assertEqual(len(extracted_data), 3)
+        self.assertEqual(extracted_data, expected_extraction,
+                         f"Result {extracted_data} is not the same as expectation {expected_extraction}")
+
+    def test_extract_all_date_matches(self):
+        string_containing_dates = "今日は平成三一年四月三日です。昨日は2019-04-02でした。"
+        extracted_matches = extract_all_date_matches(target_string=string_containing_dates)
+
+        year = Year(2019, DateValueType.ABSOLUTE)
+        month = Month(4, DateValueType.ABSOLUTE)
+        day = Day(3, DateValueType.ABSOLUTE)
+
+        self.assertEqual(len(extracted_matches), 2)
+        self.assertIsInstance(extracted_matches[0], DateMatch)
+        self.assertEqual(extracted_matches[0].span, (3, 12))
+        self.assertEqual(extracted_matches[0].date, ComplexDate(year=year, month=month, day=day))
+        self.assertEqual(to_extracted_list(extracted_matches), extract_all_dates(target_string=string_containing_dates))
+
+    def test_extract_all_dates_same_as_full_search(self):
+        string_containing_dates = ("何もない文章。" * 10 + "平成三一年四月三日、2019-04-02と十二月三十一日。" +
+                                   "一日目は12日間の中の3日。" + "何もない文章。" * 10) * 3
+        expected_spans = [match.span() for match in DATE_REGEX.finditer(string_containing_dates)]
+
+        extracted_data = extract_all_dates(target_string=string_containing_dates)
+
+        self.assertEqual(len(extracted_data), 12)
+        self.assertEqual([span for span, _ in extracted_data], expected_spans)
+
+    def test_import_does_not_load_heavy_dependencies(self):
+        loaded_modules = subprocess.check_output(
+            [sys.executable, "-c", "import sys; import src.extractor.date_extractor; print(' '.join(sys.modules))"],
+            cwd=ROOT_DIR, universal_newlines=True).split()
+
+        for heavy_dependency in ["pandas", "jsonpickle", "dateutil"]:
+            self.assertNotIn(heavy_dependency, loaded_modules, f"Importing the extractor loaded {heavy_dependency}")
 
     # TODO: Currently this is not supported
     # def test_extract_single_date_relative_day_kanji(self):
@@ -1,20 +1,32 @@
 # Tests /src/downloader/wikipedia/wikipedia_downloader
 
+import json
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from os.path import join
-
-import jsonpickle
+from tempfile import TemporaryDirectory
+from threading import Thread
+from urllib.parse import urlparse, parse_qs
 
 from definitions import TEST_DATA_PATH
-from src.downloader.wikipedia.wikipedia_downloader import get_wikipedia_data_for_output
-from src.utils.io_utils import is_file
+from src.downloader.models.DownloadedData import DownloadedData
+from src.downloader.models.PageCache import PageCache
+from src.downloader.models.Transport import Transport
+from src.downloader.wikipedia.wikipedia_downloader import get_wikipedia_data_for_output, \
+    download_wikipedia_pages_concurrently
+from src.exceptions.downloader_exceptions import PageNotFoundError, TransportError
+from src.utils.io_utils import is_file, load_serializable_object
+from src.utils.json_lines_utils import append_documents, iter_documents
+
+# Cache with the pages of test_pages.json that never goes stale, so the pages are read without network access
+FIXTURE_PAGE_CACHE = PageCache(path=join(TEST_DATA_PATH, "wikipedia_page_cache"), ttl_seconds=None)
 
 
 class TestDownloadWikipediaPages(unittest.TestCase):
 
     def test_download_and_store_wikipedia_pages(self):
         pages = ["リーマン・ショック", "平均寿命"]
-        downloaded_pages = get_wikipedia_data_for_output(pages)
+        downloaded_pages = get_wikipedia_data_for_output(pages, page_cache=FIXTURE_PAGE_CACHE)
 
         stringified_pages = list()
         for index, value in enumerate(downloaded_pages):
@@ -23,9 +35,146 @@ class TestDownloadWikipediaPages(unittest.TestCase):
             self.assertIsNot(value.data, "")
             stringified_pages.append(value)
 
-        output_json_file_name = join(TEST_DATA_PATH, 'test_pages.json')
-        json_object = jsonpickle.encode(stringified_pages)
-        with open(output_json_file_name, 'w') as my_file:
-            my_file.write(json_object)
+        expected_pages = load_serializable_object(TEST_DATA_PATH, "test_pages.json")
+        self.assertEqual([page.data for page in stringified_pages], [page.data for page in expected_pages])
+
+        with TemporaryDirectory() as output_path:
+            append_documents(stringified_pages, output_path, "test_pages.jsonl")
+
+            self.assertTrue(is_file(join(output_path, "test_pages.jsonl")))
+            self.assertEqual([(page.title, page.data, page.revision_id) for page in
+                              iter_documents(output_path, "test_pages.jsonl")],
+                             [(page.title, page.data, page.revision_id) for page in stringified_pages])
+
+
+class StubWikipediaApi(BaseHTTPRequestHandler):
+    """
+    Answers like the MediaWiki API for the pages in the class, the first request of each flaky page fails
+    """
+    pages = {"リーマン・ショック": "リーマン・ショックは2008年9月15日に…", "平均寿命": "平均寿命とは0歳における平均余命…"}
+    revision_ids = {"リーマン・ショック": 100, "平均寿命": 200}
+    flaky_pages = set()
+    requested_titles = []
+    requested_properties = []
+
+    def do_GET(self):
+        parameters = parse_qs(urlparse(self.path).query)
+        titles = parameters["titles"][0].split("|")
+        self.requested_titles.extend(titles)
+        self.requested_properties.append(parameters["prop"][0])
+        if titles[0] in self.flaky_pages:
+            self.flaky_pages.discard(titles[0])
+            self.send_response(503)
+            self.end_headers()
+            return
+
+        pages = []
+        for title in titles:
+            if title in self.pages:
+                page = {"pageid": 1, "title": title, "lastrevid": self.revision_ids[title]}
+                if "extracts" in parameters["prop"][0]:
+                    page["extract"] = self.pages[title]
+            else:
+                page = {"title": title, "missing": True}
+            pages.append(page)
+        body = json.dumps({"batchcomplete": True, "query": {"pages": pages}}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *arguments):
+        pass
+
+
+class TestDownloadWikipediaPagesConcurrently(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubWikipediaApi)
+        cls.api_url = f"http://127.0.0.1:{cls.server.server_port}/w/api.php"
+        Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StubWikipediaApi.requested_titles.clear()
+        StubWikipediaApi.requested_properties.clear()
+        StubWikipediaApi.flaky_pages.clear()
+
+    def test_download_pages_in_order(self):
+        pages = ["平均寿命", "リーマン・ショック"] * 5
+
+        downloaded_pages = download_wikipedia_pages_concurrently(pages, api_url=self.api_url, workers=4)
+
+        self.assertEqual([page.title for page in downloaded_pages], pages)
+        self.assertEqual([page.data for page in downloaded_pages], [StubWikipediaApi.pages[page] for page in pages])
+
+    def test_retry_temporary_errors(self):
+        StubWikipediaApi.flaky_pages.add("平均寿命")
+
+        downloaded_pages = download_wikipedia_pages_concurrently(["平均寿命"], api_url=self.api_url,
+                                                                 backoff_seconds=0)
+
+        self.assertEqual(downloaded_pages[0].data, StubWikipediaApi.pages["平均寿命"])
+        self.assertEqual(StubWikipediaApi.requested_titles, ["平均寿命", "平均寿命"])
+
+    def test_give_up_after_retries(self):
+        StubWikipediaApi.flaky_pages.add("平均寿命")
+
+        with self.assertRaises(TransportError):
+            download_wikipedia_pages_concurrently(["平均寿命"], api_url=self.api_url, retries=0)
+
+    def test_missing_page(self):
+        with self.assertRaises(PageNotFoundError):
+            download_wikipedia_pages_concurrently(["平均寿命", "存在しないページ"], api_url=self.api_url)
+
+    def test_custom_transport(self):
+        class StaticTransport(Transport):
+            def get_json(self, url, parameters):
+                return {"query": {"pages": [{"title": parameters["titles"], "extract": "本文"}]}}
+
+        downloaded_pages = download_wikipedia_pages_concurrently(["平均寿命"], transport=StaticTransport())
+
+        self.assertEqual((downloaded_pages[0].title, downloaded_pages[0].data), ("平均寿命", "本文"))
+
+    def test_transport_without_get_json(self):
+        class IncompleteTransport(Transport):
+            pass
+
+        with self.assertRaises(TypeError):
+            IncompleteTransport()
+
+    def test_page_cache(self):
+        with TemporaryDirectory() as cache_path:
+            page_cache = PageCache(path=cache_path)
+            downloaded_pages = download_wikipedia_pages_concurrently(["平均寿命"], api_url=self.api_url,
+                                                                     page_cache=page_cache)
+            self.assertEqual(downloaded_pages[0].revision_id, 200)
+            self.assertEqual(page_cache.get("平均寿命").data, StubWikipediaApi.pages["平均寿命"])
+
+            cached_pages = download_wikipedia_pages_concurrently(["平均寿命", "平均寿命"], api_url=self.api_url,
+                                                                 page_cache=page_cache)
+
+            self.assertEqual([page.data for page in cached_pages], [StubWikipediaApi.pages["平均寿命"]] * 2)
+            self.assertEqual(StubWikipediaApi.requested_titles, ["平均寿命"])
+
+    def test_page_cache_revalidates_stale_pages(self):
+        with TemporaryDirectory() as cache_path:
+            page_cache = PageCache(path=cache_path, ttl_seconds=60)
+            page_cache.put(DownloadedData(title="平均寿命", data="古い本文", revision_id=200, fetched_at=0.0))
+            page_cache.put(DownloadedData(title="リーマン・ショック", data="古い本文", revision_id=99, fetched_at=0.0))
+
+            downloaded_pages = download_wikipedia_pages_concurrently(["平均寿命", "リーマン・ショック"],
+                                                                     api_url=self.api_url, page_cache=page_cache)
 
-        self.assertTrue(is_file(output_json_file_name))
\ No newline at end of file
+            # The revision of 平均寿命 is the same, so only リーマン・ショック is downloaded again
+            self.assertEqual([page.data for page in downloaded_pages],
+                             ["古い本文", StubWikipediaApi.pages["リーマン・ショック"]])
+            self.assertEqual(StubWikipediaApi.requested_properties, ["info", "extracts|info"])
+            self.assertTrue(page_cache.is_fresh(page_cache.get("平均寿命")))
+            self.assertEqual(page_cache.get("リーマン・ショック").revision_id, 100)
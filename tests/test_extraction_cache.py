@@ -0,0 +1,104 @@
+# Tests /src/extractor/models/ExtractionCache
+
+import unittest
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from src.extractor.combined_extractor import extract_all, EXTRACTOR_VERSIONS
+from src.extractor.models.ExtractionCache import ExtractionCache
+
+
+class TestExtractionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+
+    def extract_numbers(self, target_string: str):
+        self.calls.append(target_string)
+        return [((index, index + 1), {"number": int(character)})
+                for index, character in enumerate(target_string) if character.isdigit()]
+
+    def test_result_is_cached(self):
+        cache = ExtractionCache()
+
+        first_result = cache.extract(kind="number", version="1", target_string="a1b2",
+                                     extract_function=self.extract_numbers)
+        first_result[0][1]["number"] = 100  # Changing a result does not change the cached result
+        second_result = cache.extract(kind="number", version="1", target_string="a1b2",
+                                      extract_function=self.extract_numbers)
+
+        self.assertEqual(second_result, [((1, 2), {"number": 1}), ((3, 4), {"number": 2})])
+        self.assertEqual(self.calls, ["a1b2"])
+        cache_info = cache.cache_info()
+        self.assertEqual((cache_info.hits, cache_info.misses, cache_info.currsize), (1, 1, 1))
+        self.assertEqual(cache_info.hit_rate, 0.5)
+
+    def test_new_version_replaces_result(self):
+        cache = ExtractionCache()
+
+        for version in ["1", "2", "2"]:
+            cache.extract(kind="number", version=version, target_string="1", extract_function=self.extract_numbers)
+
+        self.assertEqual(len(self.calls), 2)
+        cache_info = cache.cache_info()
+        self.assertEqual((cache_info.hits, cache_info.misses, cache_info.invalidations), (1, 2, 1))
+        self.assertEqual(cache_info.currsize, 1)
+
+    def test_least_recently_used_is_evicted(self):
+        cache = ExtractionCache(maxsize=2)
+
+        for target_string in ["1", "2", "1", "3", "1", "2"]:
+            cache.extract(kind="number", version="1", target_string=target_string,
+                          extract_function=self.extract_numbers)
+
+        self.assertEqual(self.calls, ["1", "2", "3", "2"])
+        self.assertEqual(cache.cache_info().currsize, 2)
+
+    def test_results_stored_on_disk(self):
+        with TemporaryDirectory() as directory:
+            path = join(directory, "cache.sqlite")
+            with ExtractionCache(path=path) as cache:
+                cache.extract(kind="number", version="1", target_string="12", extract_function=self.extract_numbers)
+
+            with ExtractionCache(path=path) as cache:
+                result = cache.extract(kind="number", version="1", target_string="12",
+                                       extract_function=self.extract_numbers)
+                cache.extract(kind="number", version="2", target_string="12", extract_function=self.extract_numbers)
+                cache_info = cache.cache_info()
+
+            self.assertEqual(result, [((0, 1), {"number": 1}), ((1, 2), {"number": 2})])
+            self.assertEqual(len(self.calls), 2)
+            self.assertEqual((cache_info.hits, cache_info.disk_hits, cache_info.invalidations), (1, 1, 1))
+
+    def test_clear(self):
+        cache = ExtractionCache()
+        cache.extract(kind="number", version="1", target_string="1", extract_function=self.extract_numbers)
+
+        cache.clear()
+        cache.extract(kind="number", version="1", target_string="1", extract_function=self.extract_numbers)
+
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(cache.cache_info().misses, 1)
+
+    def test_extract_all_with_cache(self):
+        target_string = "平成三一年四月三日の午後3時15分に〒012-2321で"
+        cache = ExtractionCache()
+
+        for _ in range(2):
+            self.assertEqual(extract_all(target_string=target_string, cache=cache),
+                             extract_all(target_string=target_string))
+
+        cache_info = cache.cache_info()
+        self.assertEqual((cache_info.hits, cache_info.misses), (6, 6))
+
+    def test_extract_all_new_extractor_version(self):
+        target_string = "会費は３,000円"
+        cache = ExtractionCache()
+        extract_all(target_string=target_string, kinds=["currency_amount", "age"], cache=cache)
+
+        with patch.dict(EXTRACTOR_VERSIONS, {"currency_amount": EXTRACTOR_VERSIONS["currency_amount"] + 1}):
+            extract_all(target_string=target_string, kinds=["currency_amount", "age"], cache=cache)
+
+        cache_info = cache.cache_info()
+        self.assertEqual((cache_info.hits, cache_info.misses, cache_info.invalidations), (1, 3, 1))
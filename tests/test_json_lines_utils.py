@@ -0,0 +1,68 @@
+# Tests /src/utils/json_lines_utils
+
+import unittest
+from io import StringIO
+from os.path import join
+from tempfile import TemporaryDirectory
+
+from src.downloader.models.DownloadedData import DownloadedData
+from src.extractor.combined_extractor import extract_all
+from src.utils.json_lines_utils import append_documents, iter_documents, append_extracted_documents, \
+    iter_extracted_documents, encode_extracted_document, decode_extracted_document, write_documents, read_documents
+
+
+class TestJsonLinesUtils(unittest.TestCase):
+    text = "2019年4月1日の午後3時、〒012-2321の事務所（電話03-1234-5678）で、39歳の社員に100万円を支払った。昨日も。"
+
+    def test_extracted_document_round_trip(self):
+        extracted_document = extract_all(target_string=self.text)
+        self.assertTrue(all(extracted_document.values()))
+
+        title, decoded_document = decode_extracted_document(encode_extracted_document("ページ", extracted_document))
+
+        self.assertEqual(title, "ページ")
+        self.assertEqual(decoded_document, extracted_document)
+
+    def test_postal_code_keeps_leading_zeros(self):
+        extracted_document = extract_all(target_string="〒012-0304", kinds=["postal_code"])
+
+        _, decoded_document = decode_extracted_document(encode_extracted_document(1, extracted_document))
+
+        postal_code = decoded_document["postal_code"][0][1]["postal_code_value"]
+        self.assertEqual((postal_code.prefecture_id, postal_code.city_id, postal_code.neighborhood_id,
+                          postal_code.street_id), (1, 2, 3, 4))
+
+    def test_append_and_read(self):
+        with TemporaryDirectory() as path:
+            documents = [DownloadedData(title="ページ1", data=self.text, revision_id=1, fetched_at=1556323200.0),
+                         DownloadedData(title="ページ2", data="")]
+            self.assertEqual(append_documents(documents[:1], path, "pages.jsonl"), 1)
+            self.assertEqual(append_documents(documents[1:], path, "pages.jsonl"), 1)
+
+            self.assertEqual([vars(document) for document in iter_documents(path, "pages.jsonl")],
+                             [vars(document) for document in documents])
+
+            extracted_documents = [(document.title, extract_all(target_string=document.data))
+                                   for document in documents]
+            append_extracted_documents(extracted_documents[:1], path, "extracted.jsonl")
+            append_extracted_documents(extracted_documents[1:], path, "extracted.jsonl")
+
+            self.assertEqual(list(iter_extracted_documents(path, "extracted.jsonl")), extracted_documents)
+
+    def test_wrong_format(self):
+        with TemporaryDirectory() as path:
+            append_documents([DownloadedData(title="ページ", data=self.text)], path, "pages.jsonl")
+
+            with self.assertRaises(ValueError):
+                list(iter_extracted_documents(path, "pages.jsonl"))
+            with self.assertRaises(ValueError):
+                append_extracted_documents([("ページ", {})], path, "pages.jsonl")
+            with open(join(path, "pages.jsonl"), encoding="utf-8") as pages_file:
+                self.assertEqual(len(pages_file.readlines()), 2)
+
+    def test_write_and_read_text_file(self):
+        output = StringIO()
+        write_documents([DownloadedData(title="ページ", data=self.text)], output=output)
+
+        output.seek(0)
+        self.assertEqual([document.title for document in read_documents(output)], ["ページ"])
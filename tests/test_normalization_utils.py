@@ -0,0 +1,53 @@
+# Tests /src/utils/normalization_utils
+
+import unittest
+
+import regex
+
+from src.utils.normalization_utils import normalize_text
+
+
+class TestNormalizeText(unittest.TestCase):
+
+    def test_normalize_full_width(self):
+        normalized_text = normalize_text("電話：０３ー１２３４　５６７８")
+
+        self.assertEqual(normalized_text.text, "電話:03ー1234 5678")
+        self.assertEqual(normalized_text.original_span((3, 5)), (3, 5))
+
+    def test_normalize_kanji_digits(self):
+        normalized_text = normalize_text("平成三一年四月三日", kanji_digits=True)
+
+        self.assertEqual(normalized_text.text, "平成31年4月3日")
+
+    def test_normalize_all(self):
+        original_text = "〒一〇一‐〇〇四七、電話 ０３-１２３４-５６７８"
+        normalized_text = normalize_text(original_text, kanji_digits=True, remove_separators=True)
+
+        self.assertEqual(normalized_text.text, "〒1010047、電話0312345678")
+        self.assertEqual(normalized_text.original_span((1, 8)), (1, 9))
+        self.assertEqual(normalized_text.original_span((11, 21)), (13, 25))
+        self.assertEqual(original_text[slice(*normalized_text.original_span((11, 21)))], "０３-１２３４-５６７８")
+        for position, character in enumerate(normalized_text.text):
+            if not character.isdigit():
+                self.assertEqual(original_text[normalized_text.original_position(position)], character)
+
+    def test_restore_spans(self):
+        original_text = "番号は０３-１２３４-５６７８と0120 123 456です"
+        normalized_text = normalize_text(original_text, remove_separators=True)
+        extracted_list = [(match.span(), {"number": match.group()})
+                          for match in regex.finditer(r"\d{9,10}", normalized_text.text)]
+
+        restored_list = normalized_text.restore_spans(extracted_list)
+
+        self.assertEqual([original_text[start:end] for (start, end), _ in restored_list],
+                         ["０３-１２３４-５６７８", "0120 123 456"])
+        self.assertEqual([extracted_data for _, extracted_data in restored_list],
+                         [{"number": "0312345678"}, {"number": "0120123456"}])
+
+    def test_nothing_to_normalize(self):
+        normalized_text = normalize_text("", kanji_digits=True, remove_separators=True)
+
+        self.assertEqual(normalized_text.text, "")
+        self.assertEqual(normalized_text.original_span((0, 0)), (0, 0))
+
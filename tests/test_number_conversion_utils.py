@@ -5,7 +5,8 @@ from typing import Dict, List, Callable, Any
 
 from src.utils.number_conversion_utils import parse_single_char_digit_as_number, \
     string_number_below_ten_thousand_to_value, traditional_style_kanji_to_value, western_style_kanji_to_value, \
-    clean_mixed_number_to_value, dirty_mixed_number_to_value
+    clean_mixed_number_to_value, dirty_mixed_number_to_value, number_conversion_cache_info, \
+    clear_number_conversion_cache, integer_string_to_value, batch_mixed_numbers_to_values
 
 HALF2FULL = dict((i, i + 0xFEE0) for i in range(0x21, 0x7F))
 HALF2FULL[0x20] = 0x3000
@@ -202,6 +203,22 @@ class TestNumberConvertionUtils(unittest.TestCase):
             verify_function=western_style_kanji_to_value
         )
 
+    def test_integer_string_to_value(self):
+        correct_integer_strings_and_values = {
+            "0": 0,
+            "2019": 2019,
+            "２０１９": 2019,
+            "٢٠١٩": 2019,
+            " 42 ": 42,
+            "+7": 7,
+            "-48": -48
+        }
+
+        for integer_string, expectation in correct_integer_strings_and_values.items():
+            self.assertEqual(integer_string_to_value(integer_string), expectation)
+        for not_an_integer in ["", " ", "-", "二〇一九", "2019年", "1-2"]:
+            self.assertIsNone(integer_string_to_value(not_an_integer), not_an_integer)
+
     def test_clean_mixed_number_to_value(self):
         correct_clean_mixed_numbers_and_values = {
             "一九九九": 1999,
@@ -259,3 +276,44 @@ class TestNumberConvertionUtils(unittest.TestCase):
             invalid_numbers=incorrect_dirty_mixed_numbers,
             verify_function=dirty_mixed_number_to_value
         )
+
+    def test_number_conversion_cache(self):
+        clear_number_conversion_cache()
+
+        for _ in range(3):
+            self.assertEqual(dirty_mixed_number_to_value("二〇一九年"), 2019)
+        with self.assertRaises(ValueError):
+            dirty_mixed_number_to_value("ゼロ")
+
+        cache_info = number_conversion_cache_info()["dirty_mixed_number_to_value"]
+        self.assertEqual(cache_info.hits, 2, f"Unexpected cache statistics: {cache_info}")
+        self.assertEqual(cache_info.misses, 2, f"Unexpected cache statistics: {cache_info}")
+        self.assertEqual(cache_info.currsize, 1, f"Failed conversions should not be cached: {cache_info}")
+
+        clear_number_conversion_cache()
+        self.assertEqual(number_conversion_cache_info()["dirty_mixed_number_to_value"].currsize, 0)
+
+    def test_batch_mixed_numbers_to_values(self):
+        mixed_strings = ["2019", "２,000億５万五百二十七", "ゼロ", "二〇一九年", "2019", "", "九九九九九京", "１２"]
+
+        result = batch_mixed_numbers_to_values(mixed_strings)
+
+        self.assertEqual(result.values.tolist(), [2019, 200000050527, 0, 2019, 2019, 0, 0, 12])
+        self.assertEqual(result.errors.tolist(), [0, 0, 1, 0, 0, 1, 1, 0])
+        for mixed_string, value, error in zip(mixed_strings, result.values, result.errors):
+            if not error:
+                self.assertEqual(value, dirty_mixed_number_to_value(mixed_string))
+
+    def test_batch_mixed_numbers_to_values_invalid(self):
+        mixed_strings = ["２６三²〇京", None, "12", "²", None, 12]
+
+        result = batch_mixed_numbers_to_values(mixed_strings)
+
+        self.assertEqual(result.values.tolist(), [0, 0, 12, 0, 0, 0])
+        self.assertEqual(result.errors.tolist(), [1, 1, 0, 1, 1, 1])
+
+    def test_batch_mixed_numbers_to_values_empty(self):
+        result = batch_mixed_numbers_to_values(iter([]))
+
+        self.assertEqual(len(result.values), 0)
+        self.assertEqual(len(result.errors), 0)
@@ -7,17 +7,46 @@ from src.extractor.phone_number_extractor import extract_all_phone_numbers
 
 class TestExtract(unittest.TestCase):
     def test_extract_single_phone_number_western_numbers(self):
-        string_containing_phone_number = "今の電話番号が「008170-1234-5678」です。"
+        string_containing_phone_number = "今の電話番号が「+8170-1234-5678」です。"
         extracted_data = extract_all_phone_numbers(target_string=string_containing_phone_number)
 
-        expected_extraction = [((9, 18),
+        expected_extraction = [((8, 23),
                                 {
-                                    "phone_number_string": "008170-1234-5678",
-                                    "phone_number_value": "00817012345678"
+                                    "phone_number_string": "+8170-1234-5678",
+                                    "phone_number_value": "+817012345678"
                                 })]
 
         self.assertEqual(extracted_data, expected_extraction,
                          f"Result {extracted_data} is not the same as expectation {expected_extraction}")
+
+    def test_extract_multiple_phone_numbers_mixed_numbers(self):
+        string_containing_phone_numbers = "本社は(03)1234-5678、窓口は０１２０-１２３-４５６、携帯は090 1234 5678です。"
+        extracted_data = extract_all_phone_numbers(target_string=string_containing_phone_numbers)
+
+        expected_extraction = [((3, 16),
+                                {
+                                    "phone_number_string": "(03)1234-5678",
+                                    "phone_number_value": "0312345678"
+                                }),
+                               ((20, 32),
+                                {
+                                    "phone_number_string": "０１２０-１２３-４５６",
+                                    "phone_number_value": "0120123456"
+                                }),
+                               ((36, 49),
+                                {
+                                    "phone_number_string": "090 1234 5678",
+                                    "phone_number_value": "09012345678"
+                                })]
+
+        self.assertEqual(extracted_data, expected_extraction,
+                         f"Result {extracted_data} is not the same as expectation {expected_extraction}")
+
+    def test_longer_digit_sequences_are_not_extracted(self):
+        extracted_data = extract_all_phone_numbers(target_string="注文番号は1031234567890です。")
+
+        self.assertEqual(extracted_data, [])
+
     # TODO: Not supported yet
     # def test_extract_single_phone_number_kanji_numbers(self):
     #     string_containing_phone_number = "今の郵便コードが一〇一の二四一二です。"
@@ -3,7 +3,8 @@
 import unittest
 
 from src.extractor.models.PostalCode import PostalCode
-from src.extractor.postal_code_extractor import extract_all_postal_codes
+from src.extractor.models.ExtractedMatch import PostalCodeMatch, to_extracted_list
+from src.extractor.postal_code_extractor import extract_all_postal_codes, extract_all_postal_code_matches
 
 
 class TestExtract(unittest.TestCase):
@@ -56,3 +57,15 @@ class TestExtract(unittest.TestCase):
 
         self.assertEqual(extracted_data, expected_extraction,
                          f"Result {extracted_data} is not the same as expectation {expected_extraction}")
+
+    def test_extract_all_postal_code_matches(self):
+        string_containing_postal_codes = "前の所はT３３３ー３２３２だったし、実家は〒444-1212だった。"
+        extracted_matches = extract_all_postal_code_matches(target_string=string_containing_postal_codes)
+
+        expected_matches = [PostalCodeMatch((4, 13), "T３３３ー３２３２", PostalCode("3333232")),
+                            PostalCodeMatch((21, 30), "〒444-1212", PostalCode("4441212"))]
+
+        self.assertEqual(extracted_matches, expected_matches,
+                         f"Result {extracted_matches} is not the same as expectation {expected_matches}")
+        self.assertEqual(to_extracted_list(extracted_matches),
+                         extract_all_postal_codes(target_string=string_containing_postal_codes))
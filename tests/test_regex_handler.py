@@ -0,0 +1,108 @@
+# Tests /src/extractor/models/RegexHandler
+
+import unittest
+from io import StringIO
+
+import regex
+
+from src.extractor.models.RegexHandler import RegexHandler
+from src.extractor.models.TextEdit import TextEdit
+
+
+class TestRegexHandler(unittest.TestCase):
+    handler = RegexHandler(compiled_regex=regex.compile(r"(?P<number>\d+)"),
+                           regex_identifiers={"number": int})
+
+    def test_search_string_reused_between_calls(self):
+        self.assertEqual(self.handler.search_string(target_string="1と22"),
+                         [((0, 1), {"number": 1}), ((2, 4), {"number": 22})])
+        self.assertEqual(self.handler.search_string(target_string="333"), [((0, 3), {"number": 333})])
+
+    def test_handler_is_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.handler.compiled_regex = None
+        with self.assertRaises(AttributeError):
+            self.handler.loaded_string = ""
+        with self.assertRaises(TypeError):
+            self.handler.regex_identifiers["number"] = str
+
+    def test_empty_regex(self):
+        with self.assertRaises(ValueError):
+            RegexHandler(compiled_regex=None, regex_identifiers={})
+
+    def test_anchor_requires_max_match_length(self):
+        with self.assertRaises(ValueError):
+            RegexHandler(compiled_regex=regex.compile(r"(?P<number>\d+)"), regex_identifiers={"number": int},
+                         anchor_regex=regex.compile(r"\d"))
+
+    def test_search_around_anchors_same_as_full_search(self):
+        # Years are only matched when followed by 年 and not preceded by a digit, the anchor is the 年
+        compiled_regex = regex.compile(r"(?<!\d)(?P<year>\d{1,4})(?=年)")
+        anchored_handler = RegexHandler(compiled_regex=compiled_regex, regex_identifiers={"year": int},
+                                        anchor_regex=regex.compile(r"年"), max_match_length=5)
+        target_strings = ["", "年", "2019年", "12345年と1年", "あ" * 20 + "99年" + "い" * 20 + "2000年",
+                          "1年2年3年", "年" * 3 + "1" * 10 + "年"]
+
+        for target_string in target_strings:
+            expected_extraction = [match.span() for match in compiled_regex.finditer(target_string)]
+            extracted_data = [match.span() for match in anchored_handler.finditer(target_string)]
+            self.assertEqual(extracted_data, expected_extraction,
+                             f"Result {extracted_data} is not the same as expectation {expected_extraction}")
+
+    def test_search_edited_string_same_as_full_search(self):
+        compiled_regex = regex.compile(r"(?<!\d)(?P<year>\d{1,4})(?=年)")
+        edited_handler = RegexHandler(compiled_regex=compiled_regex, regex_identifiers={"year": int},
+                                      max_match_length=6)
+        previous_string = "2019年と2020年" + "あ" * 100 + "1年と22年" + "い" * 100 + "333年"
+        previous_extracted_list = edited_handler.search_string(target_string=previous_string)
+        edits = [
+            TextEdit(offset=4, deleted_length=1, inserted_text=""),  # Removes the first 年
+            TextEdit(offset=previous_string.index("1年") + 1, deleted_length=0, inserted_text="0"),  # 1年 becomes 10年
+            TextEdit(offset=50, deleted_length=0, inserted_text="1999年"),
+            TextEdit(offset=0, deleted_length=len(previous_string), inserted_text="4年"),
+            TextEdit(offset=len(previous_string), deleted_length=0, inserted_text="年")
+        ]
+
+        for edit in edits:
+            self.assertEqual(edited_handler.search_edited_string(previous_extracted_list=previous_extracted_list,
+                                                                 previous_string=previous_string, edit=edit),
+                             edited_handler.search_string(target_string=edit.apply(previous_string)),
+                             f"Searching again after {edit} is not the same as searching the edited string")
+
+    def test_search_edited_string_without_max_match_length(self):
+        edit = TextEdit(offset=1, deleted_length=1, inserted_text="5")
+
+        self.assertEqual(self.handler.search_edited_string(previous_extracted_list=[((0, 3), {"number": 123})],
+                                                           previous_string="123", edit=edit),
+                         [((0, 3), {"number": 153})])
+
+    def test_edit_outside_of_string(self):
+        with self.assertRaises(ValueError):
+            TextEdit(offset=2, deleted_length=2, inserted_text="").apply("123")
+
+    def test_iter_search_chunks_same_as_search_string(self):
+        target_string = "1と22、そして333と4444" * 10
+        expected_extraction = self.handler.search_string(target_string=target_string)
+
+        for chunk_size in [1, 2, 5, 100]:
+            chunks = [target_string[index:index + chunk_size] for index in range(0, len(target_string), chunk_size)]
+            extracted_data = list(self.handler.iter_search(stream=chunks, overlap=8))
+            self.assertEqual(extracted_data, expected_extraction,
+                             f"Result {extracted_data} is not the same as expectation {expected_extraction}")
+
+    def test_iter_search_file_object(self):
+        target_string = "一行目は12\n二行目は345\n"
+        extracted_data = list(self.handler.iter_search(stream=StringIO(target_string), chunk_size=4, overlap=4))
+
+        self.assertEqual(extracted_data, [((4, 6), {"number": 12}), ((11, 14), {"number": 345})])
+
+    def test_iter_search_is_lazy(self):
+        def chunks():
+            yield "12と"
+            yield "34と" + " " * 20
+            raise AssertionError("The stream was read further than needed")
+
+        extracted_data = self.handler.iter_search(stream=chunks(), overlap=8)
+
+        self.assertEqual(next(extracted_data), ((0, 2), {"number": 12}))
+        self.assertEqual(next(extracted_data), ((3, 5), {"number": 34}))
@@ -0,0 +1,66 @@
+# Tests /src/utils/regex_utils and /src/extractor/models/LazyRegex
+
+import unittest
+from os import listdir
+from os.path import join
+from tempfile import TemporaryDirectory
+
+import regex
+
+from src.extractor.models.LazyRegex import LazyRegex
+from src.utils.regex_utils import compile_regex, compiled_regex_cache_key, set_compiled_regex_cache_path
+
+
+class TestRegexUtils(unittest.TestCase):
+
+    def tearDown(self):
+        set_compiled_regex_cache_path(None)
+
+    def test_compile_regex_with_cache(self):
+        with TemporaryDirectory() as cache_path:
+            set_compiled_regex_cache_path(cache_path)
+            compiled_regex = compile_regex(r"\L<suffix>", {"suffix": ["歳", "才"]})
+            self.assertEqual(len(listdir(cache_path)), 1)
+
+            cached_regex = compile_regex(r"\L<suffix>", {"suffix": ["歳", "才"]})
+            self.assertEqual(len(listdir(cache_path)), 1)
+            self.assertEqual(cached_regex.pattern, compiled_regex.pattern)
+            self.assertEqual(cached_regex.findall("5歳と6才"), ["歳", "才"])
+
+    def test_compile_regex_with_broken_cache_file(self):
+        with TemporaryDirectory() as cache_path:
+            set_compiled_regex_cache_path(cache_path)
+            compile_regex(r"\L<suffix>", {"suffix": ["歳"]})
+            cache_file_name = listdir(cache_path)[0]
+            with open(join(cache_path, cache_file_name), "wb") as cache_file:
+                cache_file.write(b"broken")
+
+            self.assertEqual(compile_regex(r"\L<suffix>", {"suffix": ["歳"]}).findall("5歳"), ["歳"])
+
+    def test_cache_key_depends_on_regex_and_named_lists(self):
+        key = compiled_regex_cache_key(r"\L<suffix>", {"suffix": ["歳", "才"]})
+
+        self.assertEqual(key, compiled_regex_cache_key(r"\L<suffix>", {"suffix": ["才", "歳"]}))
+        self.assertNotEqual(key, compiled_regex_cache_key(r"\L<suffix>", {"suffix": ["歳"]}))
+        self.assertNotEqual(key, compiled_regex_cache_key(r"(\L<suffix>)", {"suffix": ["歳", "才"]}))
+
+    def test_lazy_regex_compiled_on_first_use(self):
+        lazy_regex = LazyRegex("age.regexp", kanji_0=["〇"])
+
+        self.assertFalse(lazy_regex.is_compiled)
+        with self.assertRaises(regex.error):
+            lazy_regex.finditer("")  # The other named lists are missing, which is only noticed on first use
+        self.assertFalse(lazy_regex.is_compiled)
+
+        lazy_regex = LazyRegex("postal_code.regexp", seperator_postal_code=["-"], prefix_postal_code=["〒"],
+                               seperator_space=[" "], kanji_0to9=["〇"], separator_postal_code_kanji=["の"])
+        self.assertEqual([match.group() for match in lazy_regex.finditer("〒123-4567")], ["〒123-4567"])
+        self.assertTrue(lazy_regex.is_compiled)
+
+    def test_lazy_regex_version(self):
+        lazy_regex = LazyRegex("age.regexp", suffix_age=["歳"])
+
+        self.assertEqual(lazy_regex.version, LazyRegex("age.regexp", suffix_age=["歳"]).version)
+        self.assertNotEqual(lazy_regex.version, LazyRegex("age.regexp", suffix_age=["歳", "才"]).version)
+        self.assertNotEqual(lazy_regex.version, LazyRegex("time.regexp", suffix_age=["歳"]).version)
+        self.assertFalse(lazy_regex.is_compiled)
@@ -0,0 +1,77 @@
+# Tests /src/downloader/wikipedia_dump/wikipedia_dump_reader and /src/utils/wiki_markup_utils
+
+import bz2
+import os
+import unittest
+from tempfile import TemporaryDirectory
+
+from src.downloader.wikipedia_dump.wikipedia_dump_reader import iter_wikipedia_dump_pages
+from src.extractor.combined_extractor import extract_all
+from src.pipeline.wikipedia_pipeline import iter_extract_wikipedia_dump_pages
+from src.utils.wiki_markup_utils import strip_wiki_markup
+
+FIXTURE_DUMP = os.path.join(os.path.dirname(__file__), "test_data", "jawiki-test-pages-articles.xml.bz2")
+
+
+class TestWikipediaDumpReader(unittest.TestCase):
+
+    def test_read_articles(self):
+        pages = list(iter_wikipedia_dump_pages(FIXTURE_DUMP))
+
+        self.assertEqual([page.title for page in pages], ["株式会社テスト", "田中太郎"])
+        self.assertEqual([page.revision_id for page in pages], [72451001, 72451004])
+        self.assertTrue(pages[0].data.startswith("{{Infobox 会社"))
+        self.assertIn('<ref name="公式">', pages[0].data)
+
+    def test_read_all_pages(self):
+        pages = list(iter_wikipedia_dump_pages(FIXTURE_DUMP, namespaces=None, include_redirects=True))
+
+        self.assertEqual([page.title for page in pages], ["株式会社テスト", "テスト株式会社", "Wikipedia:テスト", "田中太郎"])
+
+    def test_read_selected_titles(self):
+        pages = list(iter_wikipedia_dump_pages(FIXTURE_DUMP, titles=["田中太郎", "存在しないページ"]))
+
+        self.assertEqual([page.title for page in pages], ["田中太郎"])
+
+    def test_read_uncompressed_dump(self):
+        with TemporaryDirectory() as directory:
+            dump_path = os.path.join(directory, "jawiki-test-pages-articles.xml")
+            with bz2.open(FIXTURE_DUMP, "rb") as compressed_dump, open(dump_path, "wb") as dump:
+                dump.write(compressed_dump.read())
+
+            pages = list(iter_wikipedia_dump_pages(dump_path, strip_markup=True))
+
+        self.assertEqual([page.data for page in pages],
+                         [page.data for page in iter_wikipedia_dump_pages(FIXTURE_DUMP, strip_markup=True)])
+
+    def test_strip_markup(self):
+        page = next(iter_wikipedia_dump_pages(FIXTURE_DUMP, strip_markup=True))
+
+        self.assertEqual(page.data, "株式会社テスト（かぶしきがいしゃテスト）は、東京都千代田に本社を置く会社。\n\n"
+                                    "沿革\n"
+                                    "2019年4月1日 - 設立。\n"
+                                    "2019年4月15日午後3時 - 本社を〒100-0001に移転。\n\n"
+                                    "連絡先\n"
+                                    "電話番号は03-1234-5678。公式サイト")
+
+    def test_extract_dump(self):
+        extracted_pages = dict(iter_extract_wikipedia_dump_pages(FIXTURE_DUMP, extract_workers=1))
+
+        self.assertEqual(extracted_pages, {page.title: extract_all(target_string=page.data)
+                                           for page in iter_wikipedia_dump_pages(FIXTURE_DUMP, strip_markup=True)})
+        self.assertEqual([data["postal_code_string"] for _, data in extracted_pages["株式会社テスト"]["postal_code"]],
+                         ["〒100-0001"])
+
+
+class TestStripWikiMarkup(unittest.TestCase):
+
+    def test_links(self):
+        self.assertEqual(strip_wiki_markup("[[東京都]]の[[千代田区|千代田]]、[https://example.com 公式] [//example.com]"),
+                         "東京都の千代田、公式")
+
+    def test_nested_markup(self):
+        self.assertEqual(strip_wiki_markup("{{a|{{b|c}}}}本文[[File:a.jpg|thumb|[[b]]の写真]]{|\n|{|\n|x\n|}\n|}"),
+                         "本文")
+
+    def test_entities(self):
+        self.assertEqual(strip_wiki_markup("1&nbsp;000円&amp;"), "1\xa0000円&")
@@ -0,0 +1,72 @@
+# Tests /src/pipeline/wikipedia_pipeline
+
+import json
+import unittest
+from io import StringIO
+from threading import Lock
+
+from src.downloader.models.Transport import Transport
+from src.extractor.combined_extractor import extract_all
+from src.exceptions.downloader_exceptions import TransportError
+from src.pipeline.wikipedia_pipeline import iter_extract_wikipedia_pages, write_extracted_pages
+from src.utils.json_lines_utils import read_extracted_documents
+
+
+class StaticWikipediaTransport(Transport):
+    """
+    Answers like the MediaWiki API with the pages in the dictionary, and counts the requests
+    """
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = 0
+        self._lock = Lock()
+
+    def get_json(self, url, parameters):
+        with self._lock:
+            self.requests = self.requests + 1
+        title = parameters["titles"]
+        if title == "接続エラー":
+            raise TransportError(url=url, reason="Connection refused", retryable=False)
+        if title not in self.pages:
+            return {"query": {"pages": [{"title": title, "missing": True}]}}
+        return {"query": {"pages": [{"title": title, "extract": self.pages[title], "lastrevid": 1}]}}
+
+
+class TestWikipediaPipeline(unittest.TestCase):
+    pages = {f"ページ{index}": f"第{index}回の会議は2019年4月{index}日の午後3時から、〒012-2321の事務所で。"
+             for index in range(1, 21)}
+
+    def test_extract_all_pages(self):
+        transport = StaticWikipediaTransport(self.pages)
+
+        extracted_pages = dict(iter_extract_wikipedia_pages(list(self.pages) + ["存在しないページ"],
+                                                            extract_workers=1, queue_size=2, transport=transport))
+
+        self.assertEqual(extracted_pages, {title: extract_all(target_string=page)
+                                           for title, page in self.pages.items()})
+        self.assertEqual(transport.requests, 21)
+
+    def test_selected_extractors(self):
+        extracted_pages = list(iter_extract_wikipedia_pages(["ページ1"], extractors=["postal_code"], extract_workers=1,
+                                                            transport=StaticWikipediaTransport(self.pages)))
+
+        self.assertEqual(extracted_pages, [("ページ1", extract_all(target_string=self.pages["ページ1"],
+                                                                  kinds=["postal_code"]))])
+
+    def test_download_error(self):
+        with self.assertRaises(TransportError):
+            list(iter_extract_wikipedia_pages(["ページ1", "接続エラー"], extract_workers=1,
+                                              transport=StaticWikipediaTransport(self.pages)))
+
+    def test_write_extracted_pages(self):
+        output = StringIO()
+        extracted_pages = [(title, extract_all(target_string=page)) for title, page in self.pages.items()]
+
+        number_of_pages = write_extracted_pages(extracted_pages, output=output)
+
+        lines = output.getvalue().splitlines()
+        self.assertEqual(number_of_pages, len(self.pages))
+        self.assertEqual(len(lines), len(self.pages) + 1)
+        self.assertEqual(json.loads(lines[1])["title"], "ページ1")
+        self.assertEqual(list(read_extracted_documents(StringIO(output.getvalue()))), extracted_pages)